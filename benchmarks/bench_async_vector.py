@@ -0,0 +1,73 @@
+"""Scaling benchmark: GridAdventureAsyncVectorEnv over worker counts.
+
+Image observations are written to shared memory by the workers, so the
+benefit of more workers grows with ``render_resolution``.
+
+Usage:
+    python benchmarks/bench_async_vector.py [--num-envs N] [--steps S]
+        [--workers 1 2 4] [--resolutions 128 256 512]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from grid_adventure.levels import intro
+from grid_adventure.vector import GridAdventureAsyncVectorEnv, GridAdventureVectorEnv
+
+_LEVELS = [
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+]
+
+
+def _throughput(envs: object, steps: int, actions: np.ndarray) -> float:
+    envs.reset(seed=0)  # type: ignore[attr-defined]
+    start = time.perf_counter()
+    for t in range(steps):
+        envs.step(actions[t])  # type: ignore[attr-defined]
+    elapsed = time.perf_counter() - start
+    envs.close()  # type: ignore[attr-defined]
+    return actions.shape[1] * steps / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[128, 256, 512])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 7, size=(args.steps, args.num_envs))
+    builders = [_LEVELS[i % len(_LEVELS)] for i in range(args.num_envs)]
+    for resolution in args.resolutions:
+        kwargs = {"observation_type": "image", "render_resolution": resolution}
+        sync = _throughput(
+            GridAdventureVectorEnv.from_builders(builders, copy=False, **kwargs),
+            args.steps,
+            actions,
+        )
+        print(f"resolution {resolution:4d}  sync         : {sync:8.0f} steps/sec")
+        for workers in args.workers:
+            rate = _throughput(
+                GridAdventureAsyncVectorEnv.from_builders(
+                    builders, num_workers=workers, copy=False, **kwargs
+                ),
+                args.steps,
+                actions,
+            )
+            print(
+                f"resolution {resolution:4d}  {workers:2d} workers   : "
+                f"{rate:8.0f} steps/sec ({rate / sync:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Step throughput: reference step vs. the bitboard engine (single and batched).
+
+Also reports GridAdventureEnv steps/sec with step_backend="reference" and
+"bitboard" for the observation types given with --observation-types.
+
+Usage:
+    python benchmarks/bench_bitboard.py [--steps S] [--batch N]
+        [--observation-types tensor,gridstate]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+
+from grid_adventure import bitboard
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.step import step as adv_step
+
+
+def _env_steps_per_sec(
+    backend: str, observation_type: str, indices: np.ndarray
+) -> float:
+    env = GridAdventureEnv(
+        grid_state_fn_to_initial_state_fn(intro.build_level_key_door),
+        observation_type=observation_type,
+        step_backend=backend,
+        width=11,
+        height=9,
+    )
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for index in indices:
+        _, _, terminated, truncated, _ = env.step(int(index))
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    env.close()
+    return len(indices) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--observation-types", default="tensor,gridstate")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    indices = rng.integers(0, len(actions), size=(args.steps, args.batch))
+    initial = to_state(intro.build_level_key_door())
+
+    state = initial
+    start = time.perf_counter()
+    for t in range(args.steps):
+        state = adv_step(state, actions[indices[t, 0]])
+        if state.win or state.lose:
+            state = initial
+    reference = args.steps / (time.perf_counter() - start)
+
+    board = first = bitboard.from_state(initial)
+    start = time.perf_counter()
+    for t in range(args.steps):
+        board = bitboard.step(board, int(indices[t, 0]))
+        if (
+            board.agent[bitboard.AGENT_INDEX["win"]]
+            or board.agent[bitboard.AGENT_INDEX["lose"]]
+        ):
+            board = first
+    single = args.steps / (time.perf_counter() - start)
+
+    # Finished boards are left in place; they are skipped by the engine.
+    batch = bitboard.stack([first] * args.batch)
+    start = time.perf_counter()
+    for t in range(args.steps):
+        batch = bitboard.step_batch(batch, indices[t])
+    batched = args.steps * args.batch / (time.perf_counter() - start)
+
+    print(f"reference step  : {reference:10.0f} steps/sec")
+    print(f"bitboard single : {single:10.0f} steps/sec ({single / reference:.1f}x)")
+    print(
+        f"bitboard batch  : {batched:10.0f} steps/sec ({batched / reference:.1f}x, "
+        f"batch={args.batch})"
+    )
+
+    for observation_type in args.observation_types.split(","):
+        env_reference = _env_steps_per_sec("reference", observation_type, indices[:, 0])
+        env_bitboard = _env_steps_per_sec("bitboard", observation_type, indices[:, 0])
+        print(
+            f"env {observation_type:<10}: reference {env_reference:8.0f} steps/sec, "
+            f"bitboard {env_bitboard:8.0f} steps/sec "
+            f"({env_bitboard / env_reference:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
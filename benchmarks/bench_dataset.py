@@ -0,0 +1,80 @@
+"""Trajectory dataset write overhead and minibatch sampling.
+
+Steps a ``GridAdventureEnv`` with random actions with and without a
+``DatasetRecorder`` and reports steps/sec, the slowest step (a stall would
+show up here when a chunk is flushed) and the time to sample minibatches from
+the memory-mapped shards.
+
+Usage:
+    python benchmarks/bench_dataset.py [--steps N] [--observation-type tensor|image]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+import gymnasium
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+
+from grid_adventure.dataset import DatasetRecorder, TrajectoryDataset, TrajectoryWriter
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+
+
+def _run(env: gymnasium.Env, steps: int) -> tuple[float, float]:  # type: ignore[type-arg]
+    rng = np.random.default_rng(0)
+    actions = rng.integers(len(Action), size=steps)
+    env.reset(seed=0)
+    slowest = 0.0
+    start = time.perf_counter()
+    for action in actions:
+        before = time.perf_counter()
+        _, _, terminated, truncated, _ = env.step(int(action))
+        if terminated or truncated:
+            env.reset()
+        slowest = max(slowest, time.perf_counter() - before)
+    return steps / (time.perf_counter() - start), slowest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--observation-type", default="tensor")
+    args = parser.parse_args()
+
+    def make_env() -> GridAdventureEnv:
+        return GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(intro.build_level_boss),
+            observation_type=args.observation_type,
+            render_backend="tiles",
+        )
+
+    plain, plain_slowest = _run(make_env(), args.steps)
+    print(f"plain    {plain:8.0f} steps/s, slowest step {plain_slowest * 1e3:6.2f} ms")
+    with tempfile.TemporaryDirectory() as tmp:
+        with TrajectoryWriter(tmp, chunk_size=args.chunk_size) as writer:
+            recorder = DatasetRecorder(make_env(), writer)
+            recorded, slowest = _run(recorder, args.steps)
+            recorder.close()
+        print(f"recorded {recorded:8.0f} steps/s, slowest step {slowest * 1e3:6.2f} ms")
+
+        dataset = TrajectoryDataset(tmp)
+        rng = np.random.default_rng(0)
+        start = time.perf_counter()
+        for _ in range(20):
+            dataset.sample(args.batch_size, rng)
+        elapsed = (time.perf_counter() - start) / 20
+        print(
+            f"sample {args.batch_size} of {len(dataset)} transitions in "
+            f"{dataset.num_shards} shards: {elapsed * 1e3:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Memory-per-entity and construction-time benchmark for entity classes.
+
+Compares the regular entity classes with their slotted variants from
+``grid_adventure.entities.SLOTTED_ENTITY_TYPES``. The ``dict attrs`` column
+counts the attributes stored in an instance ``__dict__`` rather than in slots.
+
+Usage:
+    python benchmarks/bench_entities.py [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from grid_adventure.entities import SLOTTED_ENTITY_TYPES, FloorEntity, WallEntity
+
+
+def _bytes_per_instance(cls: type, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objs = [cls() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'class':<22}{'bytes/entity':>14}{'ns/construct':>14}{'dict attrs':>12}")
+    for cls in (FloorEntity, WallEntity):
+        for variant in (cls, SLOTTED_ENTITY_TYPES[cls]):
+            mem = _bytes_per_instance(variant, args.count)
+            seconds = timeit.timeit(variant, number=args.count)
+            dict_attrs = len(vars(variant()))
+            print(
+                f"{variant.__name__:<22}{mem:>14.1f}"
+                f"{seconds / args.count * 1e9:>14.1f}{dict_attrs:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark of ``EntityPool`` against fresh GridState conversion per step.
+
+Follows a random rollout on generated NxN maps and converts every State with
+``grid_adventure.grid.from_state`` and with one ``EntityPool``, reporting the
+time and the net allocated memory blocks per step.
+
+Usage:
+    python benchmarks/bench_entity_pool.py [--sizes 16 32 64] [--steps S]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+
+from grid_adventure import grid
+from grid_adventure.levels.procedural import GeneratorConfig, generate_level
+from grid_adventure.step import step
+
+
+def _rollout(state: State, steps: int) -> list[State]:
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    states = [state]
+    for _ in range(steps - 1):
+        state = step(states[-1], actions[int(rng.integers(len(actions)))])
+        states.append(states[0] if state.win or state.lose else state)
+    return states
+
+
+def _measure(
+    convert: Callable[[State], GridState], states: list[State]
+) -> tuple[float, float]:
+    """Microseconds and net allocated blocks per conversion (results kept alive)."""
+    kept = []
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for state in states:
+        kept.append(convert(state))
+    seconds = time.perf_counter() - start
+    blocks = sys.getallocatedblocks() - blocks
+    return seconds / len(states) * 1e6, blocks / len(states)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        config = GeneratorConfig(width=size, height=size, agent_health=1000)
+        states = _rollout(grid.to_state(generate_level(config, 0)), args.steps)
+        pool = grid.EntityPool()
+        for name, convert in (
+            ("from_state", grid.from_state),
+            ("pool", pool.from_state),
+        ):
+            us, blocks = _measure(convert, states)
+            print(
+                f"{size:>3}x{size:<3} {name:>10}: {us:10.1f} us {blocks:10.1f} blocks/step"
+            )
+        print(f"{'':>7} pool reuse rate: {pool.stats().reuse_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
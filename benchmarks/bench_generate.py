@@ -0,0 +1,48 @@
+"""Procedural level generation throughput as a function of map size.
+
+Usage:
+    python benchmarks/bench_generate.py [--count N] [--processes P] [--sizes 9 16 32 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from grid_adventure.levels.procedural import GeneratorConfig, generate_boards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 16, 32, 64])
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'1 process':>14} {f'{args.processes} processes':>16}")
+    for size in args.sizes:
+        config = GeneratorConfig(
+            width=size,
+            height=size,
+            gems=max(2, size // 8),
+            keys=max(1, size // 16),
+            doors=max(1, size // 16),
+            coins=size // 4,
+            lava=size // 4,
+            boxes=size // 8,
+            speed=1,
+            shield=1,
+            phasing=1,
+        )
+        rates = []
+        for processes in (1, args.processes):
+            start = time.perf_counter()
+            for _ in generate_boards(config, args.count, processes=processes):
+                pass
+            rates.append(args.count / (time.perf_counter() - start))
+        print(f"{size:>6} {rates[0]:>9.0f} lv/s {rates[1]:>11.0f} lv/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Per-call cost of canonical fingerprints on large maps.
+
+For each map size, a generated level is rolled out with random actions and
+every State (and its GridState) is fingerprinted cold (fresh
+``Fingerprinter``) and warm (one ``Fingerprinter`` following the trajectory).
+
+Usage:
+    python benchmarks/bench_hashing.py [--steps S] [--sizes 16 32 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from grid_universe.actions import Action
+
+from grid_adventure import bitboard, grid
+from grid_adventure.hashing import Fingerprinter
+from grid_adventure.levels.procedural import GeneratorConfig, generate_board
+from grid_adventure.step import step as adv_step
+
+
+def _per_call(fn: Callable[[Any], int], snapshots: list[Any]) -> float:
+    start = time.perf_counter()
+    for snapshot in snapshots:
+        fn(snapshot)
+    return (time.perf_counter() - start) / len(snapshots) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>5} {'entities':>9} {'state cold':>11} {'state warm':>11} "
+        f"{'grid cold':>10} {'grid warm':>10}   (us/call)"
+    )
+    actions = list(Action)
+    for size in args.sizes:
+        config = GeneratorConfig(width=size, height=size, agent_health=1000)
+        state = bitboard.to_state(generate_board(config, 0))
+        rng = np.random.default_rng(0)
+        states = [state]
+        for _ in range(args.steps):
+            state = adv_step(state, actions[int(rng.integers(len(actions)))])
+            states.append(state)
+        gridstates = [grid.from_state(s) for s in states]
+
+        warm = Fingerprinter()
+        state_cold = _per_call(lambda s: Fingerprinter().state(s), states)
+        state_warm = _per_call(warm.state, states)
+        grid_cold = _per_call(lambda g: Fingerprinter().gridstate(g), gridstates)
+        grid_warm = _per_call(warm.gridstate, gridstates)
+        print(
+            f"{size:>5} {len(states[0].position):>9} {state_cold:>11.0f} "
+            f"{state_warm:>11.0f} {grid_cold:>10.0f} {grid_warm:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cold-start import time of the grid_adventure entry points.
+
+Each entry point is imported in fresh interpreters with ``python -X importtime``;
+the median cumulative time and the heaviest dependencies are reported.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--top K] [module ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "grid_adventure.step",
+    "grid_adventure.grid",
+    "grid_adventure.bitboard",
+    "grid_adventure.observation",
+    "grid_adventure.levels.intro",
+    "grid_adventure.env",
+    "grid_adventure.vector",
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [_import_times(module) for _ in range(args.repeat)]
+        total = statistics.median(run[module] for run in runs)
+        print(f"{module:32s} {total / 1e3:8.1f} ms  ({len(runs[-1])} modules)")
+        top_level = {
+            name: us
+            for name, us in runs[-1].items()
+            if "." not in name and name != module.split(".")[0]
+        }
+        for name, us in sorted(top_level.items(), key=lambda item: -item[1])[
+            : args.top
+        ]:
+            print(f"    {name:28s} {us / 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
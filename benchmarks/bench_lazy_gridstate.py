@@ -0,0 +1,55 @@
+"""Benchmark of lazy GridState views against eager conversion.
+
+Compares ``grid_adventure.grid.from_state`` with ``lazy_from_state`` followed
+by reading the 3x3 neighbourhood of the agent, the access pattern of local
+agents, on generated NxN maps.
+
+Usage:
+    python benchmarks/bench_lazy_gridstate.py [--sizes 16 32 64] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from grid_universe.state import State
+
+from grid_adventure import grid
+from grid_adventure.levels.procedural import GeneratorConfig, generate_level
+
+
+def _neighbourhood(state: State) -> int:
+    view = grid.lazy_from_state(state)
+    (agent_id,) = state.agent
+    position = state.position[agent_id]
+    count = 0
+    for x in range(max(position.x - 1, 0), min(position.x + 2, view.width)):
+        for y in range(max(position.y - 1, 0), min(position.y + 2, view.height)):
+            count += len(view.grid[x][y])
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        config = GeneratorConfig(width=size, height=size)
+        state = grid.to_state(generate_level(config, 0))
+        for name, fn in (
+            ("eager", grid.from_state),
+            ("lazy 3x3", _neighbourhood),
+        ):
+            seconds = timeit.timeit(
+                lambda fn=fn, state=state: fn(state), number=args.repeat
+            )
+            print(
+                f"{size:>3}x{size:<3} {name:>9}: {seconds / args.repeat * 1e6:10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
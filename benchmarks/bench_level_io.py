@@ -0,0 +1,111 @@
+"""Level load throughput: builder functions vs. the binary level format.
+
+Writes ``--count`` level files (the intro levels, cycled) to a temporary
+directory, then times building them in Python, loading them as ``GridState``
+and loading them straight into bitboards. The same levels are then written to
+one level pack and read back in random order.
+
+Usage:
+    python benchmarks/bench_level_io.py [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from grid_adventure.levels import binary, intro
+from grid_adventure.levels.pack import LevelPack, write_pack
+
+BUILDERS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    builders = [BUILDERS[i % len(BUILDERS)] for i in range(args.count)]
+    with tempfile.TemporaryDirectory() as root:
+        paths = [os.path.join(root, f"{i:06d}.galv") for i in range(args.count)]
+
+        start = time.perf_counter()
+        levels = [builder(seed=i) for i, builder in enumerate(builders)]
+        build = args.count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for level, path in zip(levels, paths):
+            binary.save_level(level, path)
+        save = args.count / (time.perf_counter() - start)
+        size = sum(os.path.getsize(path) for path in paths) / args.count
+
+        start = time.perf_counter()
+        for path in paths:
+            binary.load_level(path)
+        load = args.count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for path in paths:
+            binary.load_level(path, flyweight=True)
+        load_flyweight = args.count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for path in paths:
+            binary.load_board(path)
+        board = args.count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for path in paths:
+            with open(path, "rb") as f:
+                f.read()
+        raw = args.count / (time.perf_counter() - start)
+
+        pack_path = os.path.join(root, "levels.galp")
+        start = time.perf_counter()
+        write_pack(pack_path, levels)
+        pack_write = args.count / (time.perf_counter() - start)
+        order = np.random.default_rng(0).permutation(args.count)
+        with LevelPack(pack_path) as pack:
+            start = time.perf_counter()
+            for index in order:
+                pack.board(int(index))
+            pack_board = args.count / (time.perf_counter() - start)
+            start = time.perf_counter()
+            for index in order:
+                pack.gridstate(int(index))
+            pack_level = args.count / (time.perf_counter() - start)
+
+    print(f"levels            : {args.count} ({size:.0f} bytes/level on average)")
+    print(f"build (Python)    : {build:10.0f} levels/sec")
+    print(f"save_level        : {save:10.0f} levels/sec")
+    print(f"load_level        : {load:10.0f} levels/sec ({load / build:.1f}x build)")
+    print(
+        f"load_level (fw)   : {load_flyweight:10.0f} levels/sec "
+        f"({load_flyweight / build:.1f}x build)"
+    )
+    print(f"load_board        : {board:10.0f} levels/sec ({board / build:.1f}x build)")
+    print(f"read bytes only   : {raw:10.0f} files/sec")
+    print(f"pack write        : {pack_write:10.0f} levels/sec")
+    print(f"pack board (rand) : {pack_board:10.0f} levels/sec")
+    print(f"pack level (rand) : {pack_level:10.0f} levels/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Overhead and size of episode recording, and replay random access.
+
+Steps a ``GridAdventureEnv`` with random actions with and without an
+``EpisodeRecorder``, then reports the recording size per step and the time to
+reconstruct random steps with ``Replay``.
+
+Usage:
+    python benchmarks/bench_recording.py [--steps N] [--checkpoint-interval K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import gymnasium
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.recording import EpisodeRecorder, Replay, builder_id, read_episodes
+
+
+def _run(env: gymnasium.Env, steps: int) -> float:  # type: ignore[type-arg]
+    rng = np.random.default_rng(0)
+    actions = rng.integers(len(Action), size=steps)
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(int(action))
+        if terminated or truncated:
+            env.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument("--checkpoint-interval", type=int, default=64)
+    args = parser.parse_args()
+
+    def make_env() -> GridAdventureEnv:
+        return GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(intro.build_level_boss),
+            observation_type="gridstate",
+        )
+
+    plain = _run(make_env(), args.steps)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "episodes.gaep")
+        with EpisodeRecorder(
+            make_env(), path, builder_id(intro.build_level_boss)
+        ) as env:
+            recorded = _run(env, args.steps)
+        size = os.path.getsize(path)
+        episodes = read_episodes(path)
+
+    print(
+        f"plain {plain:8.0f} steps/s | recorded {recorded:8.0f} steps/s "
+        f"({(plain / recorded - 1):+.1%} time) | {size} bytes for "
+        f"{len(episodes)} episodes ({size * 8 / args.steps:.2f} bits/step)"
+    )
+
+    longest = max(episodes, key=len)
+    replay = Replay(longest, checkpoint_interval=args.checkpoint_interval)
+    rng = np.random.default_rng(1)
+    queries = rng.integers(len(longest) + 1, size=100)
+    start = time.perf_counter()
+    for t in queries:
+        replay.state(int(t))
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(
+        f"replay: {len(longest)}-step episode, random state access "
+        f"{elapsed * 1e3:.2f} ms (checkpoint interval {args.checkpoint_interval})"
+    )
+
+
+if __name__ == "__main__":
+    main()
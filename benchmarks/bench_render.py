@@ -0,0 +1,180 @@
+"""Render latency benchmarks for image observations.
+
+Compares the base renderer with the tile renderer inside ``GridAdventureEnv``,
+with fresh frames and with recycled double buffers (``image_buffers=2``), then
+measures per-step latency of full, incremental (dirty-tile) and
+incremental + cached static background tile rendering on the A0-A11 intro
+levels and a large generated map, checking that all produce identical pixels.
+
+Usage:
+    python benchmarks/bench_render.py [--steps S] [--resolution R]
+        [--large-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+
+from grid_adventure.entities import (
+    CoinEntity,
+    ExitEntity,
+    FloorEntity,
+    LavaEntity,
+    WallEntity,
+    create_agent_entity,
+)
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.movements import MOVEMENTS
+from grid_adventure.objectives import OBJECTIVES
+from grid_adventure.rendering import TileRenderer
+from grid_adventure.step import step as adv_step
+
+INTRO_LEVELS: dict[str, Callable[..., GridState]] = {
+    "A0": intro.build_level_basic_movement,
+    "A1": intro.build_level_maze_turns,
+    "A2": intro.build_level_optional_coin,
+    "A3": intro.build_level_required_multiple,
+    "A4": intro.build_level_key_door,
+    "A5": intro.build_level_hazard_detour,
+    "A6": intro.build_level_pushable_box,
+    "A7": intro.build_level_power_shield,
+    "A8": intro.build_level_power_ghost,
+    "A9": intro.build_level_power_boots,
+    "A10": intro.build_level_combined_mechanics,
+    "A11": intro.build_level_boss,
+}
+
+
+def build_large_level(size: int, seed: int = 0) -> GridState:
+    """Open field with scattered walls, lava and coins."""
+    rng = np.random.default_rng(seed)
+    gridstate = GridState(
+        size,
+        size,
+        movement=MOVEMENTS["cardinal"],
+        objective=OBJECTIVES["collect_gems_and_exit"],
+        seed=seed,
+        turn_limit=None,
+    )
+    for y in range(size):
+        for x in range(size):
+            gridstate.add((x, y), FloorEntity())
+            if (x, y) in ((size // 2, size // 2), (size - 1, size - 1)):
+                continue
+            roll = rng.random()
+            if roll < 0.15:
+                gridstate.add((x, y), WallEntity())
+            elif roll < 0.18:
+                gridstate.add((x, y), LavaEntity())
+            elif roll < 0.22:
+                gridstate.add((x, y), CoinEntity())
+    gridstate.add((size // 2, size // 2), create_agent_entity(health=1000))
+    gridstate.add((size - 1, size - 1), ExitEntity())
+    return gridstate
+
+
+def _env_latency(
+    render_backend: str, steps: int, resolution: int, image_buffers: int | None = None
+) -> float:
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(intro.build_level_key_door),
+        observation_type="image",
+        render_backend=render_backend,
+        render_resolution=resolution,
+        image_buffers=image_buffers,
+        width=11,
+        height=9,
+    )
+    env.reset(seed=0)
+    actions = np.random.default_rng(0).integers(0, 7, size=steps)
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(int(action))
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    env.close()
+    return elapsed / steps * 1e3
+
+
+def _rollout(builder: Callable[[], GridState], steps: int) -> list[State]:
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    states = [to_state(builder())]
+    for _ in range(steps):
+        state = adv_step(states[-1], actions[int(rng.integers(len(actions)))])
+        states.append(to_state(builder()) if state.win or state.lose else state)
+    return states
+
+
+def _render_latency(states: list[State], resolution: int) -> tuple[float, float, float]:
+    full = TileRenderer(resolution=resolution)
+    renderers = [
+        TileRenderer(resolution=resolution, atlas=full.atlas, incremental=True),
+        TileRenderer(
+            resolution=resolution,
+            atlas=full.atlas,
+            incremental=True,
+            static_background=True,
+        ),
+    ]
+    for state in states[:2]:  # warm the sprite atlas
+        full.render(state)
+    full_time = 0.0
+    times = [0.0] * len(renderers)
+    for state in states:
+        start = time.perf_counter()
+        expected = full.render(state)
+        full_time += time.perf_counter() - start
+        for i, renderer in enumerate(renderers):
+            start = time.perf_counter()
+            frame = renderer.render(state)
+            times[i] += time.perf_counter() - start
+            if not np.array_equal(frame, expected):
+                raise AssertionError("Cached render differs from full render.")
+    dirty, background = (t / len(states) * 1e3 for t in times)
+    return full_time / len(states) * 1e3, dirty, background
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--resolution", type=int, default=640)
+    parser.add_argument("--large-size", type=int, default=64)
+    args = parser.parse_args()
+
+    base = _env_latency("base", args.steps, args.resolution)
+    tiles = _env_latency("tiles", args.steps, args.resolution)
+    print(f"env step, base renderer : {base:8.2f} ms/step")
+    print(f"env step, tile renderer : {tiles:8.2f} ms/step ({base / tiles:.1f}x)")
+    for backend, fresh in (("base", base), ("tiles", tiles)):
+        buffered = _env_latency(backend, args.steps, args.resolution, image_buffers=2)
+        print(
+            f"env step, {backend:<5} 2 buffers: {buffered:8.2f} ms/step "
+            f"({fresh / buffered:.2f}x)"
+        )
+    print()
+
+    levels = dict(INTRO_LEVELS)
+    levels[f"large {args.large_size}x{args.large_size}"] = lambda: build_large_level(
+        args.large_size
+    )
+    print(f"{'level':>12} {'full ms':>9} {'dirty ms':>9} {'dirty+bg ms':>12}")
+    for name, builder in levels.items():
+        states = _rollout(builder, args.steps)
+        full_ms, dirty_ms, background_ms = _render_latency(states, args.resolution)
+        print(f"{name:>12} {full_ms:9.3f} {dirty_ms:9.3f} {background_ms:12.3f}")
+    print("cached frames are pixel-identical to full renders")
+
+
+if __name__ == "__main__":
+    main()
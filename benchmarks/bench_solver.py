@@ -0,0 +1,58 @@
+"""Optimal planner on the intro levels: plan cost, nodes/sec and wall time.
+
+Usage:
+    python benchmarks/bench_solver.py [--bfs] [--max-nodes N] [--batch-size B]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from grid_adventure.levels import intro
+from grid_adventure.solver import DEFAULT_BATCH_SIZE, DEFAULT_MAX_NODES, solve
+
+LEVELS = {
+    "A0": intro.build_level_basic_movement,
+    "A1": intro.build_level_maze_turns,
+    "A2": intro.build_level_optional_coin,
+    "A3": intro.build_level_required_multiple,
+    "A4": intro.build_level_key_door,
+    "A5": intro.build_level_hazard_detour,
+    "A6": intro.build_level_pushable_box,
+    "A7": intro.build_level_power_shield,
+    "A8": intro.build_level_power_ghost,
+    "A9": intro.build_level_power_boots,
+    "A10": intro.build_level_combined_mechanics,
+    "A11": intro.build_level_boss,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bfs", action="store_true", help="also run breadth-first")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    searches = [("A*", True)] + ([("BFS", False)] if args.bfs else [])
+    print(
+        f"{'level':<6} {'search':<6} {'cost':>5} {'expanded':>10} "
+        f"{'nodes/sec':>10} {'seconds':>8}"
+    )
+    for name, builder in LEVELS.items():
+        for search, heuristic in searches:
+            result = solve(
+                builder(),
+                heuristic=heuristic,
+                max_nodes=args.max_nodes,
+                batch_size=args.batch_size,
+            )
+            cost = "limit" if result.limit_reached else result.cost
+            print(
+                f"{name:<6} {search:<6} {cost!s:>5} {result.nodes_expanded:>10} "
+                f"{result.nodes_per_second:>10.0f} {result.seconds:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Micro-benchmark for per-entity specialization cost.
+
+Compares the signature dispatch table used by ``grid_adventure.grid`` against
+the previous ``isinstance``/``has()`` if-chain.
+
+Usage:
+    python benchmarks/bench_specialize.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from grid_universe.grid.convert import from_state as base_from_state
+from grid_universe.grid.convert import to_state
+from grid_universe.grid.entity import BaseEntity, copy_entity_components
+
+from grid_adventure.entities import (
+    AgentEntity,
+    BoxEntity,
+    CoinEntity,
+    ExitEntity,
+    FloorEntity,
+    GemEntity,
+    KeyEntity,
+    LavaEntity,
+    LockedDoorEntity,
+    PhasingPowerUpEntity,
+    ShieldPowerUpEntity,
+    SpeedPowerUpEntity,
+    UnlockedDoorEntity,
+    WallEntity,
+)
+from grid_adventure.grid import SpecializedTypes, _specialize_single
+from grid_adventure.levels import intro
+
+
+def _specialize_single_chain(obj: BaseEntity) -> BaseEntity:
+    """The if-chain specialization that predates the dispatch table."""
+    if isinstance(obj, SpecializedTypes):
+        return obj
+
+    def has(name: str) -> bool:
+        return getattr(obj, name, None) is not None
+
+    app_name = getattr(getattr(obj, "appearance", None), "name", None)
+    cls: type[BaseEntity] | None = None
+    if has("agent"):
+        cls = AgentEntity
+    elif has("exit"):
+        cls = ExitEntity
+    elif app_name == "door":
+        cls = LockedDoorEntity if has("locked") else UnlockedDoorEntity
+    elif has("key"):
+        cls = KeyEntity
+    elif has("collectible"):
+        if has("speed"):
+            cls = SpeedPowerUpEntity
+        elif has("immunity"):
+            cls = ShieldPowerUpEntity
+        elif has("phasing"):
+            cls = PhasingPowerUpEntity
+        elif app_name == "core" or has("requirable"):
+            cls = GemEntity
+        else:
+            cls = CoinEntity
+    elif app_name == "box":
+        cls = BoxEntity
+    elif app_name == "lava":
+        cls = LavaEntity
+    elif app_name == "floor":
+        cls = FloorEntity
+    elif app_name == "wall":
+        cls = WallEntity
+    if cls is None:
+        return obj
+    return copy_entity_components(obj, cls(), preserve_entity_id=True)
+
+
+def _generic_entities() -> list[BaseEntity]:
+    """Unspecialized entities as produced by ``grid_universe`` conversion."""
+    gridstate = base_from_state(to_state(intro.build_level_boss()))
+    return [obj for column in gridstate.grid for cell in column for obj in cell]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    entities = _generic_entities()
+    n = len(entities) * args.repeat
+    for name, fn in (
+        ("if-chain", _specialize_single_chain),
+        ("dispatch", _specialize_single),
+    ):
+        seconds = timeit.timeit(
+            lambda fn=fn: [fn(obj) for obj in entities], number=args.repeat
+        )
+        print(f"{name:>9}: {seconds / n * 1e9:8.1f} ns/entity ({n} entities)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""End-to-end benchmark suite with JSON results and regression checks.
+
+``run`` times, for every intro level (A0-A11) and generated NxN maps:
+
+- ``step``: ``grid_adventure.step.step``
+- ``from_state``, ``to_state``, ``specialize_entities``, ``grid_step`` and
+  ``grid_step_incremental``: the ``grid_adventure.grid`` conversions and step
+- ``env_reset`` and ``env_step``: ``GridAdventureEnv`` with gridstate and
+  tensor observations, and image observations for each render backend and
+  resolution
+
+Step and conversion timings follow one random rollout per level. Each case is
+repeated ``--repeat`` times and reports the median and minimum microseconds
+per call. Results are written as JSON (``--output``, default stdout).
+
+``compare`` matches the cases of two result files by name and flags every case
+whose median time grew by more than ``--threshold`` (a fraction) as a
+regression; it exits with status 1 if there are any.
+
+Usage:
+    python benchmarks/bench_suite.py run [--output results.json] [--sizes 16 32]
+        [--resolutions 128 256] [--repeat R] [--steps S] [--only SUBSTRING]
+    python benchmarks/bench_suite.py compare baseline.json results.json
+        [--threshold 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import from_state as base_from_state
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+
+from grid_adventure import grid
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.levels.procedural import GeneratorConfig, generate_level
+from grid_adventure.step import step as adv_step
+
+SCHEMA_VERSION = 1
+
+INTRO_LEVELS: dict[str, Callable[..., GridState]] = {
+    "A0": intro.build_level_basic_movement,
+    "A1": intro.build_level_maze_turns,
+    "A2": intro.build_level_optional_coin,
+    "A3": intro.build_level_required_multiple,
+    "A4": intro.build_level_key_door,
+    "A5": intro.build_level_hazard_detour,
+    "A6": intro.build_level_pushable_box,
+    "A7": intro.build_level_power_shield,
+    "A8": intro.build_level_power_ghost,
+    "A9": intro.build_level_power_boots,
+    "A10": intro.build_level_combined_mechanics,
+    "A11": intro.build_level_boss,
+}
+
+
+def _levels(sizes: list[int]) -> dict[str, Callable[..., GridState]]:
+    levels = dict(INTRO_LEVELS)
+    for size in sizes:
+        config = GeneratorConfig(width=size, height=size, agent_health=1000)
+        levels[f"N{size}"] = partial(generate_level, config, 0)
+    return levels
+
+
+def _rollout(
+    builder: Callable[..., GridState], steps: int
+) -> tuple[list[State], list[Action]]:
+    """Random walk from the level start, restarting when an episode ends."""
+    rng = np.random.default_rng(0)
+    start = grid.to_state(builder())
+    states, actions = [start], []
+    for _ in range(steps):
+        action = list(Action)[int(rng.integers(len(Action)))]
+        state = adv_step(states[-1], action)
+        actions.append(action)
+        states.append(start if state.win or state.lose else state)
+    return states[:-1], actions
+
+
+def _per_call(run: Callable[[], int], repeat: int) -> list[float]:
+    """Microseconds per call of each of ``repeat`` runs (``run`` returns calls)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        calls = run()
+        times.append((time.perf_counter() - start) / calls * 1e6)
+    return times
+
+
+def _state_cases(
+    states: list[State], actions: list[Action]
+) -> Iterator[tuple[str, Callable[[], int]]]:
+    gridstates = [grid.from_state(s) for s in states]
+    base_gridstates = [base_from_state(s) for s in states]
+
+    def each(fn: Callable[..., Any], *columns: list[Any]) -> Callable[[], int]:
+        def run() -> int:
+            for args in zip(*columns):
+                fn(*args)
+            return len(columns[0])
+
+        return run
+
+    yield "step", each(adv_step, states, actions)
+    yield "from_state", each(grid.from_state, states)
+    yield "to_state", each(grid.to_state, gridstates)
+    yield "specialize_entities", each(grid.specialize_entities, base_gridstates)
+    yield "grid_step", each(grid.step, gridstates, actions)
+    yield (
+        "grid_step_incremental",
+        each(partial(grid.step, incremental=True), gridstates, actions),
+    )
+
+
+def _env_configs(
+    resolutions: list[int], render_backends: list[str]
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    yield "gridstate", {"observation_type": "gridstate"}
+    yield "tensor", {"observation_type": "tensor"}
+    for backend in render_backends:
+        for resolution in resolutions:
+            yield (
+                f"image-{backend}-{resolution}",
+                {
+                    "observation_type": "image",
+                    "render_backend": backend,
+                    "render_resolution": resolution,
+                },
+            )
+
+
+def _env_cases(
+    builder: Callable[..., GridState],
+    actions: list[Action],
+    resolutions: list[int],
+    render_backends: list[str],
+) -> Iterator[tuple[str, Callable[[], int]]]:
+    sample = builder()
+    for mode, kwargs in _env_configs(resolutions, render_backends):
+        env = GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(builder),
+            width=sample.width,
+            height=sample.height,
+            **kwargs,
+        )
+
+        def reset(env: GridAdventureEnv = env) -> int:
+            env.reset(seed=0)
+            return 1
+
+        def step(env: GridAdventureEnv = env) -> int:
+            env.reset(seed=0)
+            for action in actions:
+                _, _, terminated, truncated, _ = env.step(action)
+                if terminated or truncated:
+                    env.reset(seed=0)
+            return len(actions)
+
+        reset()  # Warm caches (sprite atlas, imports) outside the timings.
+        yield f"env_reset[{mode}]", reset
+        yield f"env_step[{mode}]", step
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results = []
+    for level, builder in _levels(args.sizes).items():
+        states, actions = _rollout(builder, args.steps)
+        cases = [
+            *_state_cases(states, actions),
+            *_env_cases(builder, actions, args.resolutions, args.render_backends),
+        ]
+        for case, fn in cases:
+            name = f"{case}/{level}"
+            if args.only and args.only not in name:
+                continue
+            times = _per_call(fn, args.repeat)
+            results.append(
+                {
+                    "name": name,
+                    "case": case,
+                    "level": level,
+                    "median_us": statistics.median(times),
+                    "min_us": min(times),
+                    "repeat": args.repeat,
+                }
+            )
+            print(f"{name:<42} {results[-1]['median_us']:12.1f} us", file=sys.stderr)
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "steps": args.steps,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print a comparison table; return the names of the regressed cases."""
+    before = {r["name"]: r for r in baseline["results"]}
+    after = {r["name"]: r for r in current["results"]}
+    regressions = []
+    print(f"{'case':<42} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name]["median_us"], after[name]["median_us"]
+        change = new / old - 1 if old > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<42} {old:12.1f} {new:12.1f} {change:+8.1%}{flag}")
+    for name in sorted(before.keys() - after.keys()):
+        print(f"{name:<42} missing from the current results")
+    for name in sorted(after.keys() - before.keys()):
+        print(f"{name:<42} new (no baseline)")
+    print(
+        f"{len(regressions)} regression(s) beyond {threshold:.0%} "
+        f"in {len(before.keys() & after.keys())} compared cases"
+    )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--output", help="JSON file (default: stdout)")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32])
+    run_parser.add_argument("--resolutions", type=int, nargs="+", default=[128, 256])
+    run_parser.add_argument("--render-backends", nargs="+", default=["base", "tiles"])
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--steps", type=int, default=20)
+    run_parser.add_argument("--only", help="run only cases containing this text")
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        text = json.dumps(run(args), indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    for results in (baseline, current):
+        if results.get("schema") != SCHEMA_VERSION:
+            sys.exit(f"Unsupported benchmark results schema {results.get('schema')}.")
+    if compare(baseline, current, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
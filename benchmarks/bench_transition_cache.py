@@ -0,0 +1,70 @@
+"""Transition cache on an exploration-heavy workload.
+
+Runs MCTS-style random rollouts from the start of a level (every rollout
+revisits the states near the root) with and without ``TransitionCache`` and
+reports steps/sec and the hit rate. With ``--max-bytes`` the cache also
+measures every stored state against that byte budget.
+
+Usage:
+    python benchmarks/bench_transition_cache.py [--rollouts R] [--depth D]
+        [--max-bytes B]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+from grid_universe.state import State
+
+from grid_adventure.cache import TransitionCache
+from grid_adventure.levels import intro
+from grid_adventure.step import step as adv_step
+
+
+def _rollouts(
+    step_fn: Callable[[State, Action], State], start: State, args: argparse.Namespace
+) -> float:
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    steps = 0
+    begin = time.perf_counter()
+    for _ in range(args.rollouts):
+        state = start
+        for _ in range(args.depth):
+            state = step_fn(state, actions[int(rng.integers(len(actions)))])
+            steps += 1
+            if state.win or state.lose:
+                break
+    return steps / (time.perf_counter() - begin)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rollouts", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=12)
+    parser.add_argument("--max-bytes", type=int, default=None)
+    args = parser.parse_args()
+
+    for name, builder in (
+        ("A4 key_door", intro.build_level_key_door),
+        ("A11 boss", intro.build_level_boss),
+    ):
+        start = to_state(builder())
+        plain = _rollouts(adv_step, start, args)
+        cache = TransitionCache(max_bytes=args.max_bytes)
+        cached = _rollouts(cache.step, start, args)
+        stats = cache.stats()
+        print(
+            f"{name:<12} uncached {plain:8.0f} steps/s | cached {cached:8.0f} "
+            f"steps/s ({cached / plain:.1f}x, hit rate {stats.hit_rate:.0%}, "
+            f"{stats.size} entries, {stats.nbytes} measured bytes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,724 @@
+"""NumPy bitboard step engine for the Grid Adventure rule set.
+
+The reference ``grid_adventure.step.step`` runs the generic entity-component
+engine of Grid Universe over persistent maps. This module implements the fixed
+Grid Adventure rules directly on a ``Bitboard``:
+
+- ``planes``: per-cell entity counts, ``uint8`` of shape ``(P, H, W)``, one
+  plane per entity class in ``PLANES`` (indexed as ``planes[p, y, x]``).
+- ``agent``: the agent summary, ``int32`` of shape ``(A,)`` (``AGENT_FIELDS``).
+- ``effects``: held power-ups, ``int32`` of shape ``(E, 2)``, one
+  ``(kind, amount)`` row per power-up (``EFFECT_*``; amount ``-1`` when
+  unlimited, empty rows have kind ``EFFECT_NONE``).
+
+Boards can be batched along a leading axis (see ``stack``/``unstack``);
+``step_batch`` advances every board of a batch with vectorized NumPy updates.
+``to_tensor`` builds the tensor observation of a board without a State.
+
+Rules (per step, for a board that has neither won nor lost):
+
+1. Moves take one substep, or ``SPEED_POWERUP_MULTIPLIER`` substeps while a
+   speed effect is held. A substep stops the move when the target is off the
+   grid or blocked (wall, locked door, box) and cannot be entered. Boxes are
+   pushed one cell when the cell behind them is on the grid and free of walls,
+   locked doors, boxes and lava. While phasing, walls, doors and boxes are
+   passed through and nothing is pushed.
+2. Landing on lava deals ``HAZARD_DAMAGE`` per lava entity unless phasing; a
+   held shield absorbs the hit instead, using one of its uses.
+3. ``USE_KEY`` unlocks locked doors on the current cell, then left, right, up
+   and down, one key per door, while keys remain.
+4. ``PICK_UP`` collects every collectible on the current cell: coins add
+   ``COIN_REWARD`` to the score, power-ups become effects.
+5. After the action the tile cost of the current cell (``FLOOR_COST`` per
+   floor) is subtracted from the score, timed effects count down one turn and
+   expire at zero, and the turn advances. The agent wins on an exit once no
+   gems remain on the board, and loses when its health reaches zero or the
+   turn limit is reached.
+
+Parity: for any State built from the Grid Adventure entity classes with their
+default rule components (which ``from_state`` checks), stepping with
+``step`` and converting back with ``to_state`` gives the same agent position,
+health, held keys/gems/coins, effect kinds and remaining amounts, entity layout,
+score, turn, win and lose as ``grid_adventure.step.step``. Entity ids and the
+``message`` field are not preserved. ``tests/test_bitboard.py`` checks this
+guarantee with random rollouts on the intro levels.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.components.effects.time_limit import TimeLimit
+from grid_universe.components.effects.usage_limit import UsageLimit
+from grid_universe.components.properties.health import Health
+from grid_universe.grid.entity import BaseEntity
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from numpy.typing import NDArray
+
+from grid_adventure import grid
+from grid_adventure.constants import (
+    COIN_REWARD,
+    FLOOR_COST,
+    HAZARD_DAMAGE,
+    SPEED_POWERUP_MULTIPLIER,
+)
+from grid_adventure.entities import (
+    BACKGROUND_ENTITY_TYPES,
+    AgentEntity,
+    BoxEntity,
+    CoinEntity,
+    ExitEntity,
+    FloorEntity,
+    GemEntity,
+    KeyEntity,
+    LavaEntity,
+    LockedDoorEntity,
+    PhasingPowerUpEntity,
+    ShieldPowerUpEntity,
+    SpeedPowerUpEntity,
+    UnlockedDoorEntity,
+    WallEntity,
+    create_agent_entity,
+    shared_entity,
+)
+from grid_adventure.observation import (
+    CHANNEL_INDEX,
+    TENSOR_CHANNELS,
+    TENSOR_VECTOR_FIELDS,
+    VECTOR_INDEX,
+    TensorObservation,
+)
+
+PLANES: tuple[str, ...] = (
+    "floor",
+    "wall",
+    "exit",
+    "lava",
+    "coin",
+    "gem",
+    "key",
+    "locked_door",
+    "unlocked_door",
+    "box",
+    "speed",
+    "shield",
+    "phasing",
+)
+PLANE_INDEX: dict[str, int] = {name: i for i, name in enumerate(PLANES)}
+
+AGENT_FIELDS: tuple[str, ...] = (
+    "x",
+    "y",
+    "health",
+    "max_health",
+    "keys",
+    "gems",
+    "coins",
+    "score",
+    "turn",
+    "turn_limit",
+    "win",
+    "lose",
+)
+AGENT_INDEX: dict[str, int] = {name: i for i, name in enumerate(AGENT_FIELDS)}
+
+EFFECT_NONE = 0
+EFFECT_SPEED = 1
+EFFECT_PHASING = 2
+EFFECT_SHIELD = 3
+
+_FLOOR, _WALL, _EXIT, _LAVA, _COIN, _GEM, _KEY = range(7)
+_LOCKED, _UNLOCKED, _BOX, _SPEED, _SHIELD, _PHASING = range(7, 13)
+_X, _Y, _HEALTH, _MAX_HEALTH, _KEYS, _GEMS, _COINS = range(7)
+_SCORE, _TURN, _TURN_LIMIT, _WIN, _LOSE = range(7, 12)
+
+# Entity class of each plane, used in both conversion directions.
+_PLANE_TYPES: tuple[type[BaseEntity], ...] = (
+    FloorEntity,
+    WallEntity,
+    ExitEntity,
+    LavaEntity,
+    CoinEntity,
+    GemEntity,
+    KeyEntity,
+    LockedDoorEntity,
+    UnlockedDoorEntity,
+    BoxEntity,
+    SpeedPowerUpEntity,
+    ShieldPowerUpEntity,
+    PhasingPowerUpEntity,
+)
+
+# Power-up class -> (effect kind, board plane).
+_POWERUPS: dict[type[BaseEntity], tuple[int, int]] = {
+    SpeedPowerUpEntity: (EFFECT_SPEED, _SPEED),
+    PhasingPowerUpEntity: (EFFECT_PHASING, _PHASING),
+    ShieldPowerUpEntity: (EFFECT_SHIELD, _SHIELD),
+}
+_EFFECT_TYPES: dict[int, type[BaseEntity]] = {
+    kind: cls for cls, (kind, _) in _POWERUPS.items()
+}
+_TIMED_EFFECTS = (EFFECT_SPEED, EFFECT_PHASING)
+
+# Components whose values the rules above hard-code.
+_RULE_FIELDS = (
+    "cost",
+    "damage",
+    "rewardable",
+    "speed",
+    "time_limit",
+    "usage_limit",
+    "key",
+    "locked",
+)
+_DEFAULTS: dict[type[BaseEntity], BaseEntity] = {cls: cls() for cls in _PLANE_TYPES}
+
+_ACTION_INDEX: dict[Action, int] = {action: i for i, action in enumerate(Action)}
+_USE_KEY = _ACTION_INDEX[Action.USE_KEY]
+_PICK_UP = _ACTION_INDEX[Action.PICK_UP]
+_DX = np.zeros(len(_ACTION_INDEX), dtype=np.int64)
+_DY = np.zeros(len(_ACTION_INDEX), dtype=np.int64)
+for _action, (_dx, _dy) in {
+    Action.UP: (0, -1),
+    Action.DOWN: (0, 1),
+    Action.LEFT: (-1, 0),
+    Action.RIGHT: (1, 0),
+}.items():
+    _DX[_ACTION_INDEX[_action]] = _dx
+    _DY[_ACTION_INDEX[_action]] = _dy
+_IS_MOVE = (_DX != 0) | (_DY != 0)
+
+# USE_KEY search order: current cell, left, right, up, down.
+_UNLOCK_OFFSETS = ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+@dataclass(frozen=True)
+class LevelInfo:
+    """Level metadata carried through the engine unchanged."""
+
+    movement: Any = None
+    objective: Any = None
+    seed: int | None = None
+
+
+@dataclass(frozen=True)
+class Bitboard:
+    """Grid Adventure state as NumPy arrays (see the module docstring).
+
+    A batched board has one extra leading axis on every array and one
+    ``LevelInfo`` per board in ``levels``.
+    """
+
+    planes: NDArray[np.uint8]
+    agent: NDArray[np.int32]
+    effects: NDArray[np.int32]
+    levels: tuple[LevelInfo, ...] = (LevelInfo(),)
+
+    @property
+    def batched(self) -> bool:
+        return self.planes.ndim == 4
+
+    @property
+    def width(self) -> int:
+        return int(self.planes.shape[-1])
+
+    @property
+    def height(self) -> int:
+        return int(self.planes.shape[-2])
+
+    def copy(self) -> "Bitboard":
+        return Bitboard(
+            self.planes.copy(), self.agent.copy(), self.effects.copy(), self.levels
+        )
+
+
+def _entity_type(obj: BaseEntity) -> type[BaseEntity] | None:
+    """Return the Grid Adventure class of an entity, specialized or not."""
+    if isinstance(obj, AgentEntity):
+        return AgentEntity
+    for cls in _PLANE_TYPES:
+        if isinstance(obj, cls):
+            return cls
+    entity_cls = grid.specialization_for(grid.entity_signature(obj))
+    if entity_cls is None:
+        return None
+    for cls in (AgentEntity, *_PLANE_TYPES):
+        if issubclass(entity_cls, cls):
+            return cls
+    return None
+
+
+def _check_rules(obj: BaseEntity, cls: type[BaseEntity]) -> None:
+    default = _DEFAULTS[cls]
+    for name in _RULE_FIELDS:
+        if getattr(obj, name, None) != getattr(default, name, None):
+            raise ValueError(
+                f"{cls.__name__} with non-default {name!r} is outside the "
+                "bitboard rule set."
+            )
+
+
+def _effect_amount(obj: BaseEntity) -> int:
+    time_limit = getattr(obj, "time_limit", None)
+    if time_limit is not None:
+        return int(time_limit.amount)
+    usage_limit = getattr(obj, "usage_limit", None)
+    if usage_limit is not None:
+        return int(usage_limit.amount)
+    return -1
+
+
+def from_gridstate(gridstate: GridState) -> Bitboard:
+    """Convert a GridState with exactly one agent to an unbatched Bitboard.
+
+    Raises:
+        ValueError: If the level uses entities or component values outside the
+            Grid Adventure rule set.
+    """
+    planes = np.zeros((len(PLANES), gridstate.height, gridstate.width), np.uint8)
+    agent = np.zeros(len(AGENT_FIELDS), dtype=np.int32)
+    effects: list[tuple[int, int]] = []
+    agents = 0
+    for x in range(gridstate.width):
+        for y in range(gridstate.height):
+            for obj in gridstate.grid[x][y]:
+                cls = _entity_type(obj)
+                if cls is None:
+                    raise ValueError(
+                        f"{type(obj).__name__} at {(x, y)} is outside the "
+                        "bitboard rule set."
+                    )
+                if cls is not AgentEntity:
+                    _check_rules(obj, cls)
+                    planes[_PLANE_TYPES.index(cls), y, x] += 1
+                    continue
+                agents += 1
+                health = getattr(obj, "health", None)
+                if health is None:
+                    raise ValueError("The bitboard engine needs an agent with Health.")
+                agent[[_X, _Y]] = x, y
+                agent[[_HEALTH, _MAX_HEALTH]] = (
+                    health.current_health,
+                    health.max_health,
+                )
+                for item in getattr(obj, "inventory_list", None) or []:
+                    item_cls = _entity_type(item)
+                    if item_cls is KeyEntity:
+                        agent[_KEYS] += 1
+                    elif item_cls is GemEntity:
+                        agent[_GEMS] += 1
+                    elif item_cls is CoinEntity:
+                        agent[_COINS] += 1
+                    else:
+                        raise ValueError(
+                            f"Inventory item {type(item).__name__} is outside "
+                            "the bitboard rule set."
+                        )
+                for effect in getattr(obj, "status_list", None) or []:
+                    effect_cls = _entity_type(effect)
+                    if effect_cls not in _POWERUPS:
+                        raise ValueError(
+                            f"Effect {type(effect).__name__} is outside the "
+                            "bitboard rule set."
+                        )
+                    effects.append((_POWERUPS[effect_cls][0], _effect_amount(effect)))
+    if agents != 1:
+        raise ValueError(f"Expected exactly one agent, found {agents}.")
+
+    agent[_SCORE] = gridstate.score
+    agent[_TURN] = gridstate.turn
+    agent[_TURN_LIMIT] = -1 if gridstate.turn_limit is None else gridstate.turn_limit
+    agent[_WIN] = bool(gridstate.win)
+    agent[_LOSE] = bool(gridstate.lose)
+
+    # Room for every held effect plus every power-up still on the board.
+    num_slots = max(1, len(effects) + int(planes[[_SPEED, _SHIELD, _PHASING]].sum()))
+    effect_array = np.zeros((num_slots, 2), dtype=np.int32)
+    if effects:
+        effect_array[: len(effects)] = effects
+    level = LevelInfo(gridstate.movement, gridstate.objective, gridstate.seed)
+    return Bitboard(planes, agent, effect_array, (level,))
+
+
+def from_state(state: State) -> Bitboard:
+    """Convert a State to an unbatched Bitboard (see ``from_gridstate``)."""
+    return from_gridstate(grid.from_state(state))
+
+
+def to_gridstate(board: Bitboard, flyweight: bool = False) -> GridState:
+    """Convert an unbatched Bitboard to a GridState of Grid Adventure entities.
+
+    With ``flyweight=True`` floors and walls are the shared instances of
+    ``shared_entity`` instead of one new entity per cell.
+    """
+    assert not board.batched, "Use unstack() to convert a batched board."
+    agent = board.agent
+    level = board.levels[0]
+    turn_limit = int(agent[_TURN_LIMIT])
+    gridstate = GridState(
+        width=board.width,
+        height=board.height,
+        movement=level.movement,
+        objective=level.objective,
+        seed=level.seed,
+        turn=int(agent[_TURN]),
+        score=int(agent[_SCORE]),
+        win=bool(agent[_WIN]),
+        lose=bool(agent[_LOSE]),
+        message=None,
+        turn_limit=None if turn_limit < 0 else turn_limit,
+    )
+    for plane, cls in enumerate(_PLANE_TYPES):
+        shared = flyweight and cls in BACKGROUND_ENTITY_TYPES
+        for y, x in np.argwhere(board.planes[plane]):
+            for _ in range(int(board.planes[plane, y, x])):
+                gridstate.add((int(x), int(y)), shared_entity(cls) if shared else cls())
+
+    agent_entity = create_agent_entity()
+    agent_entity.health = Health(
+        current_health=int(agent[_HEALTH]), max_health=int(agent[_MAX_HEALTH])
+    )
+    agent_entity.inventory_list = [
+        *(KeyEntity() for _ in range(int(agent[_KEYS]))),
+        *(GemEntity() for _ in range(int(agent[_GEMS]))),
+        *(CoinEntity() for _ in range(int(agent[_COINS]))),
+    ]
+    for kind, amount in board.effects:
+        if kind == EFFECT_NONE:
+            continue
+        effect = _EFFECT_TYPES[int(kind)]()
+        if kind == EFFECT_SHIELD:
+            effect.usage_limit = None if amount < 0 else UsageLimit(amount=int(amount))
+        else:
+            effect.time_limit = None if amount < 0 else TimeLimit(amount=int(amount))
+        agent_entity.status_list.append(effect)
+    gridstate.add((int(agent[_X]), int(agent[_Y])), agent_entity)
+    return gridstate
+
+
+def to_state(board: Bitboard) -> State:
+    """Convert an unbatched Bitboard to a State."""
+    return grid.to_state(to_gridstate(board))
+
+
+# Tensor observation channel of each plane (see ``grid_adventure.observation``).
+_TENSOR_PLANES = np.array([CHANNEL_INDEX[name] for name in PLANES])
+
+
+def _merged_amount(amounts: NDArray[np.int32], add: bool) -> int:
+    """Combine the amounts of stacked effects; unlimited (-1) dominates."""
+    if amounts.size == 0:
+        return 0
+    if (amounts < 0).any():
+        return -1
+    return int(amounts.sum() if add else amounts.max())
+
+
+def to_tensor(
+    board: Bitboard, out: TensorObservation | None = None
+) -> TensorObservation:
+    """Build the tensor observation of an unbatched Bitboard.
+
+    Equal to ``grid_adventure.observation.state_to_tensor(to_state(board))``
+    without building the State.
+    """
+    assert not board.batched, "Use unstack() to convert a batched board."
+    if out is None:
+        out = TensorObservation(
+            grid=np.zeros(
+                (len(TENSOR_CHANNELS), board.height, board.width), dtype=np.uint8
+            ),
+            vector=np.zeros(len(TENSOR_VECTOR_FIELDS), dtype=np.int32),
+        )
+    grid_out = out["grid"]
+    grid_out.fill(0)
+    grid_out[_TENSOR_PLANES] = board.planes > 0
+    agent = board.agent
+    grid_out[CHANNEL_INDEX["agent"], agent[_Y], agent[_X]] = 1
+
+    kinds, amounts = board.effects[:, 0], board.effects[:, 1]
+    vector = out["vector"]
+    vector[VECTOR_INDEX["health"]] = agent[_HEALTH]
+    vector[VECTOR_INDEX["max_health"]] = agent[_MAX_HEALTH]
+    vector[VECTOR_INDEX["speed_turns"]] = _merged_amount(
+        amounts[kinds == EFFECT_SPEED], add=False
+    )
+    vector[VECTOR_INDEX["phasing_turns"]] = _merged_amount(
+        amounts[kinds == EFFECT_PHASING], add=False
+    )
+    # Usage-limited shields are consumed one at a time, so uses add up.
+    vector[VECTOR_INDEX["shield_uses"]] = _merged_amount(
+        amounts[kinds == EFFECT_SHIELD], add=True
+    )
+    vector[VECTOR_INDEX["keys"]] = agent[_KEYS]
+    vector[VECTOR_INDEX["gems"]] = agent[_GEMS]
+    vector[VECTOR_INDEX["coins"]] = agent[_COINS]
+    return out
+
+
+def stack(boards: list[Bitboard]) -> Bitboard:
+    """Stack unbatched boards of the same size into one batched board."""
+    assert boards and not any(board.batched for board in boards)
+    num_slots = max(board.effects.shape[0] for board in boards)
+    effects = np.zeros((len(boards), num_slots, 2), dtype=np.int32)
+    for i, board in enumerate(boards):
+        effects[i, : board.effects.shape[0]] = board.effects
+    return Bitboard(
+        np.stack([board.planes for board in boards]),
+        np.stack([board.agent for board in boards]),
+        effects,
+        tuple(board.levels[0] for board in boards),
+    )
+
+
+def unstack(board: Bitboard) -> list[Bitboard]:
+    """Split a batched board into unbatched boards."""
+    assert board.batched
+    return [
+        Bitboard(
+            board.planes[i].copy(),
+            board.agent[i].copy(),
+            board.effects[i].copy(),
+            (board.levels[i],),
+        )
+        for i in range(board.planes.shape[0])
+    ]
+
+
+def action_index(action: Action | int) -> int:
+    """Return the index of an action in ``Action`` (as used by the environments)."""
+    if isinstance(action, Action):
+        return _ACTION_INDEX[action]
+    return int(action)
+
+
+def _damage(
+    agent: NDArray[np.int32],
+    effects: NDArray[np.int32],
+    rows: NDArray[np.intp],
+    damage: NDArray[np.int32],
+) -> None:
+    """Apply damage to ``rows``, letting a held shield absorb it."""
+    shields = effects[rows, :, 0] == EFFECT_SHIELD
+    shielded = shields.any(axis=1)
+    slots = shields.argmax(axis=1)[shielded]
+    shield_rows = rows[shielded]
+    uses = effects[shield_rows, slots, 1]
+    limited = uses > 0
+    effects[shield_rows[limited], slots[limited], 1] -= 1
+    spent = limited & (uses == 1)
+    effects[shield_rows[spent], slots[spent]] = 0
+
+    hurt = rows[~shielded]
+    agent[hurt, _HEALTH] = np.maximum(agent[hurt, _HEALTH] - damage[~shielded], 0)
+
+
+def _substep(
+    planes: NDArray[np.uint8],
+    agent: NDArray[np.int32],
+    effects: NDArray[np.int32],
+    moving: NDArray[np.bool_],
+    dx: NDArray[np.int64],
+    dy: NDArray[np.int64],
+    phasing: NDArray[np.bool_],
+) -> None:
+    """Advance every board in ``moving`` by one cell, clearing stopped boards."""
+    height, width = planes.shape[-2:]
+    rows = np.flatnonzero(moving)
+    x = agent[rows, _X] + dx[rows]
+    y = agent[rows, _Y] + dy[rows]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    moving[rows[~inside]] = False
+    rows, x, y = rows[inside], x[inside], y[inside]
+    row_dx, row_dy, row_phasing = dx[rows], dy[rows], phasing[rows]
+
+    cell = planes[rows, :, y, x]
+    walls = (cell[:, _WALL] > 0) | (cell[:, _LOCKED] > 0)
+    boxes = cell[:, _BOX] > 0
+    free = row_phasing | ~(walls | boxes)
+
+    # Push boxes one cell further if the cell behind them is free.
+    push_x, push_y = x + row_dx, y + row_dy
+    push = ~row_phasing & boxes & ~walls
+    push &= (push_x >= 0) & (push_x < width) & (push_y >= 0) & (push_y < height)
+    push_x = np.clip(push_x, 0, width - 1)
+    push_y = np.clip(push_y, 0, height - 1)
+    behind = planes[rows, :, push_y, push_x]
+    push &= (behind[:, [_WALL, _LOCKED, _BOX, _LAVA]] == 0).all(axis=1)
+    pushed = rows[push]
+    planes[pushed, _BOX, push_y[push], push_x[push]] = cell[push, _BOX]
+    planes[pushed, _BOX, y[push], x[push]] = 0
+
+    moved = free | push
+    moving[rows[~moved]] = False
+    rows, x, y, row_phasing = rows[moved], x[moved], y[moved], row_phasing[moved]
+    agent[rows, _X] = x
+    agent[rows, _Y] = y
+
+    lava = planes[rows, _LAVA, y, x].astype(np.int32)
+    hit = (lava > 0) & ~row_phasing
+    if hit.any():
+        _damage(agent, effects, rows[hit], lava[hit] * HAZARD_DAMAGE)
+
+    done = _check_end(planes, agent, rows)
+    moving[rows[done]] = False
+
+
+def _check_end(
+    planes: NDArray[np.uint8], agent: NDArray[np.int32], rows: NDArray[np.intp]
+) -> NDArray[np.bool_]:
+    """Set win/lose for ``rows``; return which of them have ended."""
+    x, y = agent[rows, _X], agent[rows, _Y]
+    gems_left = planes[rows, _GEM].any(axis=(1, 2))
+    won = (planes[rows, _EXIT, y, x] > 0) & ~gems_left
+    agent[rows[won], _WIN] = 1
+    lost = ~won & (agent[rows, _HEALTH] <= 0)
+    agent[rows[lost], _LOSE] = 1
+    return won | lost
+
+
+def _unlock(
+    planes: NDArray[np.uint8], agent: NDArray[np.int32], rows: NDArray[np.intp]
+) -> None:
+    height, width = planes.shape[-2:]
+    for offset_x, offset_y in _UNLOCK_OFFSETS:
+        x = agent[rows, _X] + offset_x
+        y = agent[rows, _Y] + offset_y
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        cell_rows, x, y = rows[inside], x[inside], y[inside]
+        count = np.minimum(
+            planes[cell_rows, _LOCKED, y, x].astype(np.int32), agent[cell_rows, _KEYS]
+        )
+        planes[cell_rows, _LOCKED, y, x] -= count.astype(np.uint8)
+        planes[cell_rows, _UNLOCKED, y, x] += count.astype(np.uint8)
+        agent[cell_rows, _KEYS] -= count
+
+
+def _pick_up(
+    planes: NDArray[np.uint8],
+    agent: NDArray[np.int32],
+    effects: NDArray[np.int32],
+    rows: NDArray[np.intp],
+) -> None:
+    x, y = agent[rows, _X], agent[rows, _Y]
+    cell = planes[rows, :, y, x].astype(np.int32)
+    agent[rows, _COINS] += cell[:, _COIN]
+    agent[rows, _SCORE] += cell[:, _COIN] * COIN_REWARD
+    agent[rows, _GEMS] += cell[:, _GEM]
+    agent[rows, _KEYS] += cell[:, _KEY]
+    for plane in (_COIN, _GEM, _KEY, _SPEED, _SHIELD, _PHASING):
+        planes[rows, plane, y, x] = 0
+
+    # Power-ups are rare enough to add one board at a time.
+    for i in np.flatnonzero(cell[:, [_SPEED, _SHIELD, _PHASING]].any(axis=1)):
+        slots = np.flatnonzero(effects[rows[i], :, 0] == EFFECT_NONE)
+        for cls, (kind, plane) in _POWERUPS.items():
+            count = int(cell[i, plane])
+            if count > len(slots):
+                raise ValueError("No free effect slot for a picked up power-up.")
+            amount = _effect_amount(_DEFAULTS[cls])
+            effects[rows[i], slots[:count]] = (kind, amount)
+            slots = slots[count:]
+
+
+def _step_arrays(
+    planes: NDArray[np.uint8],
+    agent: NDArray[np.int32],
+    effects: NDArray[np.int32],
+    actions: NDArray[np.int64],
+) -> None:
+    """Advance batched board arrays in place."""
+    active = (agent[:, _WIN] == 0) & (agent[:, _LOSE] == 0)
+    kinds = effects[..., 0]
+
+    moving = active & _IS_MOVE[actions]
+    if moving.any():
+        dx, dy = _DX[actions], _DY[actions]
+        phasing = (kinds == EFFECT_PHASING).any(axis=1)
+        substeps = np.where(
+            (kinds == EFFECT_SPEED).any(axis=1), SPEED_POWERUP_MULTIPLIER, 1
+        )
+        for substep in range(SPEED_POWERUP_MULTIPLIER):
+            moving &= substeps > substep
+            if not moving.any():
+                break
+            _substep(planes, agent, effects, moving, dx, dy, phasing)
+
+    unlocking = np.flatnonzero(active & (actions == _USE_KEY))
+    if unlocking.size:
+        _unlock(planes, agent, unlocking)
+    picking = np.flatnonzero(active & (actions == _PICK_UP))
+    if picking.size:
+        _pick_up(planes, agent, effects, picking)
+
+    rows = np.flatnonzero(active)
+    x, y = agent[rows, _X], agent[rows, _Y]
+    agent[rows, _SCORE] -= FLOOR_COST * planes[rows, _FLOOR, y, x].astype(np.int32)
+
+    timed = np.isin(effects[..., 0], _TIMED_EFFECTS) & (effects[..., 1] > 0)
+    timed &= active[:, None]
+    effects[..., 1][timed] -= 1
+    effects[timed & (effects[..., 1] == 0)] = 0
+
+    agent[rows, _TURN] += 1
+    ended = (agent[rows, _WIN] == 1) | _check_end(planes, agent, rows)
+    turn_limit = agent[rows, _TURN_LIMIT]
+    out_of_time = ~ended & (turn_limit >= 0) & (agent[rows, _TURN] >= turn_limit)
+    agent[rows[out_of_time], _LOSE] = 1
+
+
+def step_batch(board: Bitboard, actions: Any) -> Bitboard:
+    """Advance every board of a batched Bitboard by one action each.
+
+    Args:
+        board: A batched board (see ``stack``).
+        actions: One ``Action`` or action index per board.
+
+    Returns:
+        A new batched board; ``board`` is not modified.
+    """
+    assert board.batched, "step_batch needs a batched board; use step() instead."
+    if isinstance(actions, np.ndarray) and actions.dtype.kind in "iu":
+        action_array = actions.astype(np.int64, copy=False)
+    else:
+        action_array = np.array([action_index(a) for a in actions], dtype=np.int64)
+    assert action_array.shape == (board.planes.shape[0],)
+    next_board = board.copy()
+    _step_arrays(next_board.planes, next_board.agent, next_board.effects, action_array)
+    return next_board
+
+
+def step(board: Bitboard, action: Action | int) -> Bitboard:
+    """Advance an unbatched Bitboard by one action (see the module rules)."""
+    assert not board.batched, "step needs an unbatched board; use step_batch()."
+    planes = board.planes[None].copy()
+    agent = board.agent[None].copy()
+    effects = board.effects[None].copy()
+    _step_arrays(planes, agent, effects, np.array([action_index(action)]))
+    return Bitboard(planes[0], agent[0], effects[0], board.levels)
+
+
+__all__ = [
+    "AGENT_FIELDS",
+    "AGENT_INDEX",
+    "EFFECT_NONE",
+    "EFFECT_PHASING",
+    "EFFECT_SHIELD",
+    "EFFECT_SPEED",
+    "PLANES",
+    "PLANE_INDEX",
+    "Bitboard",
+    "LevelInfo",
+    "action_index",
+    "from_gridstate",
+    "from_state",
+    "stack",
+    "step",
+    "step_batch",
+    "to_gridstate",
+    "to_state",
+    "to_tensor",
+    "unstack",
+]
@@ -0,0 +1,207 @@
+"""Memoizing LRU cache for Grid Adventure transitions.
+
+``step`` is deterministic given the State (including its seed), so a
+``(state, action)`` pair seen before can return the stored next state instead
+of recomputing it. ``TransitionCache`` keys transitions on the canonical
+fingerprint of ``grid_adventure.hashing`` plus the action index and evicts the
+least recently used entries beyond ``maxsize`` entries, ``max_entities``
+cached entities or ``max_bytes`` measured bytes.
+
+A cache hit returns the next state computed for an earlier, fingerprint-equal
+state. Fingerprints ignore entity ids, so State transitions are also keyed on
+the agent's entity id: the returned State keeps the caller's ``agent_id``, and
+is equal to a fresh step up to the ids of other entities and ``message``.
+Returned States are immutable; returned GridStates are shared with the cache
+and must not be mutated.
+"""
+
+import gc
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, ModuleType
+
+from grid_universe.actions import Action
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+
+from grid_adventure import grid
+from grid_adventure.bitboard import action_index
+from grid_adventure.hashing import Fingerprinter
+from grid_adventure.step import step as adv_step
+
+DEFAULT_CACHE_SIZE = 65536
+
+_ACTIONS = tuple(Action)
+
+# (snapshot kind, fingerprint, agent entity ids, action index)
+CacheKey = tuple[str, int, tuple[int, ...], int]
+
+
+def entity_count(snapshot: State | GridState) -> int:
+    """Return the number of positioned entities of a snapshot.
+
+    This is the weight counted against ``max_entities``. It is a proxy for
+    memory, not a byte count: consecutive States share most of their
+    persistent maps, so the memory held per cached entity varies.
+    """
+    if isinstance(snapshot, GridState):
+        return sum(len(cell) for column in snapshot.grid for cell in column)
+    return len(snapshot.position)
+
+
+# Shared program objects a snapshot may reference; they are not part of it.
+_NOT_SNAPSHOT_DATA = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+def snapshot_nbytes(snapshot: State | GridState) -> int:
+    """Return the bytes of the objects reachable from a snapshot.
+
+    This is the weight counted against ``max_bytes``: ``sys.getsizeof`` of
+    every object reachable through ``gc.get_referents``, each counted once,
+    skipping classes, modules and functions. Consecutive States share most of
+    their persistent maps, and the shared objects are counted in every
+    snapshot that reaches them, so the total over cached snapshots is an upper
+    bound of the memory they hold.
+    """
+    seen: set[int] = set()
+    stack: list[object] = [snapshot]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _NOT_SNAPSHOT_DATA):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    entities: int
+    max_entities: int | None
+    nbytes: int
+    max_bytes: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TransitionCache:
+    """LRU cache of ``step`` results for States and GridStates.
+
+    Args:
+        maxsize: Maximum number of cached transitions.
+        max_entities: Optional limit on the total weight of cached next states.
+        weight: Weight of a cached snapshot (default ``entity_count``).
+        step_fn: The State step function to memoize.
+        max_bytes: Optional limit on the total ``snapshot_nbytes`` of cached
+            next states. Measuring walks the whole snapshot, so it is only done
+            when this limit is set.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        max_entities: int | None = None,
+        weight: Callable[[State | GridState], int] = entity_count,
+        step_fn: Callable[[State, Action], State] = adv_step,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_entities = max_entities
+        self.max_bytes = max_bytes
+        self.weight = weight
+        self.step_fn = step_fn
+        self._fingerprinter = Fingerprinter()
+        # key -> (next snapshot, weight, measured bytes)
+        self._entries: OrderedDict[CacheKey, tuple[State | GridState, int, int]] = (
+            OrderedDict()
+        )
+        self._entities = self._nbytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key: CacheKey) -> State | GridState | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _store(self, key: CacheKey, value: State | GridState) -> None:
+        weight = self.weight(value)
+        nbytes = 0 if self.max_bytes is None else snapshot_nbytes(value)
+        self._entries[key] = (value, weight, nbytes)
+        self._entities += weight
+        self._nbytes += nbytes
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.max_entities is not None and self._entities > self.max_entities)
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            _, (_, evicted, evicted_bytes) = self._entries.popitem(last=False)
+            self._entities -= evicted
+            self._nbytes -= evicted_bytes
+            self._evictions += 1
+
+    def step(self, state: State, action: Action | int) -> State:
+        """Memoized ``grid_adventure.step.step``."""
+        index = action_index(action)
+        agents = tuple(sorted(state.agent.keys()))
+        key = ("state", self._fingerprinter.state(state), agents, index)
+        cached = self._lookup(key)
+        if cached is not None:
+            assert isinstance(cached, State)
+            return cached
+        next_state = self.step_fn(state, _ACTIONS[index])
+        self._store(key, next_state)
+        return next_state
+
+    def grid_step(
+        self, gridstate: GridState, action: Action | int, incremental: bool = False
+    ) -> GridState:
+        """Memoized ``grid_adventure.grid.step``."""
+        index = action_index(action)
+        key = ("grid", self._fingerprinter.gridstate(gridstate), (), index)
+        cached = self._lookup(key)
+        if cached is not None:
+            assert isinstance(cached, GridState)
+            return cached
+        next_gridstate = grid.step(gridstate, _ACTIONS[index], incremental)
+        self._store(key, next_gridstate)
+        return next_gridstate
+
+    def __call__(self, state: State, action: Action | int) -> State:
+        return self.step(state, action)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self._entries),
+            self.maxsize,
+            self._entities,
+            self.max_entities,
+            self._nbytes,
+            self.max_bytes,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._entities = self._nbytes = 0
+        self._hits = self._misses = self._evictions = 0
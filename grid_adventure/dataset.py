@@ -0,0 +1,352 @@
+"""Chunked trajectory datasets for imitation and offline RL.
+
+A dataset is a directory of shards (``shard_00000``, ``shard_00001``, ...),
+each holding up to ``chunk_size`` rows as one ``.npy`` file per column. A row
+is one observation of an episode: the array entries of the observation
+(``obs_<key>.npy``, e.g. ``obs_image`` or ``obs_grid``/``obs_vector``), the
+status of the State it was taken in (``score``, ``turn``, ``phase`` as an
+index into ``PHASES``, the fields of the ``info["status"]`` of image
+observations), and the transition taken from it (``action``, ``reward``,
+``terminated``, ``truncated``) with its ``episode`` and ``step``. The last
+observation of an episode gets its own row with ``action`` -1, so every
+transition row's next observation is the following row.
+
+``TrajectoryWriter`` fills a preallocated chunk and hands full chunks to a
+background thread, which writes each shard under a temporary name and renames
+it when complete; stepping only waits if a chunk fills up before the previous
+one is written. ``TrajectoryDataset`` memory-maps the shards and samples
+minibatches of transitions across them, reading only the sampled rows.
+"""
+
+import os
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Self
+
+import gymnasium
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.state import State
+from numpy.typing import NDArray
+
+from grid_adventure.bitboard import action_index
+from grid_adventure.env import GridAdventureEnv
+
+DEFAULT_CHUNK_SIZE = 4096
+
+PHASES: tuple[str, ...] = ("ongoing", "win", "lose")
+
+_SHARD_PREFIX = "shard_"
+_OBS_PREFIX = "obs_"
+# Column -> dtype of the non-observation columns.
+_COLUMNS: dict[str, Any] = {
+    "action": np.int8,
+    "reward": np.float32,
+    "terminated": np.bool_,
+    "truncated": np.bool_,
+    "episode": np.int64,
+    "step": np.int32,
+    "score": np.int32,
+    "turn": np.int32,
+    "phase": np.uint8,
+}
+
+
+def _observation_arrays(obs: Any) -> dict[str, NDArray[Any]]:
+    """Return the array entries of an image or tensor observation."""
+    if not isinstance(obs, Mapping):
+        raise TypeError(
+            "Trajectory datasets need image or tensor observations, "
+            f"got {type(obs).__name__}."
+        )
+    return {key: value for key, value in obs.items() if isinstance(value, np.ndarray)}
+
+
+def _copy_arrays(obs: Any) -> dict[str, NDArray[Any]]:
+    return {key: value.copy() for key, value in _observation_arrays(obs).items()}
+
+
+def _phase(state: State) -> int:
+    return PHASES.index("win" if state.win else "lose" if state.lose else "ongoing")
+
+
+def _shards(directory: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in directory.glob(f"{_SHARD_PREFIX}*")
+        if path.is_dir() and path.name[len(_SHARD_PREFIX) :].isdigit()
+    )
+
+
+def _write_shard(path: Path, columns: dict[str, NDArray[Any]], rows: int) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.mkdir(parents=True, exist_ok=True)
+    for name, column in columns.items():
+        np.save(tmp / f"{name}.npy", column[:rows])
+    os.replace(tmp, path)
+
+
+class TrajectoryWriter:
+    """Append trajectories to a dataset directory.
+
+    Call ``add`` once per step with the observation the action was taken from,
+    then ``end_episode`` with the final observation. The observation arrays of
+    the first call fix the observation columns. Writing to a directory that
+    already holds shards continues its shard and episode numbering.
+
+    Args:
+        directory: Dataset directory (created if missing).
+        chunk_size: Rows per shard.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        shards = _shards(self.directory)
+        self._next_shard = (
+            int(shards[-1].name[len(_SHARD_PREFIX) :]) + 1 if shards else 0
+        )
+        self.episode = (
+            int(np.load(shards[-1] / "episode.npy", mmap_mode="r")[-1]) + 1
+            if shards
+            else 0
+        )
+        self._step = 0
+        self._rows = 0
+        # Two sets of column buffers: one filled by ``add`` while the other is
+        # being written.
+        self._buffers: list[dict[str, NDArray[Any]]] = []
+        self._columns: dict[str, NDArray[Any]] | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Future[None] | None = None
+
+    def _allocate(self, arrays: dict[str, NDArray[Any]]) -> dict[str, NDArray[Any]]:
+        columns = {
+            _OBS_PREFIX + key: np.empty((self.chunk_size, *a.shape), a.dtype)
+            for key, a in arrays.items()
+        }
+        for name, dtype in _COLUMNS.items():
+            columns[name] = np.empty(self.chunk_size, dtype)
+        return columns
+
+    def _append(
+        self,
+        obs: Any,
+        state: State,
+        action: int,
+        reward: float,
+        terminated: bool,
+        truncated: bool,
+    ) -> None:
+        arrays = _observation_arrays(obs)
+        if self._columns is None:
+            self._buffers = [self._allocate(arrays), self._allocate(arrays)]
+            self._columns = self._buffers[0]
+        columns, row = self._columns, self._rows
+        for key, value in arrays.items():
+            columns[_OBS_PREFIX + key][row] = value
+        columns["action"][row] = action
+        columns["reward"][row] = reward
+        columns["terminated"][row] = terminated
+        columns["truncated"][row] = truncated
+        columns["episode"][row] = self.episode
+        columns["step"][row] = self._step
+        columns["score"][row] = state.score
+        columns["turn"][row] = state.turn
+        columns["phase"][row] = _phase(state)
+        self._rows += 1
+        if self._rows == self.chunk_size:
+            self._flush()
+
+    def add(
+        self,
+        obs: Any,
+        state: State,
+        action: Action | int,
+        reward: float,
+        terminated: bool,
+        truncated: bool,
+    ) -> None:
+        """Append the transition taken from ``obs`` (observed in ``state``)."""
+        self._append(obs, state, action_index(action), reward, terminated, truncated)
+        self._step += 1
+
+    def end_episode(self, obs: Any, state: State) -> None:
+        """Append the final observation of the episode and start a new one."""
+        self._append(obs, state, -1, 0.0, False, False)
+        self.episode += 1
+        self._step = 0
+
+    def _flush(self) -> None:
+        if self._rows == 0:
+            return
+        assert self._columns is not None
+        self._wait()
+        path = self.directory / f"{_SHARD_PREFIX}{self._next_shard:05d}"
+        self._pending = self._executor.submit(
+            _write_shard, path, self._columns, self._rows
+        )
+        self._next_shard += 1
+        self._buffers.reverse()
+        self._columns = self._buffers[0]
+        self._rows = 0
+
+    def _wait(self) -> None:
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def close(self) -> None:
+        """Write the rows of the current, partial chunk and wait for all writes."""
+        self._flush()
+        self._wait()
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class DatasetRecorder(gymnasium.Wrapper):  # type: ignore[type-arg]
+    """Write every transition of a ``GridAdventureEnv`` to a ``TrajectoryWriter``.
+
+    An episode ends when it terminates or is truncated, or when ``reset`` is
+    called before that. Closing the recorder does not close the writer.
+
+    Each observation is written one step after it is returned, together with
+    the action taken from it, so the recorder keeps a copy of its arrays: an
+    environment rendering into recycled ``image_buffers`` overwrites them.
+    """
+
+    def __init__(
+        self,
+        env: gymnasium.Env,  # type: ignore[type-arg]
+        writer: TrajectoryWriter,
+    ) -> None:
+        super().__init__(env)
+        if not isinstance(env.unwrapped, GridAdventureEnv):
+            raise TypeError("DatasetRecorder needs a GridAdventureEnv.")
+        self.writer = writer
+        self._last: tuple[Any, State] | None = None
+
+    def _end_episode(self) -> None:
+        if self._last is not None:
+            self.writer.end_episode(*self._last)
+            self._last = None
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        self._end_episode()
+        obs, info = self.env.reset(seed=seed, options=options)
+        self._last = (_copy_arrays(obs), self.env.unwrapped.state)
+        return obs, info
+
+    def step(
+        self, action: Action | int
+    ) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        if self._last is not None:
+            self.writer.add(*self._last, action, reward, terminated, truncated)
+        self._last = (_copy_arrays(obs), self.env.unwrapped.state)
+        if terminated or truncated:
+            self._end_episode()
+        return obs, reward, terminated, truncated, info
+
+    def close(self) -> None:
+        self._end_episode()
+        super().close()
+
+
+class TrajectoryDataset:
+    """Memory-mapped, read-only view of a dataset directory.
+
+    ``sample`` draws transitions uniformly across shards and returns a batch
+    dictionary of the columns (``obs`` and ``next_obs`` as dictionaries of the
+    observation arrays); only the sampled rows are read from disk.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self._shards: list[dict[str, NDArray[Any]]] = [
+            {
+                path.stem: np.load(path, mmap_mode="r")
+                for path in sorted(shard.glob("*.npy"))
+            }
+            for shard in _shards(self.directory)
+        ]
+        sizes = [len(shard["action"]) for shard in self._shards]
+        self._offsets = np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+        actions = self._concatenate("action")
+        episodes = self._concatenate("episode")
+        # Global indices of the transition rows followed by their next
+        # observation (a writer closed mid-episode leaves the last one without).
+        has_next = np.zeros(len(actions), np.bool_)
+        has_next[:-1] = episodes[1:] == episodes[:-1]
+        self._transitions = np.flatnonzero((actions >= 0) & has_next)
+        self.obs_keys = (
+            [
+                name[len(_OBS_PREFIX) :]
+                for name in self._shards[0]
+                if name.startswith(_OBS_PREFIX)
+            ]
+            if self._shards
+            else []
+        )
+
+    def _concatenate(self, name: str) -> NDArray[Any]:
+        if not self._shards:
+            return np.zeros(0, _COLUMNS[name])
+        return np.concatenate([shard[name] for shard in self._shards])
+
+    def __len__(self) -> int:
+        """Number of transitions."""
+        return len(self._transitions)
+
+    @property
+    def num_rows(self) -> int:
+        return int(self._offsets[-1])
+
+    @property
+    def num_shards(self) -> int:
+        return len(self._shards)
+
+    def rows(self, name: str, indices: Any) -> NDArray[Any]:
+        """Gather a column at global row ``indices``, one read per shard."""
+        indices = np.asarray(indices, dtype=np.int64)
+        shard_of = np.searchsorted(self._offsets, indices, side="right") - 1
+        first = self._shards[0][name] if self._shards else np.zeros(0)
+        out = np.empty((len(indices), *first.shape[1:]), first.dtype)
+        for shard in np.unique(shard_of):
+            mask = shard_of == shard
+            local = indices[mask] - self._offsets[shard]
+            order = np.argsort(local)
+            # Sorted reads keep the memory-mapped accesses sequential.
+            gathered = self._shards[shard][name][local[order]]
+            positions = np.flatnonzero(mask)[order]
+            out[positions] = gathered
+        return out
+
+    def sample(
+        self, batch_size: int, rng: np.random.Generator | None = None
+    ) -> dict[str, Any]:
+        """Sample a minibatch of transitions uniformly with replacement."""
+        if not len(self):
+            raise ValueError("The dataset holds no transitions.")
+        rng = np.random.default_rng() if rng is None else rng
+        indices = self._transitions[rng.integers(len(self), size=batch_size)]
+        batch: dict[str, Any] = {
+            "obs": {k: self.rows(_OBS_PREFIX + k, indices) for k in self.obs_keys},
+            "next_obs": {
+                k: self.rows(_OBS_PREFIX + k, indices + 1) for k in self.obs_keys
+            },
+        }
+        for name in _COLUMNS:
+            batch[name] = self.rows(name, indices)
+        return batch
@@ -1,5 +1,5 @@
-from pyrsistent import pset
 from dataclasses import dataclass, field
+from typing import TypeVar, cast
 
 from grid_universe.components.effects.immunity import Immunity
 from grid_universe.components.effects.phasing import Phasing
@@ -23,12 +23,13 @@ from grid_universe.components.properties.requirable import Requirable
 from grid_universe.components.properties.rewardable import Rewardable
 from grid_universe.components.properties.status import Status
 from grid_universe.grid.entity import BaseEntity
+from pyrsistent import pset
 
 from grid_adventure.constants import (
-    DEFAULT_AGENT_HEALTH,
     COIN_REWARD,
-    HAZARD_DAMAGE,
+    DEFAULT_AGENT_HEALTH,
     FLOOR_COST,
+    HAZARD_DAMAGE,
     KEY_DOOR_ID,
     PHASING_POWERUP_DURATION,
     SHIELD_POWERUP_USAGE,
@@ -36,6 +37,8 @@ from grid_adventure.constants import (
     SPEED_POWERUP_MULTIPLIER,
 )
 
+EntityT = TypeVar("EntityT", bound=BaseEntity)
+
 
 # Base entity classes with common components.
 
@@ -161,6 +164,136 @@ class PhasingPowerUpEntity(CollectibleEntity):
     time_limit: TimeLimit = TimeLimit(amount=PHASING_POWERUP_DURATION)
 
 
+# Slotted variants.
+#
+# Each slotted class subclasses its regular counterpart, so ``isinstance``
+# checks against the regular classes keep working. ``BaseEntity`` comes from
+# grid_universe and is not slotted, so instances still have ``__dict__`` and
+# ``__weakref__`` slots; every component field lives in a slot and the dict is
+# only allocated if something sets an attribute outside the dataclass fields.
+# How much this saves depends on the number of fields: CPython 3.11 stores up to
+# 29 instance attributes inline without a dict, so below that the slots only
+# save a few words per entity. ``benchmarks/bench_entities.py`` reports the
+# bytes per entity and how many attributes ended up in ``__dict__``.
+
+
+@dataclass(repr=False, slots=True)
+class SlottedAgentEntity(AgentEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedFloorEntity(FloorEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedWallEntity(WallEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedExitEntity(ExitEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedCoinEntity(CoinEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedGemEntity(GemEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedKeyEntity(KeyEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedLockedDoorEntity(LockedDoorEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedUnlockedDoorEntity(UnlockedDoorEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedBoxEntity(BoxEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedLavaEntity(LavaEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedSpeedPowerUpEntity(SpeedPowerUpEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedShieldPowerUpEntity(ShieldPowerUpEntity):
+    pass
+
+
+@dataclass(repr=False, slots=True)
+class SlottedPhasingPowerUpEntity(PhasingPowerUpEntity):
+    pass
+
+
+# Mapping from regular entity classes to their slotted variants.
+SLOTTED_ENTITY_TYPES: dict[type[BaseEntity], type[BaseEntity]] = {
+    AgentEntity: SlottedAgentEntity,
+    FloorEntity: SlottedFloorEntity,
+    WallEntity: SlottedWallEntity,
+    ExitEntity: SlottedExitEntity,
+    CoinEntity: SlottedCoinEntity,
+    GemEntity: SlottedGemEntity,
+    KeyEntity: SlottedKeyEntity,
+    LockedDoorEntity: SlottedLockedDoorEntity,
+    UnlockedDoorEntity: SlottedUnlockedDoorEntity,
+    BoxEntity: SlottedBoxEntity,
+    LavaEntity: SlottedLavaEntity,
+    SpeedPowerUpEntity: SlottedSpeedPowerUpEntity,
+    ShieldPowerUpEntity: SlottedShieldPowerUpEntity,
+    PhasingPowerUpEntity: SlottedPhasingPowerUpEntity,
+}
+
+
+# Flyweight background entities.
+#
+# Floors and walls never change during an episode, so component-equal instances
+# can be shared between cells. Shared instances carry no entity id; each cell
+# they occupy still becomes its own entity when converted to a State. They must
+# be treated as immutable.
+
+BACKGROUND_ENTITY_TYPES: tuple[type[BaseEntity], ...] = (FloorEntity, WallEntity)
+
+_SHARED_ENTITIES: dict[type[BaseEntity], BaseEntity] = {}
+
+
+def shared_entity(entity_cls: type[EntityT]) -> EntityT:
+    """Return the shared default instance of a background entity class.
+
+    Raises:
+        ValueError: If ``entity_cls`` is not in ``BACKGROUND_ENTITY_TYPES``.
+    """
+    if not issubclass(entity_cls, BACKGROUND_ENTITY_TYPES):
+        raise ValueError(  # noqa: TRY004
+            f"{entity_cls.__name__} is not a background entity class."
+        )
+    entity = _SHARED_ENTITIES.get(entity_cls)
+    if entity is None:
+        entity = _SHARED_ENTITIES[entity_cls] = entity_cls()
+    return cast(EntityT, entity)
+
+
 # Helper functions to create entities with specific configurations.
 
 
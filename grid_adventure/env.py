@@ -1,13 +1,41 @@
-from collections.abc import Callable
-from typing import Any
+from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from grid_universe.actions import Action
 from grid_universe.state import State
+from grid_universe.types import EntityID
 from grid_universe.env import GridUniverseEnv, ImageObservation
-from grid_universe.renderer.image import ImageMap, DEFAULT_RESOLUTION
+from grid_universe.grid.convert import from_state as base_from_state
 from grid_universe.grid.gridstate import GridState
 
-from grid_adventure.grid import from_state
-from grid_adventure.rendering import DEFAULT_ASSET_ROOT, IMAGE_MAP
+from grid_adventure import bitboard
+from grid_adventure.grid import (
+    EntityPool,
+    lazy_from_state,
+    specialize_entities,
+)
+from grid_adventure.observation import (
+    TensorObservation,
+    image_info,
+    state_to_tensor,
+    tensor_observation_space,
+)
+from grid_adventure.profiling import StepProfiler
+
+# The renderers (and PIL behind them) are imported when an environment needs
+# them, so importing the module for gridstate or tensor workers stays cheap.
+if TYPE_CHECKING:
+    from grid_universe.renderer.image import ImageMap
+
+    from grid_adventure.rendering import FrameBuffers, TileRenderer
+
+_SCORE, _WIN, _LOSE = (bitboard.AGENT_INDEX[name] for name in ("score", "win", "lose"))
 
 
 class GridAdventureEnv(GridUniverseEnv):
@@ -15,34 +43,294 @@ class GridAdventureEnv(GridUniverseEnv):
 
     This class extends the base `GridUniverseEnv` to incorporate
     Grid Adventure-specific configurations, entities, and objectives.
+
+    Besides the base `"image"` and `"gridstate"` observation types, it supports
+    `observation_type="tensor"`, which returns a `TensorObservation` built
+    directly from the State (see `grid_adventure.observation`).
+
+    With `step_backend="bitboard"`, steps run on the NumPy engine of
+    `grid_adventure.bitboard` instead of the reference `step`; see that module
+    for the rules and the parity guarantee. The board is then the source of
+    truth: tensor and `"gridstate"` observations are built from its arrays, and
+    `state` (with a new `agent_id`) is only rebuilt from the board when it is
+    read, e.g. for image observations and `render()`. Rewards, `terminated`
+    (reaching the turn limit is a loss), `truncated` and `info` are those of
+    the reference backend.
+
+    With `render_backend="tiles"`, image observations and `render()` use the
+    Grid Adventure `TileRenderer`, whose sprites are decoded and resized once
+    into a `SpriteAtlas` shared by all environments with the same assets. Floors,
+    walls and other static entities are cached in a background layer per
+    episode, and each step redraws only the cells whose entities changed.
+
+    With a `profiler` (a `grid_adventure.profiling.StepProfiler`), every
+    `reset` and `step` records per-phase wall time and allocations; without
+    one, the calls are not instrumented.
+
+    With `lazy_gridstate=True`, `"gridstate"` observations are
+    `grid_adventure.grid.LazyGridState` views that convert a cell only when it
+    is first read. With `pool_entities=True`, they come from the environment's
+    `grid_adventure.grid.EntityPool` (`entity_pool`), which reuses the entity
+    instances of the previous observation for unchanged entities; these
+    observations must not be mutated. With `flyweight=True`, the floors and
+    walls of `"gridstate"` observations are shared interned instances (see
+    `grid_adventure.grid.specialize_entities`) and must not be mutated either.
+
+    With `image_buffers`, image observations are rendered into recycled
+    buffers instead of a new array per call (see
+    `grid_adventure.rendering.FrameBuffers`): either a number of internal
+    buffers or a sequence of caller-supplied `(H, W, 4)` uint8 arrays, used in
+    turn. With two, the previous frame stays valid for one more step. With
+    `readonly_images=True` the frames are read-only views. The tile renderer
+    renders straight into the buffers; the base renderer's frame is copied.
+
+    `render_resolution`, `render_image_map` and `render_asset_root` default to
+    the base renderer's resolution and the Grid Adventure assets, resolved when
+    an environment is built. The resolved `render_resolution` and
+    `render_backend` are kept as attributes, e.g. for `grid_adventure.recording`
+    to replay images the same way.
     """
 
     def __init__(
         self,
         initial_state_fn: Callable[..., State],
         render_mode: str = "rgb_array",
-        render_resolution: int = DEFAULT_RESOLUTION,
-        render_image_map: ImageMap = IMAGE_MAP,
-        render_asset_root: str = DEFAULT_ASSET_ROOT,
+        render_resolution: int | None = None,
+        render_image_map: ImageMap | None = None,
+        render_asset_root: str | None = None,
         observation_type: str = "image",
+        step_backend: str = "reference",
+        render_backend: str = "base",
+        profiler: StepProfiler | None = None,
+        lazy_gridstate: bool = False,
+        pool_entities: bool = False,
+        flyweight: bool = False,
+        image_buffers: int | Sequence[NDArray[np.uint8]] | None = None,
+        readonly_images: bool = False,
         **kwargs: Any,
     ) -> None:
+        if step_backend not in ("reference", "bitboard"):
+            raise ValueError(f"Unknown step backend: {step_backend!r}")
+        if render_backend not in ("base", "tiles"):
+            raise ValueError(f"Unknown render backend: {render_backend!r}")
+        if lazy_gridstate and pool_entities:
+            raise ValueError("lazy_gridstate and pool_entities are exclusive.")
+        if image_buffers is not None and observation_type != "image":
+            raise ValueError("image_buffers needs observation_type='image'.")
+        if render_resolution is None:
+            from grid_universe.renderer.image import DEFAULT_RESOLUTION
+
+            render_resolution = DEFAULT_RESOLUTION
+        if render_image_map is None:
+            from grid_adventure.rendering import IMAGE_MAP
+
+            render_image_map = IMAGE_MAP
+        if render_asset_root is None:
+            from grid_adventure.rendering import DEFAULT_ASSET_ROOT
+
+            render_asset_root = DEFAULT_ASSET_ROOT
+        self.render_backend = render_backend
+        self.render_resolution = render_resolution
+        self._step_backend = step_backend
+        self.profiler = profiler
+        self._lazy_gridstate = lazy_gridstate
+        self._flyweight = flyweight
+        self.entity_pool = EntityPool(flyweight=flyweight) if pool_entities else None
+        self._image_buffers: FrameBuffers | None = None
+        if image_buffers is not None:
+            from grid_adventure.rendering import FrameBuffers
+
+            self._image_buffers = FrameBuffers(image_buffers, readonly=readonly_images)
+        self._board: bitboard.Bitboard | None = None
+        # Next board computed ahead of ``step`` by ``GridAdventureVectorEnv``,
+        # which steps the boards of all its slots in one batch.
+        self._stepped_board: bitboard.Bitboard | None = None
+        self._state: State | None = None
+        self._agent_id: EntityID | None = None
+        self._tile_renderer: TileRenderer | None = None
+        if render_backend == "tiles":
+            from grid_adventure.rendering import TileRenderer
+            from grid_adventure.sprites import shared_atlas
+
+            self._tile_renderer = TileRenderer(
+                resolution=render_resolution,
+                image_map=render_image_map,
+                atlas=shared_atlas(render_asset_root, render_image_map),
+                incremental=True,
+                static_background=True,
+            )
+        # The base environment only knows the image/gridstate observations;
+        # the tensor observation space is installed below.
         super().__init__(
             initial_state_fn=initial_state_fn,
             render_mode=render_mode,
             render_resolution=render_resolution,
             render_image_map=render_image_map,
             render_asset_root=render_asset_root,
-            observation_type=observation_type,
+            observation_type="gridstate"
+            if observation_type == "tensor"
+            else observation_type,
             **kwargs,
         )
+        if observation_type == "tensor":
+            self._observation_type = observation_type
+            width, height = kwargs.get("width"), kwargs.get("height")
+            if width is None or height is None:
+                sample_state = initial_state_fn()
+                width, height = sample_state.width, sample_state.height
+            self.observation_space = tensor_observation_space(width, height)
+
+    @property
+    def state(self) -> State | None:
+        self._sync_state()
+        return self._state
+
+    @state.setter
+    def state(self, state: State | None) -> None:
+        self._state = state
+
+    @property
+    def agent_id(self) -> EntityID | None:
+        self._sync_state()
+        return self._agent_id
+
+    @agent_id.setter
+    def agent_id(self, agent_id: EntityID | None) -> None:
+        self._agent_id = agent_id
+
+    def _sync_state(self) -> None:
+        """Rebuild the State and agent id from the bitboard after a step."""
+        if self._state is None and self._board is not None:
+            self._state = bitboard.to_state(self._board)
+            self._agent_id = next(iter(self._state.agent.keys()))
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        profiler = self.profiler
+        if profiler is None:
+            return self._reset(seed, options)
+        profiler.begin("reset")
+        obs, info = self._reset(seed, options)
+        sample = profiler.end()
+        if profiler.include_in_info:
+            info = {**info, "profile": sample}
+        return obs, info
+
+    def _reset(
+        self, seed: int | None, options: dict[str, Any] | None
+    ) -> tuple[Any, dict[str, Any]]:
+        if self._tile_renderer is not None:
+            self._tile_renderer.reset()
+        self._board = self._stepped_board = None
+        obs, info = super().reset(seed=seed, options=options)
+        if self._step_backend == "bitboard":
+            assert self.state is not None
+            self._board = bitboard.from_state(self.state)
+        return obs, info
 
-    def _get_obs(self) -> ImageObservation | GridState:
+    def step(
+        self, action: Action | int
+    ) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        profiler = self.profiler
+        if profiler is None:
+            return self._step(action)
+        profiler.begin("step")
+        obs, reward, terminated, truncated, info = self._step(action)
+        sample = profiler.end()
+        if profiler.include_in_info:
+            info = {**info, "profile": sample}
+        return obs, reward, terminated, truncated, info
+
+    def _step(
+        self, action: Action | int
+    ) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        if self._step_backend == "reference":
+            return super().step(action)
+        assert self._board is not None
+        prev_score = int(self._board.agent[_SCORE])
+        board, self._stepped_board = self._stepped_board, None
+        self._board = bitboard.step(self._board, action) if board is None else board
+        self._state = None
+        agent = self._board.agent
+        reward = float(agent[_SCORE] - prev_score)
+        terminated = bool(agent[_WIN] or agent[_LOSE])
+        return self._get_obs(), reward, terminated, False, self._get_info()
+
+    def _get_obs(self) -> ImageObservation | GridState | TensorObservation:
         """
         Get the current observation from the environment. If the observation type is 'gridstate',
-        return a specialized GridState view; otherwise, return the standard observation.
+        return a specialized GridState view; if it is 'tensor', return a TensorObservation;
+        otherwise, return the standard observation.
         """
+        if self._board is not None:
+            board_obs = self._board_obs()
+            if board_obs is not None:
+                return board_obs
         assert self.state is not None and self.agent_id is not None
         if self._observation_type == "gridstate":
-            return from_state(self.state)
-        return super()._get_obs()
+            if self._lazy_gridstate:
+                with self._phase("from_state"):
+                    return lazy_from_state(self.state, flyweight=self._flyweight)
+            if self.entity_pool is not None:
+                with self._phase("from_state"):
+                    return self.entity_pool.from_state(self.state)
+            with self._phase("from_state"):
+                base_gridstate = base_from_state(self.state)
+            with self._phase("specialize"):
+                return specialize_entities(base_gridstate, flyweight=self._flyweight)
+        if self._observation_type == "tensor":
+            with self._phase("tensor"):
+                return state_to_tensor(self.state, self.agent_id)
+        if self._tile_renderer is not None:
+            with self._phase("render"):
+                image = self._render_tiles()
+            with self._phase("info"):
+                info = image_info(self.state, self.agent_id)
+            return ImageObservation(image=image, info=info)  # type: ignore[typeddict-item]
+        with self._phase("render"):
+            return self._base_image_obs()
+
+    def _phase(self, name: str) -> AbstractContextManager[object]:
+        """Profiler phase ``name``, or a no-op context without a profiler."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
+    def _board_obs(self) -> GridState | TensorObservation | None:
+        """Observation built from the bitboard, or None if it needs a State."""
+        assert self._board is not None
+        if self._observation_type == "tensor":
+            with self._phase("tensor"):
+                return bitboard.to_tensor(self._board)
+        if (
+            self._observation_type == "gridstate"
+            and not self._lazy_gridstate
+            and self.entity_pool is None
+        ):
+            with self._phase("from_state"):
+                return bitboard.to_gridstate(self._board, flyweight=self._flyweight)
+        return None
+
+    def _render_tiles(self) -> NDArray[np.uint8]:
+        assert self._tile_renderer is not None and self.state is not None
+        buffers = self._image_buffers
+        if buffers is None:
+            return self._tile_renderer.render(self.state)
+        out = buffers.next(self._tile_renderer.frame_shape(self.state))
+        self._tile_renderer.render(self.state, out=out)
+        return buffers.publish()
+
+    def _base_image_obs(self) -> ImageObservation:
+        obs = super()._get_obs()
+        buffers = self._image_buffers
+        if buffers is not None:
+            image = obs["image"]
+            np.copyto(buffers.next(image.shape), image)
+            obs["image"] = buffers.publish()
+        return obs
+
+    def render(self) -> Any:
+        if self._tile_renderer is not None and self.state is not None:
+            return self._tile_renderer.render_image(self.state)
+        return super().render()
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import copy
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import Field, dataclass, fields, replace
+from typing import Any, get_args, get_origin, get_type_hints, overload
+
+from pyrsistent import PMap, pmap
+
 from grid_universe.state import State
+from grid_universe.types import EntityID
 from grid_universe.grid.gridstate import GridState
 from grid_universe.grid.convert import from_state as base_from_state
 from grid_universe.grid.convert import to_state as base_to_state
 from grid_universe.grid.entity import BaseEntity, copy_entity_components
 from grid_universe.grid.step import step as base_step
+from grid_universe.step import step as state_step
 from grid_universe.actions import Action
 
 # Specialized entity classes from Grid Adventure
 from grid_adventure.entities import (
+    BACKGROUND_ENTITY_TYPES,
+    SLOTTED_ENTITY_TYPES,
     AgentEntity,
     FloorEntity,
     WallEntity,
@@ -26,7 +38,7 @@ from grid_adventure.entities import (
     PhasingPowerUpEntity,
 )
 
-SpecializedTypes = (
+SpecializedTypes: tuple[type[BaseEntity], ...] = (
     AgentEntity,
     FloorEntity,
     WallEntity,
@@ -43,89 +55,272 @@ SpecializedTypes = (
     PhasingPowerUpEntity,
 )
 
+_ENTITY_STORE_ANNOTATION = re.compile(r"(?:\w+\.)*PMap\[\s*(?:\w+\.)*EntityID\b")
+
+
+def _is_entity_store(field: Field[Any], hints: dict[str, Any]) -> bool:
+    """Return True if a State field is annotated ``PMap[EntityID, ...]``."""
+    hint = hints.get(field.name, field.type)
+    if isinstance(hint, str):
+        return _ENTITY_STORE_ANNOTATION.match(hint) is not None
+    origin = get_origin(hint)
+    return getattr(origin, "__name__", None) == "PMap" and get_args(hint)[:1] == (
+        EntityID,
+    )
 
-def _specialize_single(obj: BaseEntity) -> BaseEntity:
+
+def entity_stores() -> tuple[str, ...]:
+    """Names of the State fields that map entity ids to a value.
+
+    These are the component stores plus ``position``. Annotations that cannot
+    be resolved are matched as text.
     """
-    Return a specialized Grid Adventure entity based on components/appearance.
-    Keeps obj unchanged if it is already specialized.
+    try:
+        hints = get_type_hints(State)
+    except (NameError, TypeError):
+        hints = {}
+    return tuple(f.name for f in fields(State) if _is_entity_store(f, hints))
+
+
+# Component attributes compared on entities: one per State component store
+# (``position`` is the cell, not a component). Stores without a matching
+# entity attribute simply read as None.
+_ENTITY_STORES = entity_stores()
+if "position" not in _ENTITY_STORES:
+    raise ImportError("grid_universe State has no PMap[EntityID, ...] stores.")
+_COMPONENT_FIELDS = tuple(name for name in _ENTITY_STORES if name != "position")
+# Nested entity lists, compared element-wise when diffing cells.
+_NESTED_FIELDS = ("inventory_list", "status_list")
+
+# (present component names, appearance name)
+Signature = tuple[tuple[str, ...], str | None]
+
+
+@dataclass(frozen=True)
+class SpecializationRule:
+    """Maps entities to a specialized class by components and appearance name.
+
+    A rule matches when every component in ``requires`` is present, none of
+    ``excludes`` is present and, if set, the appearance name equals
+    ``appearance``. Rules are tried in order; the first match wins.
     """
-    if isinstance(obj, SpecializedTypes):
-        return obj
 
-    def has(name: str) -> bool:
-        return getattr(obj, name, None) is not None
+    entity_cls: type[BaseEntity]
+    requires: frozenset[str] = frozenset()
+    excludes: frozenset[str] = frozenset()
+    appearance: str | None = None
+
+    def matches(self, components: frozenset[str], app_name: str | None) -> bool:
+        if self.appearance is not None and self.appearance != app_name:
+            return False
+        return self.requires <= components and not (self.excludes & components)
 
+
+SPECIALIZATION_RULES: list[SpecializationRule] = [
+    SpecializationRule(AgentEntity, requires=frozenset({"agent"})),
+    SpecializationRule(ExitEntity, requires=frozenset({"exit"})),
+    SpecializationRule(
+        LockedDoorEntity, requires=frozenset({"locked"}), appearance="door"
+    ),
+    SpecializationRule(UnlockedDoorEntity, appearance="door"),
+    SpecializationRule(KeyEntity, requires=frozenset({"key"})),
+    # Collectibles: power-ups first, then gem vs coin
+    SpecializationRule(
+        SpeedPowerUpEntity, requires=frozenset({"collectible", "speed"})
+    ),
+    SpecializationRule(
+        ShieldPowerUpEntity, requires=frozenset({"collectible", "immunity"})
+    ),
+    SpecializationRule(
+        PhasingPowerUpEntity, requires=frozenset({"collectible", "phasing"})
+    ),
+    SpecializationRule(
+        GemEntity, requires=frozenset({"collectible"}), appearance="core"
+    ),
+    SpecializationRule(GemEntity, requires=frozenset({"collectible", "requirable"})),
+    SpecializationRule(CoinEntity, requires=frozenset({"collectible"})),
+    SpecializationRule(BoxEntity, appearance="box"),
+    SpecializationRule(LavaEntity, appearance="lava"),
+    SpecializationRule(FloorEntity, appearance="floor"),
+    SpecializationRule(WallEntity, appearance="wall"),
+]
+
+# Memoized signature -> specialized class (None keeps the entity unchanged).
+SPECIALIZATION_TABLE: dict[Signature, type[BaseEntity] | None] = {}
+
+_specialized_types: tuple[type[BaseEntity], ...] = SpecializedTypes
+
+
+def register_specialization(rule: SpecializationRule) -> None:
+    """Register a specialization rule ahead of the built-in ones.
+
+    Clears the memoized dispatch table so existing signatures are re-resolved.
+    """
+    global _specialized_types
+    SPECIALIZATION_RULES.insert(0, rule)
+    SPECIALIZATION_TABLE.clear()
+    if rule.entity_cls not in _specialized_types:
+        _specialized_types = (*_specialized_types, rule.entity_cls)
+
+
+def entity_signature(obj: BaseEntity) -> Signature:
+    """Return the dispatch signature of an entity."""
+    components = tuple(
+        name for name in _COMPONENT_FIELDS if getattr(obj, name, None) is not None
+    )
     app_name: str | None = getattr(getattr(obj, "appearance", None), "name", None)
+    return components, app_name
 
-    # Agent
-    if has("agent"):
-        return copy_entity_components(obj, AgentEntity(), preserve_entity_id=True)
-
-    # Exit
-    if has("exit"):
-        return copy_entity_components(obj, ExitEntity(), preserve_entity_id=True)
-    # Doors (Locked vs Unlocked)
-    if app_name == "door":
-        if has("locked"):
-            return copy_entity_components(
-                obj, LockedDoorEntity(), preserve_entity_id=True
-            )
-        return copy_entity_components(
-            obj, UnlockedDoorEntity(), preserve_entity_id=True
-        )
 
-    # Key
-    if has("key"):
-        return copy_entity_components(obj, KeyEntity(), preserve_entity_id=True)
-
-    # Collectibles
-    if has("collectible"):
-        # Power-ups first
-        if has("speed"):
-            return copy_entity_components(
-                obj, SpeedPowerUpEntity(), preserve_entity_id=True
-            )
-        if has("immunity"):
-            return copy_entity_components(
-                obj, ShieldPowerUpEntity(), preserve_entity_id=True
-            )
-        if has("phasing"):
-            return copy_entity_components(
-                obj, PhasingPowerUpEntity(), preserve_entity_id=True
-            )
-        # Gem vs coin
-        if app_name == "core" or has("requirable"):
-            return copy_entity_components(obj, GemEntity(), preserve_entity_id=True)
-        return copy_entity_components(obj, CoinEntity(), preserve_entity_id=True)
-
-    # Boxes
-    if app_name == "box":
-        return copy_entity_components(obj, BoxEntity(), preserve_entity_id=True)
-
-    # Hazards
-    if app_name == "lava":
-        return copy_entity_components(obj, LavaEntity(), preserve_entity_id=True)
-    # Background tiles
-    if app_name == "floor":
-        return copy_entity_components(obj, FloorEntity(), preserve_entity_id=True)
-    if app_name == "wall":
-        return copy_entity_components(obj, WallEntity(), preserve_entity_id=True)
-
-    # Fallback
-    return obj
-
-
-def _specialize_nested_list(items: list[BaseEntity] | None) -> list[BaseEntity]:
+def specialization_for(signature: Signature) -> type[BaseEntity] | None:
+    """Return the specialized class for a signature, resolving it once."""
+    try:
+        return SPECIALIZATION_TABLE[signature]
+    except KeyError:
+        pass
+    names, app_name = signature
+    components = frozenset(names)
+    entity_cls = next(
+        (
+            rule.entity_cls
+            for rule in SPECIALIZATION_RULES
+            if rule.matches(components, app_name)
+        ),
+        None,
+    )
+    SPECIALIZATION_TABLE[signature] = entity_cls
+    return entity_cls
+
+
+# Interned background entities, keyed by class and component values. Levels
+# use a handful of distinct floors and walls; past ``_FLYWEIGHT_LIMIT`` entries
+# new combinations are no longer interned and keep a per-cell instance.
+_FLYWEIGHTS: dict[tuple[type[BaseEntity], tuple[object, ...]], BaseEntity] = {}
+_FLYWEIGHT_LIMIT = 1024
+
+
+def _flyweight(obj: BaseEntity, entity_cls: type[BaseEntity]) -> BaseEntity | None:
+    """Return the shared instance of ``entity_cls`` component-equal to ``obj``."""
+    key = (entity_cls, tuple(getattr(obj, name, None) for name in _COMPONENT_FIELDS))
+    try:
+        shared = _FLYWEIGHTS.get(key)
+    except TypeError:
+        # Unhashable component values; keep a per-cell instance.
+        return None
+    if shared is None:
+        if len(_FLYWEIGHTS) >= _FLYWEIGHT_LIMIT:
+            return None
+        shared = copy_entity_components(obj, entity_cls(), preserve_entity_id=False)
+        _FLYWEIGHTS[key] = shared
+    return shared
+
+
+def _specialize_single(
+    obj: BaseEntity, slotted: bool = False, flyweight: bool = False
+) -> BaseEntity:
+    """
+    Return a specialized Grid Adventure entity based on components/appearance.
+    Keeps obj unchanged if it is already specialized.
+    """
+    if isinstance(obj, _specialized_types):
+        return obj
+    entity_cls = specialization_for(entity_signature(obj))
+    if entity_cls is None:
+        # Fallback
+        return obj
+    if slotted:
+        entity_cls = SLOTTED_ENTITY_TYPES.get(entity_cls, entity_cls)
+    if flyweight and issubclass(entity_cls, BACKGROUND_ENTITY_TYPES):
+        shared = _flyweight(obj, entity_cls)
+        if shared is not None:
+            return shared
+    return copy_entity_components(obj, entity_cls(), preserve_entity_id=True)
+
+
+def _specialize_nested_list(
+    items: list[BaseEntity] | None, slotted: bool = False
+) -> list[BaseEntity]:
     """Specialize nested inventory/status entity lists."""
     if not items:
         return []
-    return [_specialize_single(item) for item in items]
+    return [_specialize_single(item, slotted) for item in items]
+
+
+def _same_entity(new: BaseEntity, old: BaseEntity) -> bool:
+    """Return True if ``new`` carries the same components as ``old``."""
+    for name in _COMPONENT_FIELDS:
+        a = getattr(new, name, None)
+        b = getattr(old, name, None)
+        if a is not b and a != b:
+            return False
+    for name in _NESTED_FIELDS:
+        new_items: list[BaseEntity] = getattr(new, name, None) or []
+        old_items: list[BaseEntity] = getattr(old, name, None) or []
+        if len(new_items) != len(old_items):
+            return False
+        if not all(_same_entity(a, b) for a, b in zip(new_items, old_items)):
+            return False
+    return True
+
+
+def _same_cell(new_cell: list[BaseEntity], old_cell: list[BaseEntity]) -> bool:
+    """Return True if two cells hold component-equal entities in the same order."""
+    if len(new_cell) != len(old_cell):
+        return False
+    return all(_same_entity(a, b) for a, b in zip(new_cell, old_cell))
+
+
+def _specialize_cell(
+    cell: list[BaseEntity], slotted: bool = False, flyweight: bool = False
+) -> list[BaseEntity]:
+    """Specialize every entity of a cell, including nested inventory/status lists."""
+    specialized_cell: list[BaseEntity] = []
+    for orig_obj in cell:
+        spec_obj = _specialize_single(orig_obj, slotted, flyweight)
+
+        # Specialize nested lists if attributes exist (inventory_list, status_list)
+        if hasattr(spec_obj, "inventory_list"):
+            inv_list = getattr(spec_obj, "inventory_list", None)
+            if inv_list:
+                setattr(
+                    spec_obj,
+                    "inventory_list",
+                    _specialize_nested_list(inv_list, slotted),
+                )
+        if hasattr(spec_obj, "status_list"):
+            st_list = getattr(spec_obj, "status_list", None)
+            if st_list:
+                setattr(
+                    spec_obj, "status_list", _specialize_nested_list(st_list, slotted)
+                )
+
+        specialized_cell.append(spec_obj)
+    return specialized_cell
 
 
-def specialize_entities(gridstate: GridState) -> GridState:
+def specialize_entities(
+    gridstate: GridState,
+    previous: GridState | None = None,
+    slotted: bool = False,
+    flyweight: bool = False,
+) -> GridState:
     """
     Returns a new GridState with entities replaced by specialized Grid Adventure subclasses.
-    Also remaps cross-entity references to the new instances.
+
+    If ``previous`` is given (typically the specialized GridState a step started
+    from), the conversion is incremental: cells whose entities are component-equal
+    to the same cell of ``previous`` reuse its specialized instances, and only the
+    dirty cells are re-specialized. The returned GridState then shares entity
+    instances with ``previous``, so mutating one is visible in the other. Every
+    cell is still compared; ``step(incremental=True)`` avoids that by diffing
+    the States instead.
+
+    With ``slotted=True`` new instances use the slotted entity variants from
+    ``grid_adventure.entities.SLOTTED_ENTITY_TYPES``.
+
+    With ``flyweight=True`` background entities (floors and walls) that are
+    component-equal share one interned instance without an entity id instead
+    of getting a fresh copy per cell. Shared instances must not be mutated.
     """
     new_grid_state = GridState(
         width=gridstate.width,
@@ -141,51 +336,559 @@ def specialize_entities(gridstate: GridState) -> GridState:
         turn_limit=gridstate.turn_limit,
     )
 
-    # First pass: specialize and map original object id -> new specialized object
-    obj_map: dict[int, BaseEntity] = {}
+    if previous is not None and (
+        previous.width != gridstate.width or previous.height != gridstate.height
+    ):
+        previous = None
+
     for x in range(gridstate.width):
         for y in range(gridstate.height):
-            specialized_cell: list[BaseEntity] = []
-            for orig_obj in gridstate.grid[x][y]:
-                spec_obj = _specialize_single(orig_obj)
-
-                # Specialize nested lists if attributes exist (inventory_list, status_list)
-                if hasattr(spec_obj, "inventory_list"):
-                    inv_list = getattr(spec_obj, "inventory_list", None)
-                    if inv_list:
-                        setattr(
-                            spec_obj,
-                            "inventory_list",
-                            _specialize_nested_list(inv_list),
-                        )
-                if hasattr(spec_obj, "status_list"):
-                    st_list = getattr(spec_obj, "status_list", None)
-                    if st_list:
-                        setattr(
-                            spec_obj, "status_list", _specialize_nested_list(st_list)
-                        )
-
-                obj_map[id(orig_obj)] = spec_obj
-                specialized_cell.append(spec_obj)
-
-            new_grid_state.grid[x][y] = specialized_cell
+            cell = gridstate.grid[x][y]
+            if previous is not None:
+                prev_cell = previous.grid[x][y]
+                if _same_cell(cell, prev_cell) and all(
+                    isinstance(obj, _specialized_types) for obj in prev_cell
+                ):
+                    new_grid_state.grid[x][y] = list(prev_cell)
+                    continue
+            new_grid_state.grid[x][y] = _specialize_cell(cell, slotted, flyweight)
     return new_grid_state
 
 
-def from_state(state: State) -> GridState:
+def from_state(
+    state: State, slotted: bool = False, flyweight: bool = False
+) -> GridState:
     """Convert a State to a specialized GridState using Grid Adventure entity subclasses."""
     base_grid_state = base_from_state(state)
-    return specialize_entities(base_grid_state)
+    return specialize_entities(base_grid_state, slotted=slotted, flyweight=flyweight)
 
 
 def to_state(gridstate: GridState) -> State:
-    """Convert a GridState (with specialized Grid Adventure entities) to a State."""
+    """Convert a GridState (with specialized Grid Adventure entities) to a State.
+
+    An unmodified ``LazyGridState`` returns the State it views.
+    """
+    if isinstance(gridstate, LazyGridState):
+        return gridstate.to_state()
     return base_to_state(gridstate)
 
 
-def step(gridstate: GridState, action: Action) -> GridState:
-    """Perform one step in the GridState using the base step function."""
-    return specialize_entities(base_step(gridstate, action))
+def step(
+    gridstate: GridState,
+    action: Action,
+    incremental: bool = False,
+    flyweight: bool = False,
+) -> GridState:
+    """Perform one step in the GridState using the base step function.
+
+    With ``incremental=True`` the step runs on the State behind ``gridstate``,
+    and only the cells holding an entity that moved, appeared, disappeared or
+    changed a component are converted and specialized. The returned GridState
+    keeps its State, so stepping it incrementally again skips the conversion
+    back to a State. Its unchanged cells, and the columns without a changed
+    cell, are the lists of ``gridstate``: both must be treated as read-only
+    (see ``specialize_entities``).
+
+    With ``flyweight=True`` the floors and walls of converted cells are the
+    interned shared instances (see ``specialize_entities``).
+    """
+    if not incremental:
+        return specialize_entities(base_step(gridstate, action), flyweight=flyweight)
+    if isinstance(gridstate, _SteppedGridState) and _status(gridstate) == _status(
+        gridstate.state
+    ):
+        previous = gridstate
+    else:
+        previous = _stepped(gridstate, to_state(gridstate), flyweight=flyweight)
+    return _step_changed_cells(previous, state_step(previous.state, action), flyweight)
+
+
+# GridState attributes copied from the State it shows.
+_STATUS_FIELDS = (
+    "width",
+    "height",
+    "movement",
+    "objective",
+    "seed",
+    "turn",
+    "score",
+    "win",
+    "lose",
+    "message",
+    "turn_limit",
+)
+
+
+def _status(obj: GridState | State) -> tuple[object, ...]:
+    return tuple(getattr(obj, name) for name in _STATUS_FIELDS)
+
+
+class _SteppedGridState(GridState):
+    """GridState returned by ``step(incremental=True)``.
+
+    ``state`` is the State it shows and ``cell_ids`` the entity ids of each
+    occupied cell, so the next incremental step finds the changed cells from
+    the changed entity ids alone.
+    """
+
+    state: State
+    cell_ids: PMap[tuple[int, int], tuple[EntityID, ...]]
+
+
+def _stepped(
+    gridstate: GridState, state: State, flyweight: bool = False
+) -> _SteppedGridState:
+    """Wrap the specialized cells of ``gridstate`` with the State it shows."""
+    cell_ids: dict[tuple[int, int], tuple[EntityID, ...]] = {}
+    for eid, pos in state.position.items():
+        cell_ids[pos.x, pos.y] = (*cell_ids.get((pos.x, pos.y), ()), eid)
+    stepped = _SteppedGridState(**dict(zip(_STATUS_FIELDS, _status(state))))
+    stepped.grid = [
+        [
+            cell
+            if all(isinstance(obj, _specialized_types) for obj in cell)
+            else _specialize_cell(cell, flyweight=flyweight)
+            for cell in map(list, column)
+        ]
+        for column in gridstate.grid
+    ]
+    stepped.state = state
+    stepped.cell_ids = pmap(cell_ids)
+    return stepped
+
+
+def _step_changed_cells(
+    previous: _SteppedGridState, next_state: State, flyweight: bool = False
+) -> GridState:
+    """Specialize the cells of ``next_state`` that differ from ``previous``."""
+    state = previous.state
+    if (state.width, state.height) != (next_state.width, next_state.height):
+        return _stepped(from_state(next_state, flyweight=flyweight), next_state)
+    cell_ids = previous.cell_ids
+    moved: dict[tuple[int, int], tuple[EntityID, ...]] = {}
+    dirty: set[tuple[int, int]] = set()
+    for eid in _changed_entities(state, next_state, (*_COMPONENT_FIELDS, "position")):
+        old, new = state.position.get(eid), next_state.position.get(eid)
+        source = None if old is None else (old.x, old.y)
+        target = None if new is None else (new.x, new.y)
+        dirty.update(cell for cell in (source, target) if cell is not None)
+        if source == target:
+            continue
+        if source is not None:
+            ids = moved.get(source, cell_ids.get(source, ()))
+            moved[source] = tuple(i for i in ids if i != eid)
+        if target is not None:
+            moved[target] = (*moved.get(target, cell_ids.get(target, ())), eid)
+    cell_ids = cell_ids.update(moved)
+
+    # Dirty cell i is converted as cell (i, 0) of a 1-row State.
+    cells = sorted(dirty)
+    positions = {
+        eid: replace(next_state.position[eid], x=i, y=0)
+        for i, cell in enumerate(cells)
+        for eid in cell_ids.get(cell, ())
+    }
+    built = (
+        base_from_state(_sub_state(next_state, positions, len(cells), 1)).grid
+        if positions
+        else None
+    )
+    grid = list(previous.grid)
+    columns: dict[int, list[list[BaseEntity]]] = {}
+    for i, (x, y) in enumerate(cells):
+        column = columns.get(x)
+        if column is None:
+            column = columns[x] = grid[x] = list(grid[x])
+        column[y] = (
+            [] if built is None else _specialize_cell(built[i][0], flyweight=flyweight)
+        )
+
+    # A copy skips GridState.__init__, which allocates an empty grid.
+    stepped = copy.copy(previous)
+    for name, value in zip(_STATUS_FIELDS, _status(next_state)):
+        setattr(stepped, name, value)
+    stepped.grid = grid
+    stepped.state = next_state
+    stepped.cell_ids = cell_ids
+    return stepped
+
+
+def _changed_entities(
+    previous: State, state: State, stores: Iterable[str] = _COMPONENT_FIELDS
+) -> set[EntityID]:
+    """Entity ids whose ``stores`` entries (or held entities) differ in ``state``.
+
+    Stores are compared by identity: consecutive States share unchanged
+    persistent maps and values, so only the stores a step touched are scanned.
+    A touched store is copied into a dict once, since a persistent map lookup
+    per id costs several times a dict lookup.
+    """
+    changed: set[EntityID] = set()
+    for name in stores:
+        new, old = getattr(state, name), getattr(previous, name)
+        if new is old:
+            continue
+        remaining = dict(old.items())
+        changed.update(
+            eid for eid, value in new.items() if remaining.pop(eid, None) is not value
+        )
+        changed.update(remaining)
+    while changed:
+        holders = {
+            holder
+            for store, attribute in _HELD_STORES.items()
+            for holder, held in getattr(state, store).items()
+            if holder not in changed
+            and not changed.isdisjoint(getattr(held, attribute))
+        }
+        if not holders:
+            break
+        changed |= holders
+    return changed
+
+
+# Component stores referencing held entities: store -> attribute with their ids.
+_HELD_STORES = {"inventory": "item_ids", "status": "effect_ids"}
+# Cells built one at a time before a view builds all remaining cells at once.
+_LAZY_CELL_LIMIT = 16
+
+
+def _held_entities(state: State, eids: list[EntityID]) -> list[EntityID]:
+    """Return ``eids`` plus the entities they hold, recursively."""
+    found = list(eids)
+    for eid in found:
+        for store, attribute in _HELD_STORES.items():
+            held = getattr(state, store).get(eid)
+            if held is not None:
+                found.extend(i for i in getattr(held, attribute) if i not in found)
+    return found
+
+
+def _sub_state(
+    state: State, positions: dict[EntityID, Any], width: int, height: int
+) -> State:
+    """Return a State of the positioned entities ``positions`` (and what they hold)."""
+    eids = _held_entities(state, list(positions))
+    stores = {}
+    for name in _COMPONENT_FIELDS:
+        store = getattr(state, name)
+        stores[name] = pmap({e: store[e] for e in eids if e in store})
+    return replace(
+        state, width=width, height=height, position=pmap(positions), **stores
+    )
+
+
+class _LazyColumn(Sequence[list[BaseEntity]]):
+    """Column ``x`` of a ``LazyGridState``; cells are built on first access."""
+
+    __slots__ = ("_view", "_x")
+
+    def __init__(self, view: LazyGridState, x: int) -> None:
+        self._view = view
+        self._x = x
+
+    def __len__(self) -> int:
+        return self._view.height
+
+    @overload
+    def __getitem__(self, y: int) -> list[BaseEntity]: ...
+
+    @overload
+    def __getitem__(self, y: slice) -> list[list[BaseEntity]]: ...
+
+    def __getitem__(self, y: int | slice) -> Any:
+        if isinstance(y, slice):
+            return [self[i] for i in range(*y.indices(self._view.height))]
+        return self._view._cell(self._x, y)
+
+    def __setitem__(self, y: int, cell: list[BaseEntity]) -> None:
+        self._view._set_cell(self._x, y, cell)
+
+    def __iter__(self) -> Iterator[list[BaseEntity]]:
+        self._view._build_column(self._x)
+        return iter(self._view._cells[self._x])  # type: ignore[arg-type]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyGridState(GridState):
+    """GridState view of a State that builds cells on first access.
+
+    ``grid[x][y]`` (and so ``objects_at`` and the other GridState methods)
+    builds and specializes the entities of a cell the first time it is
+    accessed, exactly as ``from_state`` would. The State is immutable and
+    never changes: each cell is a private copy owned by the view, so agents can
+    mutate cells and entities through the documented GridState API. Once many
+    cells were accessed, the remaining ones are built in one conversion.
+
+    ``to_state`` returns the viewed State as long as no cell was accessed and
+    the game status attributes are unchanged; otherwise it converts the view
+    like any GridState.
+    """
+
+    def __init__(
+        self, state: State, slotted: bool = False, flyweight: bool = False
+    ) -> None:
+        super().__init__(
+            width=state.width,
+            height=state.height,
+            movement=state.movement,
+            objective=state.objective,
+            seed=state.seed,
+            turn=state.turn,
+            score=state.score,
+            win=state.win,
+            lose=state.lose,
+            message=state.message,
+            turn_limit=state.turn_limit,
+        )
+        self.state = state
+        self.slotted = slotted
+        self.flyweight = flyweight
+        self._cells: list[list[list[BaseEntity] | None]] = [
+            [None] * state.height for _ in range(state.width)
+        ]
+        self._entities: dict[tuple[int, int], list[EntityID]] | None = None
+        self._built = 0
+        self._touched = False
+        self.grid = [_LazyColumn(self, x) for x in range(state.width)]  # type: ignore[misc]
+
+    def _entities_at(self, x: int, y: int) -> list[EntityID]:
+        if self._entities is None:
+            entities: dict[tuple[int, int], list[EntityID]] = {}
+            for eid, pos in self.state.position.items():
+                entities.setdefault((pos.x, pos.y), []).append(eid)
+            self._entities = entities
+        return self._entities.get((x, y), [])
+
+    def _build(self, cells: list[tuple[int, int]]) -> None:
+        """Build and specialize the entities of unbuilt ``cells`` in one conversion."""
+        state = self.state
+        positions: dict[EntityID, Any] = {}
+        single = len(cells) == 1
+        for x, y in cells:
+            for eid in self._entities_at(x, y):
+                pos = state.position[eid]
+                # A single cell is converted as the only cell of a 1x1 State.
+                positions[eid] = replace(pos, x=0, y=0) if single else pos
+        if positions:
+            built = base_from_state(
+                _sub_state(
+                    state,
+                    positions,
+                    width=1 if single else state.width,
+                    height=1 if single else state.height,
+                )
+            ).grid
+        for x, y in cells:
+            cell: list[BaseEntity] = []
+            if positions:
+                cell = built[0][0] if single else built[x][y]
+            self._cells[x][y] = _specialize_cell(cell, self.slotted, self.flyweight)
+        self._built += len(cells)
+        self._touched = True
+
+    def _cell(self, x: int, y: int) -> list[BaseEntity]:
+        if not (0 <= x < self.width and -self.height <= y < self.height):
+            raise IndexError(f"Cell ({x}, {y}) is outside the grid.")
+        y %= self.height
+        cell = self._cells[x][y]
+        if cell is None:
+            if self._built >= _LAZY_CELL_LIMIT:
+                self.materialize()
+            else:
+                self._build([(x, y)])
+            cell = self._cells[x][y]
+            assert cell is not None
+        return cell
+
+    def _build_column(self, x: int) -> None:
+        missing = [(x, y) for y, cell in enumerate(self._cells[x]) if cell is None]
+        if missing:
+            self._build(missing)
+
+    def _set_cell(self, x: int, y: int, cell: list[BaseEntity]) -> None:
+        self._cell(x, y)
+        self._cells[x][y % self.height] = cell
+
+    def materialize(self) -> None:
+        """Build every cell that was not accessed yet."""
+        missing = [
+            (x, y)
+            for x, column in enumerate(self._cells)
+            for y, cell in enumerate(column)
+            if cell is None
+        ]
+        if missing:
+            self._build(missing)
+
+    def to_state(self) -> State:
+        """Return the viewed State if the view is unchanged, else convert it."""
+        state = self.state
+        if not self._touched and (
+            self.width,
+            self.height,
+            self.movement,
+            self.objective,
+            self.seed,
+            self.turn,
+            self.score,
+            self.win,
+            self.lose,
+            self.message,
+            self.turn_limit,
+        ) == (
+            state.width,
+            state.height,
+            state.movement,
+            state.objective,
+            state.seed,
+            state.turn,
+            state.score,
+            state.win,
+            state.lose,
+            state.message,
+            state.turn_limit,
+        ):
+            return state
+        self.materialize()
+        return base_to_state(self)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    reused: int
+    built: int
+    size: int
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.reused + self.built
+        return self.reused / total if total else 0.0
+
+
+class EntityPool:
+    """Specialized entity instances reused across the States of an episode.
+
+    ``from_state`` converts a State like the module-level ``from_state``, but
+    keeps the specialized instance of every entity id and returns it again
+    while the entity's components are unchanged. Changes are found by
+    comparing each component store with the one of the previous State by
+    identity: consecutive States share unchanged persistent maps and component
+    values, so only the stores a step touched are scanned. An entity is
+    rebuilt when one of its components, or of the entities it holds, changed;
+    moving alone does not change it. All rebuilt entities are converted in
+    one ``grid_universe`` conversion.
+
+    Entities of a cell are listed in State order. The returned GridStates share
+    instances with each other and with the pool, so they must not be mutated.
+
+    Args:
+        slotted: Build slotted entity variants (see ``specialize_entities``).
+        flyweight: Share background entity instances (see ``specialize_entities``).
+    """
+
+    def __init__(self, slotted: bool = False, flyweight: bool = False) -> None:
+        self.slotted = slotted
+        self.flyweight = flyweight
+        self._state: State | None = None
+        self._entities: dict[EntityID, BaseEntity] = {}
+        self._reused = self._built = 0
+
+    def _build(self, state: State, eids: list[EntityID]) -> dict[EntityID, BaseEntity]:
+        if not eids:
+            return {}
+        # Entity i is converted as the only one of cell (i, 0) of a 1-row State.
+        positions = {
+            eid: replace(state.position[eid], x=i, y=0) for i, eid in enumerate(eids)
+        }
+        built = base_from_state(_sub_state(state, positions, len(eids), 1)).grid
+        return {
+            eid: _specialize_cell(built[i][0], self.slotted, self.flyweight)[0]
+            for i, eid in enumerate(eids)
+        }
+
+    def from_state(self, state: State) -> GridState:
+        """Convert a State, reusing the instances of unchanged entities."""
+        previous, pooled = self._state, self._entities
+        if previous is None or (previous.width, previous.height) != (
+            state.width,
+            state.height,
+        ):
+            pooled = {}
+            changed: set[EntityID] = set()
+        else:
+            changed = _changed_entities(previous, state)
+        entities = {
+            eid: pooled[eid]
+            for eid in state.position
+            if eid in pooled and eid not in changed
+        }
+        missing = [eid for eid in state.position if eid not in entities]
+        self._reused += len(entities)
+        self._built += len(missing)
+        entities.update(self._build(state, missing))
+
+        gridstate = GridState(
+            width=state.width,
+            height=state.height,
+            movement=state.movement,
+            objective=state.objective,
+            seed=state.seed,
+            turn=state.turn,
+            score=state.score,
+            win=state.win,
+            lose=state.lose,
+            message=state.message,
+            turn_limit=state.turn_limit,
+        )
+        for eid, pos in state.position.items():
+            gridstate.grid[pos.x][pos.y].append(entities[eid])
+        self._state = state
+        self._entities = entities
+        return gridstate
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def stats(self) -> PoolStats:
+        return PoolStats(self._reused, self._built, len(self._entities))
+
+    def clear(self) -> None:
+        self._state = None
+        self._entities = {}
+        self._reused = self._built = 0
+
+
+def lazy_from_state(
+    state: State, slotted: bool = False, flyweight: bool = False
+) -> LazyGridState:
+    """Return a ``LazyGridState`` view of a State (see ``from_state``)."""
+    return LazyGridState(state, slotted=slotted, flyweight=flyweight)
 
 
-__all__ = ["from_state", "to_state", "specialize_entities", "step", "GridState"]
+__all__ = [
+    "from_state",
+    "lazy_from_state",
+    "LazyGridState",
+    "EntityPool",
+    "PoolStats",
+    "to_state",
+    "specialize_entities",
+    "step",
+    "GridState",
+    "SpecializationRule",
+    "SPECIALIZATION_RULES",
+    "register_specialization",
+    "entity_signature",
+    "entity_stores",
+    "specialization_for",
+]
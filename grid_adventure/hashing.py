@@ -0,0 +1,191 @@
+"""Canonical 64-bit fingerprints of Grid Adventure snapshots.
+
+A fingerprint covers the game fields of a snapshot (size, movement and
+objective types, turn, score, win, lose, turn limit, seed) and the multiset of
+entities on the grid, each described by its position and component values.
+Entity ids never enter a fingerprint: held items and effects (``inventory`` and
+``status`` in a ``State``, ``inventory_list``/``status_list`` on ``GridState``
+entities) are described by their own component values instead of their ids, so
+renumbering entities or reordering a cell does not change the fingerprint. The
+``message`` text is not part of a snapshot's identity.
+
+Entity digests are BLAKE2b hashes of the component ``repr``s, so fingerprints
+are stable across processes (``repr`` of the built-in components is
+deterministic). Positioned entity digests are combined with a 64-bit mixer and
+summed, which makes the fingerprint independent of iteration order.
+
+Only the component stores a ``GridState`` entity can carry are hashed, so
+per-step bookkeeping stores of ``State`` (such as ``prev_position``) are left
+out without being listed.
+
+A ``Fingerprinter`` keeps the digests of the previous snapshot and reuses them
+for entities whose components are unchanged, skipping their ``repr`` and
+BLAKE2b hashing. Every call still visits every entity, so its cost stays
+linear in the number of entities; reuse only makes the per-entity work
+cheaper. The module functions are stateless and use a fresh ``Fingerprinter``
+per call; keep one ``Fingerprinter`` to fingerprint a trajectory.
+"""
+
+import hashlib
+from collections.abc import Hashable
+from dataclasses import fields
+from typing import Any
+
+from grid_universe.grid.entity import BaseEntity
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from grid_universe.types import EntityID
+
+from grid_adventure.grid import _COMPONENT_FIELDS
+
+_MASK = (1 << 64) - 1
+
+# Component stores referencing held entities by id: store -> id set attribute.
+_HELD_STORES = {"inventory": "item_ids", "status": "effect_ids"}
+# The matching entity lists on GridState entities.
+_HELD_LISTS = {"inventory": "inventory_list", "status": "status_list"}
+# Component stores that describe an entity: those with a matching entity field.
+_ENTITY_FIELDS = frozenset(f.name for f in fields(BaseEntity))
+_STORES = tuple(name for name in _COMPONENT_FIELDS if name in _ENTITY_FIELDS)
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def _mix(digest: int, x: int, y: int) -> int:
+    """Bind an entity digest to a cell (splitmix64 finalizer)."""
+    z = (digest ^ ((x << 32 | y & 0xFFFFFFFF) * 0x9E3779B97F4A7C15)) & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+
+def _type_name(obj: Any) -> str:
+    return "" if obj is None else type(obj).__qualname__
+
+
+class Fingerprinter:
+    """Incremental fingerprints of States and GridStates (see module docstring)."""
+
+    def __init__(self) -> None:
+        # key -> digest of the entities of the previous snapshot.
+        self._state_digests: dict[Hashable, int] = {}
+        self._grid_digests: dict[int, tuple[BaseEntity, tuple[Any, ...], int]] = {}
+
+    def _finish(self, snapshot: State | GridState, positioned: int) -> int:
+        return _digest(
+            repr(
+                (
+                    snapshot.width,
+                    snapshot.height,
+                    _type_name(snapshot.movement),
+                    _type_name(snapshot.objective),
+                    snapshot.turn,
+                    snapshot.score,
+                    bool(snapshot.win),
+                    bool(snapshot.lose),
+                    snapshot.turn_limit,
+                    snapshot.seed,
+                    positioned,
+                )
+            )
+        )
+
+    def state(self, state: State) -> int:
+        """Return the fingerprint of a State."""
+        components: dict[EntityID, list[tuple[str, Any]]] = {}
+        for name in _STORES:
+            for eid, value in getattr(state, name).items():
+                components.setdefault(eid, []).append((name, value))
+
+        previous, digests = self._state_digests, {}
+        memo: dict[EntityID, int] = {}
+
+        def entity_digest(eid: EntityID) -> int:
+            digest = memo.get(eid)
+            if digest is not None:
+                return digest
+            parts = []
+            for name, value in components.get(eid, ()):
+                if name in _HELD_STORES:
+                    held = getattr(value, _HELD_STORES[name])
+                    value = tuple(sorted(entity_digest(i) for i in held))
+                parts.append((name, value))
+            key = tuple(parts)
+            try:
+                digest = previous.get(key)
+            except TypeError:  # Unhashable component value.
+                digest, key = None, None
+            if digest is None:
+                digest = _digest(repr(key if key is not None else parts))
+            if key is not None:
+                digests[key] = digest
+            memo[eid] = digest
+            return digest
+
+        positioned = 0
+        for eid, pos in state.position.items():
+            positioned += _mix(entity_digest(eid), pos.x, pos.y)
+        self._state_digests = digests
+        return self._finish(state, positioned & _MASK)
+
+    def _object_digest(
+        self,
+        obj: BaseEntity,
+        digests: dict[int, tuple[BaseEntity, tuple[Any, ...], int]],
+    ) -> int:
+        cached = digests.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[2]
+        parts = []
+        for name in _STORES:
+            value = getattr(obj, name, None)
+            if value is None:
+                continue
+            if name in _HELD_LISTS:
+                items = getattr(obj, _HELD_LISTS[name], None) or []
+                value = tuple(sorted(self._object_digest(i, digests) for i in items))
+            parts.append((name, value))
+        key = tuple(parts)
+        previous = self._grid_digests.get(id(obj))
+        if previous is not None and previous[0] is obj and previous[1] == key:
+            digest = previous[2]
+        else:
+            digest = _digest(repr(key))
+        digests[id(obj)] = (obj, key, digest)
+        return digest
+
+    def gridstate(self, gridstate: GridState) -> int:
+        """Return the fingerprint of a GridState (specialized or not)."""
+        digests: dict[int, tuple[BaseEntity, tuple[Any, ...], int]] = {}
+        positioned = 0
+        for x in range(gridstate.width):
+            column = gridstate.grid[x]
+            for y in range(gridstate.height):
+                for obj in column[y]:
+                    positioned += _mix(self._object_digest(obj, digests), x, y)
+        self._grid_digests = digests
+        return self._finish(gridstate, positioned & _MASK)
+
+    def __call__(self, snapshot: State | GridState) -> int:
+        if isinstance(snapshot, GridState):
+            return self.gridstate(snapshot)
+        return self.state(snapshot)
+
+
+def state_fingerprint(state: State) -> int:
+    """Return the canonical fingerprint of a State."""
+    return Fingerprinter().state(state)
+
+
+def gridstate_fingerprint(gridstate: GridState) -> int:
+    """Return the canonical fingerprint of a GridState."""
+    return Fingerprinter().gridstate(gridstate)
+
+
+def fingerprint(snapshot: State | GridState) -> int:
+    """Return the canonical fingerprint of a State or GridState."""
+    return Fingerprinter()(snapshot)
@@ -0,0 +1,273 @@
+"""Compact, versioned binary format for Grid Adventure levels.
+
+A level file holds one level in little-endian byte order:
+
+- a fixed header (``_HEADER``): magic ``b"GALV"``, format version, number of
+  entity planes, flags, width, height, turn limit (``-1`` for none), seed,
+  score, turn, and the agent position, health, max health, held keys, gems and
+  coins and number of held effects;
+- the movement and objective keys (UTF-8, see ``MOVEMENTS``/``OBJECTIVES``);
+- one ``(kind, amount)`` record per held effect (``bitboard.EFFECT_*``);
+- the cells, row-major: one ``uint16`` bitmask of entity types per cell
+  (bit ``p`` set when plane ``p`` of ``bitboard.PLANES`` is present), or, when
+  a cell holds several entities of one type, one ``uint8`` count per plane and
+  cell (``FLAG_COUNTS``).
+
+Decoding goes straight to a ``Bitboard`` with ``struct``/``np.frombuffer`` and
+no entity construction; ``decode_level`` then builds the ``GridState``, with
+independent entities by default or, with ``flyweight=True``, with shared
+flyweight floors and walls, which make up most of a level. The format
+covers the levels the bitboard engine accepts (see ``bitboard.from_gridstate``).
+"""
+
+import os
+import struct
+from typing import Any
+
+import numpy as np
+from grid_universe.grid.gridstate import GridState
+from numpy.typing import NDArray
+
+from grid_adventure import bitboard
+from grid_adventure.movements import MOVEMENTS
+from grid_adventure.objectives import OBJECTIVES
+
+MAGIC = b"GALV"
+FORMAT_VERSION = 1
+
+FLAG_COUNTS = 1
+FLAG_HAS_SEED = 2
+FLAG_WIN = 4
+FLAG_LOSE = 8
+
+_HEADER = struct.Struct("<4sBBBHHiqiiHHiiHHHHBB")
+_EFFECT = struct.Struct("<Bi")
+
+_NUM_PLANES = len(bitboard.PLANES)
+_PLANE_BITS = np.arange(_NUM_PLANES, dtype=np.uint16).reshape(-1, 1, 1)
+_POWERUP_PLANES = [
+    bitboard.PLANE_INDEX[name] for name in ("speed", "shield", "phasing")
+]
+_A = bitboard.AGENT_INDEX
+
+
+def _key(registry: dict[str, Any], value: Any, kind: str) -> bytes:
+    if value is None:
+        return b""
+    for name, entry in registry.items():
+        if entry == value:
+            return name.encode()
+    raise ValueError(f"{kind} {value!r} is not registered in grid_adventure.")
+
+
+def _lookup(registry: dict[str, Any], key: bytes, kind: str) -> Any:
+    if not key:
+        return None
+    name = key.decode()
+    if name not in registry:
+        raise ValueError(f"Unknown {kind} key {name!r}.")
+    return registry[name]
+
+
+def encode_board(board: bitboard.Bitboard) -> bytes:
+    """Encode an unbatched Bitboard."""
+    assert not board.batched, "Use unstack() to encode a batched board."
+    agent = board.agent
+    level = board.levels[0]
+    movement = _key(MOVEMENTS, level.movement, "Movement")
+    objective = _key(OBJECTIVES, level.objective, "Objective")
+    effects = [(int(k), int(a)) for k, a in board.effects if k != bitboard.EFFECT_NONE]
+
+    counts = bool(board.planes.max(initial=0) > 1)
+    flags = (
+        (FLAG_COUNTS if counts else 0)
+        | (FLAG_HAS_SEED if level.seed is not None else 0)
+        | (FLAG_WIN if agent[_A["win"]] else 0)
+        | (FLAG_LOSE if agent[_A["lose"]] else 0)
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        _NUM_PLANES,
+        flags,
+        board.width,
+        board.height,
+        int(agent[_A["turn_limit"]]),
+        0 if level.seed is None else level.seed,
+        int(agent[_A["score"]]),
+        int(agent[_A["turn"]]),
+        int(agent[_A["x"]]),
+        int(agent[_A["y"]]),
+        int(agent[_A["health"]]),
+        int(agent[_A["max_health"]]),
+        int(agent[_A["keys"]]),
+        int(agent[_A["gems"]]),
+        int(agent[_A["coins"]]),
+        len(effects),
+        len(movement),
+        len(objective),
+    )
+    if counts:
+        cells = board.planes.tobytes()
+    else:
+        mask = (board.planes.astype(np.uint16) << _PLANE_BITS).sum(
+            axis=0, dtype=np.uint16
+        )
+        cells = mask.astype("<u2").tobytes()
+    return b"".join(
+        (
+            header,
+            movement,
+            objective,
+            *(_EFFECT.pack(kind, amount) for kind, amount in effects),
+            cells,
+        )
+    )
+
+
+def encoded_size(data: Any, offset: int = 0) -> int:
+    """Return the size in bytes of the level encoded at ``offset`` of a buffer."""
+    fields = _HEADER.unpack_from(data, offset)
+    flags, width, height = fields[3:6]
+    num_effects, len_movement, len_objective = fields[17:20]
+    cell_bytes = width * height * (_NUM_PLANES if flags & FLAG_COUNTS else 2)
+    return (
+        _HEADER.size
+        + len_movement
+        + len_objective
+        + num_effects * _EFFECT.size
+        + cell_bytes
+    )
+
+
+def decode_board(data: Any, offset: int = 0) -> bitboard.Bitboard:
+    """Decode a level from any bytes-like buffer (bytes, memoryview, mmap).
+
+    Raises:
+        ValueError: On a bad magic, an unsupported version or plane count, or
+            an unknown movement/objective key.
+    """
+    (
+        magic,
+        version,
+        num_planes,
+        flags,
+        width,
+        height,
+        turn_limit,
+        seed,
+        score,
+        turn,
+        x,
+        y,
+        health,
+        max_health,
+        keys,
+        gems,
+        coins,
+        num_effects,
+        len_movement,
+        len_objective,
+    ) = _HEADER.unpack_from(data, offset)
+    if magic != MAGIC:
+        raise ValueError("Not a Grid Adventure level (bad magic).")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported level format version {version}.")
+    if num_planes != _NUM_PLANES:
+        raise ValueError(
+            f"Level has {num_planes} entity planes, expected {_NUM_PLANES}."
+        )
+
+    view = memoryview(data)
+    pos = offset + _HEADER.size
+    movement = _lookup(MOVEMENTS, bytes(view[pos : pos + len_movement]), "movement")
+    pos += len_movement
+    objective = _lookup(OBJECTIVES, bytes(view[pos : pos + len_objective]), "objective")
+    pos += len_objective
+    held = [
+        _EFFECT.unpack_from(data, pos + i * _EFFECT.size) for i in range(num_effects)
+    ]
+    pos += num_effects * _EFFECT.size
+
+    planes: NDArray[np.uint8]
+    if flags & FLAG_COUNTS:
+        planes = (
+            np.frombuffer(data, np.uint8, _NUM_PLANES * height * width, pos)
+            .reshape(_NUM_PLANES, height, width)
+            .copy()
+        )
+    else:
+        mask = np.frombuffer(data, "<u2", height * width, pos).reshape(height, width)
+        planes = ((mask >> _PLANE_BITS) & 1).astype(np.uint8)
+
+    # In AGENT_FIELDS order.
+    agent = np.array(
+        (
+            x,
+            y,
+            health,
+            max_health,
+            keys,
+            gems,
+            coins,
+            score,
+            turn,
+            turn_limit,
+            bool(flags & FLAG_WIN),
+            bool(flags & FLAG_LOSE),
+        ),
+        dtype=np.int32,
+    )
+    # Same slot capacity as from_gridstate: held effects plus board power-ups.
+    num_slots = max(1, num_effects + int(planes[_POWERUP_PLANES].sum()))
+    effects = np.zeros((num_slots, 2), dtype=np.int32)
+    if held:
+        effects[:num_effects] = held
+    level = bitboard.LevelInfo(
+        movement, objective, seed if flags & FLAG_HAS_SEED else None
+    )
+    return bitboard.Bitboard(planes, agent, effects, (level,))
+
+
+def encode_level(gridstate: GridState) -> bytes:
+    """Encode a GridState.
+
+    Raises:
+        ValueError: If the level is outside the bitboard rule set or uses an
+            unregistered movement or objective.
+    """
+    return encode_board(bitboard.from_gridstate(gridstate))
+
+
+def decode_level(data: Any, offset: int = 0, flyweight: bool = False) -> GridState:
+    """Decode a level to a GridState.
+
+    By default every cell gets its own entities, so the GridState can be edited
+    like a built level; building them dominates the decoding time. With
+    ``flyweight=True`` all floors and walls, most of a level, are shared
+    interned instances, which is cheaper but they must not be mutated. Use
+    ``decode_board`` to skip entity construction entirely, e.g. to feed the
+    bitboard engine.
+    """
+    return bitboard.to_gridstate(decode_board(data, offset), flyweight=flyweight)
+
+
+def save_level(gridstate: GridState, path: str | os.PathLike[str]) -> None:
+    """Write a GridState to a level file."""
+    with open(path, "wb") as f:
+        f.write(encode_level(gridstate))
+
+
+def load_level(path: str | os.PathLike[str], flyweight: bool = False) -> GridState:
+    """Read a GridState from a level file (see ``decode_level``).
+
+    ``load_board`` is the cheap path when no GridState is needed.
+    """
+    with open(path, "rb") as f:
+        return decode_level(f.read(), flyweight=flyweight)
+
+
+def load_board(path: str | os.PathLike[str]) -> bitboard.Bitboard:
+    """Read a level file straight into a Bitboard."""
+    with open(path, "rb") as f:
+        return decode_board(f.read())
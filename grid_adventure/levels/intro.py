@@ -3,6 +3,7 @@ from grid_adventure.movements import MOVEMENTS
 from grid_adventure.objectives import OBJECTIVES
 from grid_adventure.entities import (
     create_agent_entity,
+    shared_entity,
     FloorEntity,
     WallEntity,
     ExitEntity,
@@ -21,22 +22,30 @@ from grid_adventure.entities import (
 TURN_LIMIT = 50
 
 
-def _floors(gridstate: GridState) -> None:
+def _floor(flyweight: bool = False) -> FloorEntity:
+    return shared_entity(FloorEntity) if flyweight else FloorEntity()
+
+
+def _wall(flyweight: bool = False) -> WallEntity:
+    return shared_entity(WallEntity) if flyweight else WallEntity()
+
+
+def _floors(gridstate: GridState, flyweight: bool = False) -> None:
     for y in range(gridstate.height):
         for x in range(gridstate.width):
-            gridstate.add((x, y), FloorEntity())
+            gridstate.add((x, y), _floor(flyweight))
 
 
-def _border(gridstate: GridState) -> None:
+def _border(gridstate: GridState, flyweight: bool = False) -> None:
     for x in range(gridstate.width):
-        gridstate.add((x, 0), WallEntity())
-        gridstate.add((x, gridstate.height - 1), WallEntity())
+        gridstate.add((x, 0), _wall(flyweight))
+        gridstate.add((x, gridstate.height - 1), _wall(flyweight))
     for y in range(gridstate.height):
-        gridstate.add((0, y), WallEntity())
-        gridstate.add((gridstate.width - 1, y), WallEntity())
+        gridstate.add((0, y), _wall(flyweight))
+        gridstate.add((gridstate.width - 1, y), _wall(flyweight))
 
 
-def build_level_basic_movement(seed: int = 100) -> GridState:
+def build_level_basic_movement(seed: int = 100, flyweight: bool = False) -> GridState:
     w, h = 7, 5
     gridstate = GridState(
         w,
@@ -46,16 +55,16 @@ def build_level_basic_movement(seed: int = 100) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     gridstate.add((1, h // 2), create_agent_entity())
     gridstate.add((w - 2, h // 2), ExitEntity())
     for y in range(h):
         if y != h // 2:
-            gridstate.add((w // 2, y), WallEntity())
+            gridstate.add((w // 2, y), _wall(flyweight))
     return gridstate
 
 
-def build_level_maze_turns(seed: int = 101) -> GridState:
+def build_level_maze_turns(seed: int = 101, flyweight: bool = False) -> GridState:
     w, h = 9, 7
     gridstate = GridState(
         w,
@@ -65,19 +74,19 @@ def build_level_maze_turns(seed: int = 101) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
-    _border(gridstate)
+    _floors(gridstate, flyweight)
+    _border(gridstate, flyweight)
     for x in range(2, w - 2):
-        gridstate.add((x, 2), WallEntity())
+        gridstate.add((x, 2), _wall(flyweight))
     for x in range(2, w - 2):
         if x != w // 2:
-            gridstate.add((x, h - 3), WallEntity())
+            gridstate.add((x, h - 3), _wall(flyweight))
     gridstate.add((1, 1), create_agent_entity())
     gridstate.add((w - 2, h - 2), ExitEntity())
     return gridstate
 
 
-def build_level_optional_coin(seed: int = 102) -> GridState:
+def build_level_optional_coin(seed: int = 102, flyweight: bool = False) -> GridState:
     w, h = 9, 7
     gridstate = GridState(
         w,
@@ -87,15 +96,15 @@ def build_level_optional_coin(seed: int = 102) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
-    _border(gridstate)
-    gridstate.add((1, 2), WallEntity())
-    gridstate.add((3, 3), WallEntity())
+    _floors(gridstate, flyweight)
+    _border(gridstate, flyweight)
+    gridstate.add((1, 2), _wall(flyweight))
+    gridstate.add((3, 3), _wall(flyweight))
     for x in range(3, w - 2):
-        gridstate.add((x, 2), WallEntity())
+        gridstate.add((x, 2), _wall(flyweight))
     for x in range(2, w - 2):
         if x != w // 2:
-            gridstate.add((x, h - 3), WallEntity())
+            gridstate.add((x, h - 3), _wall(flyweight))
     gridstate.add((1, 1), create_agent_entity())
     gridstate.add((w - 2, h - 2), ExitEntity())
     for x in range(1, w - 2, 1):
@@ -103,7 +112,9 @@ def build_level_optional_coin(seed: int = 102) -> GridState:
     return gridstate
 
 
-def build_level_required_multiple(seed: int = 104) -> GridState:
+def build_level_required_multiple(
+    seed: int = 104, flyweight: bool = False
+) -> GridState:
     w, h = 11, 9
     gridstate = GridState(
         w,
@@ -113,13 +124,13 @@ def build_level_required_multiple(seed: int = 104) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
-    _border(gridstate)
+    _floors(gridstate, flyweight)
+    _border(gridstate, flyweight)
     midx, midy = w // 2, h // 2
     for x in range(1, w - 1):
         for y in range(1, h - 1):
             if x != midx and y != midy:
-                gridstate.add((x, y), WallEntity())
+                gridstate.add((x, y), _wall(flyweight))
     gridstate.add((1, midy), create_agent_entity())
     gridstate.add((w - 2, midy), ExitEntity())
     gridstate.add((midx, 1), GemEntity())
@@ -127,7 +138,7 @@ def build_level_required_multiple(seed: int = 104) -> GridState:
     return gridstate
 
 
-def build_level_key_door(seed: int = 105) -> GridState:
+def build_level_key_door(seed: int = 105, flyweight: bool = False) -> GridState:
     w, h = 11, 9
     gridstate = GridState(
         w,
@@ -137,10 +148,10 @@ def build_level_key_door(seed: int = 105) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     for y in range(h):
         if y != h // 2:
-            gridstate.add((w // 2, y), WallEntity())
+            gridstate.add((w // 2, y), _wall(flyweight))
     gridstate.add((1, h // 2), create_agent_entity())
     gridstate.add((w - 2, h // 2), ExitEntity())
     gridstate.add((2, h // 2 - 1), KeyEntity())
@@ -148,7 +159,7 @@ def build_level_key_door(seed: int = 105) -> GridState:
     return gridstate
 
 
-def build_level_hazard_detour(seed: int = 106) -> GridState:
+def build_level_hazard_detour(seed: int = 106, flyweight: bool = False) -> GridState:
     w, h = 11, 9
     gridstate = GridState(
         w,
@@ -158,7 +169,7 @@ def build_level_hazard_detour(seed: int = 106) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     gridstate.add((1, h // 2), create_agent_entity(health=3))
     gridstate.add((w - 2, h // 2), ExitEntity())
     gridstate.add((w // 2 - 1, h // 2), LavaEntity())
@@ -166,15 +177,15 @@ def build_level_hazard_detour(seed: int = 106) -> GridState:
 
     for y in range(1, h - 1):
         if y != h // 2:
-            gridstate.add((w // 2 - 1, y), WallEntity())
+            gridstate.add((w // 2 - 1, y), _wall(flyweight))
     for y in range(2, h - 2):
         if y != h // 2:
-            gridstate.add((w - 3, y), WallEntity())
+            gridstate.add((w - 3, y), _wall(flyweight))
 
     return gridstate
 
 
-def build_level_pushable_box(seed: int = 108) -> GridState:
+def build_level_pushable_box(seed: int = 108, flyweight: bool = False) -> GridState:
     w, h = 11, 9
     gridstate = GridState(
         w,
@@ -184,17 +195,17 @@ def build_level_pushable_box(seed: int = 108) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     for y in range(h):
         if y != h // 2:
-            gridstate.add((w // 2, y), WallEntity())
+            gridstate.add((w // 2, y), _wall(flyweight))
     gridstate.add((1, h // 2), create_agent_entity())
     gridstate.add((w - 2, h // 2), ExitEntity())
     gridstate.add((w // 2 - 1, h // 2), BoxEntity())
     return gridstate
 
 
-def build_level_power_shield(seed: int = 110) -> GridState:
+def build_level_power_shield(seed: int = 110, flyweight: bool = False) -> GridState:
     w, h = 11, 9
     gridstate = GridState(
         w,
@@ -204,18 +215,18 @@ def build_level_power_shield(seed: int = 110) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     gridstate.add((1, h // 2), create_agent_entity(2))
     gridstate.add((w - 2, h // 2), ExitEntity())
     for y in range(h):
         if y != h // 2:
-            gridstate.add((w // 2, y), WallEntity())
+            gridstate.add((w // 2, y), _wall(flyweight))
     gridstate.add((2, h // 2 - 3), ShieldPowerUpEntity())
     gridstate.add((w // 2, h // 2), LavaEntity())
     return gridstate
 
 
-def build_level_power_ghost(seed: int = 111) -> GridState:
+def build_level_power_ghost(seed: int = 111, flyweight: bool = False) -> GridState:
     w, h = 13, 9
     gridstate = GridState(
         w,
@@ -225,16 +236,16 @@ def build_level_power_ghost(seed: int = 111) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     gridstate.add((1, h // 2), create_agent_entity())
     gridstate.add((w - 2, h // 2), ExitEntity())
     for y in range(h):
-        gridstate.add((w // 2, y), WallEntity())
+        gridstate.add((w // 2, y), _wall(flyweight))
     gridstate.add((2, h // 2 - 3), PhasingPowerUpEntity())
     return gridstate
 
 
-def build_level_power_boots(seed: int = 112) -> GridState:
+def build_level_power_boots(seed: int = 112, flyweight: bool = False) -> GridState:
     w, h = 13, 9
     gridstate = GridState(
         w,
@@ -244,19 +255,21 @@ def build_level_power_boots(seed: int = 112) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
     gridstate.add((1, h // 2), create_agent_entity(1))
     gridstate.add((w - 2, h // 2), ExitEntity())
     for y in range(h):
         if y not in [h // 2, h // 2 + 1]:
-            gridstate.add((w // 2, y), WallEntity())
-            gridstate.add((w // 2 + 1, y), WallEntity())
-            gridstate.add((w // 2 + 2, y), WallEntity())
+            gridstate.add((w // 2, y), _wall(flyweight))
+            gridstate.add((w // 2 + 1, y), _wall(flyweight))
+            gridstate.add((w // 2 + 2, y), _wall(flyweight))
     gridstate.add((w // 2 - 1, h // 2 + 1), SpeedPowerUpEntity())
     return gridstate
 
 
-def build_level_combined_mechanics(seed: int = 113) -> GridState:
+def build_level_combined_mechanics(
+    seed: int = 113, flyweight: bool = False
+) -> GridState:
     gridstate = GridState(
         width=7,
         height=7,
@@ -266,7 +279,7 @@ def build_level_combined_mechanics(seed: int = 113) -> GridState:
         turn_limit=TURN_LIMIT,
     )
 
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
 
     # Agent
     gridstate.add((0, 0), create_agent_entity())
@@ -297,7 +310,7 @@ def build_level_combined_mechanics(seed: int = 113) -> GridState:
         (1, 6),
         (3, 6),
     ]
-    gridstate.add_many([(pos, WallEntity()) for pos in wall_coords])
+    gridstate.add_many([(pos, _wall(flyweight)) for pos in wall_coords])
 
     # Items and doors
     gridstate.add((6, 3), GemEntity())
@@ -310,7 +323,7 @@ def build_level_combined_mechanics(seed: int = 113) -> GridState:
     return gridstate
 
 
-def build_level_boss(seed: int = 113) -> GridState:
+def build_level_boss(seed: int = 113, flyweight: bool = False) -> GridState:
     gridstate = GridState(
         width=7,
         height=7,
@@ -319,7 +332,7 @@ def build_level_boss(seed: int = 113) -> GridState:
         seed=seed,
         turn_limit=TURN_LIMIT,
     )
-    _floors(gridstate)
+    _floors(gridstate, flyweight)
 
     # Agent and Exit
     gridstate.add((0, 0), create_agent_entity(health=1))
@@ -344,7 +357,7 @@ def build_level_boss(seed: int = 113) -> GridState:
         (5, 5),
     ]
     for p in wall_pos:
-        gridstate.add(p, WallEntity())
+        gridstate.add(p, _wall(flyweight))
 
     # Pushable box
     gridstate.add((2, 1), BoxEntity())
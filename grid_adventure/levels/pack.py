@@ -0,0 +1,182 @@
+"""Memory-mapped packs of many Grid Adventure levels.
+
+A pack file is a header, the levels in the binary level format of
+``grid_adventure.levels.binary`` back to back, and an index of ``count + 1``
+little-endian ``uint64`` offsets (level ``i`` spans ``offsets[i]`` to
+``offsets[i + 1]``). The header (``_HEADER``) holds the magic ``b"GALP"``, the
+pack version, the level count and the index offset; it is written last, so an
+interrupted build leaves no valid pack behind.
+
+``LevelPack`` maps the file read-only and decodes levels on demand. Pickling a
+pack only pickles its path: worker processes reopen the file and share the
+pages of one mapping through the OS page cache instead of each holding a copy.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Self
+
+import numpy as np
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from numpy.typing import NDArray
+
+from grid_adventure import bitboard, grid
+from grid_adventure.levels import binary
+
+MAGIC = b"GALP"
+PACK_VERSION = 1
+
+_HEADER = struct.Struct("<4sBxxxQQ")
+
+
+class LevelPackWriter:
+    """Stream levels into a pack file.
+
+    Levels are encoded and written as they are added; only their offsets are
+    kept in memory. Use as a context manager, or call ``close()`` to write the
+    index and header.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+        # Owned by the writer until close(), which __exit__ calls.
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._file.write(bytes(_HEADER.size))
+        self._offsets: list[int] = [_HEADER.size]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def add_board(self, board: bitboard.Bitboard) -> int:
+        """Append an unbatched Bitboard; return its index in the pack."""
+        data = binary.encode_board(board)
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+        return len(self._offsets) - 2
+
+    def add(self, gridstate: GridState) -> int:
+        """Append a GridState; return its index in the pack."""
+        return self.add_board(bitboard.from_gridstate(gridstate))
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._offsets[-1]
+        self._file.write(np.asarray(self._offsets, dtype="<u8").tobytes())
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, PACK_VERSION, len(self), index_offset))
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def write_pack(path: str | os.PathLike[str], levels: Iterable[GridState]) -> int:
+    """Write levels from any iterable to a pack file; return the level count."""
+    with LevelPackWriter(path) as writer:
+        for gridstate in levels:
+            writer.add(gridstate)
+        return len(writer)
+
+
+class LevelPack:
+    """Read-only, memory-mapped view of a pack file.
+
+    Indexing returns a ``GridState`` (``pack[i]``); ``board(i)`` and
+    ``state(i)`` decode to a Bitboard or a State instead. Negative indices
+    count from the end.
+
+    Raises:
+        ValueError: If the file is not a level pack of a supported version.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, index_offset = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError("Not a Grid Adventure level pack (bad magic).")
+        if version != PACK_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported level pack version {version}.")
+        self._offsets: NDArray[np.uint64] = np.frombuffer(
+            self._mmap, "<u8", count + 1, index_offset
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _index(self, index: int) -> int:
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError(f"Level index {index} out of range for {count} levels.")
+        return index % count
+
+    def _offset(self, index: int) -> int:
+        return int(self._offsets[self._index(index)])
+
+    def raw(self, index: int) -> bytes:
+        """Return the encoded bytes of one level."""
+        index = self._index(index)
+        return self._mmap[int(self._offsets[index]) : int(self._offsets[index + 1])]
+
+    def board(self, index: int) -> bitboard.Bitboard:
+        return binary.decode_board(self._mmap, self._offset(index))
+
+    def gridstate(self, index: int) -> GridState:
+        return binary.decode_level(self._mmap, self._offset(index))
+
+    def state(self, index: int) -> State:
+        return grid.to_state(self.gridstate(index))
+
+    def state_fn(self, index: int) -> Callable[[], State]:
+        """Return a picklable initial-state function for one level.
+
+        Functions of one pack pickled together reopen a single mapping.
+        """
+        self._index(index)
+        return _PackStateFn(self, index)
+
+    def __getitem__(self, index: int) -> GridState:
+        return self.gridstate(index)
+
+    def __iter__(self) -> Iterator[GridState]:
+        for index in range(len(self)):
+            yield self.gridstate(index)
+
+    def close(self) -> None:
+        # The index array views the mapping and has to go first.
+        self._offsets = np.zeros(1, dtype="<u8")
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["path"])  # type: ignore[misc]
+
+
+@dataclass(frozen=True)
+class _PackStateFn:
+    """``initial_state_fn`` loading one level of a pack; ignores env arguments."""
+
+    pack: LevelPack
+    index: int
+
+    def __call__(self, *args: Any, **kwargs: Any) -> State:
+        return self.pack.state(self.index)
@@ -0,0 +1,321 @@
+"""Seeded procedural generation of Grid Adventure levels.
+
+``generate_board`` scatters walls and the entities of a ``GeneratorConfig``
+over a bordered room and keeps the first layout for which ``witness_plan``
+finds a solution. Levels are built as Bitboards and converted to ``GridState``
+only on demand; workers of ``generate_boards``/``generate_levels`` send them
+back in the binary level format.
+
+``witness_plan`` is a sound but incomplete solvability check: it greedily
+collects keys, opens the doors it can reach, collects every gem and walks to
+the exit, never entering lava or boxes and never picking up power-ups, and
+returns the actions it took. A layout it accepts is solvable under the rules of
+``grid_adventure.step`` (the plan wins when replayed); a layout it rejects may
+still be solvable by pushing boxes, crossing lava or using power-ups, so those
+entities act as optional mechanics in generated levels.
+
+Every level index gets its own seed (``level_seed``), so a batch of levels is
+the same whatever the number of worker processes.
+"""
+
+import multiprocessing
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.gridstate import GridState
+from numpy.typing import NDArray
+
+from grid_adventure import bitboard
+from grid_adventure.constants import DEFAULT_AGENT_HEALTH
+from grid_adventure.levels import binary
+from grid_adventure.movements import MOVEMENTS
+from grid_adventure.objectives import OBJECTIVES
+
+_P = bitboard.PLANE_INDEX
+_A = bitboard.AGENT_INDEX
+
+# Entities placed on free floor cells, one per cell: (config field, plane).
+_PLACED: tuple[tuple[str, int], ...] = (
+    ("gems", _P["gem"]),
+    ("keys", _P["key"]),
+    ("doors", _P["locked_door"]),
+    ("coins", _P["coin"]),
+    ("lava", _P["lava"]),
+    ("boxes", _P["box"]),
+    ("speed", _P["speed"]),
+    ("shield", _P["shield"]),
+    ("phasing", _P["phasing"]),
+)
+_BLOCKED = [_P["wall"], _P["locked_door"], _P["box"], _P["lava"]]
+_MOVES = (
+    (Action.UP, 0, -1),
+    (Action.DOWN, 0, 1),
+    (Action.LEFT, -1, 0),
+    (Action.RIGHT, 1, 0),
+)
+# USE_KEY search order of the rules: current cell, left, right, up, down.
+_UNLOCK_OFFSETS = ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Size and mechanic mix of generated levels.
+
+    Entity counts are per level; ``doors`` locked doors are placed alongside
+    ``keys`` keys. ``wall_density`` is the chance of an interior wall per cell.
+    """
+
+    width: int = 11
+    height: int = 9
+    wall_density: float = 0.2
+    gems: int = 2
+    keys: int = 1
+    doors: int = 1
+    coins: int = 2
+    lava: int = 2
+    boxes: int = 1
+    speed: int = 0
+    shield: int = 0
+    phasing: int = 0
+    agent_health: int = DEFAULT_AGENT_HEALTH
+    turn_limit: int | None = None
+    max_attempts: int = 100
+
+    def __post_init__(self) -> None:
+        if self.width < 3 or self.height < 3:
+            raise ValueError("Levels need at least 3x3 cells.")
+        interior = (self.width - 2) * (self.height - 2)
+        if 2 + sum(getattr(self, name) for name, _ in _PLACED) > interior:
+            raise ValueError(
+                f"{self.width}x{self.height} levels have too few cells for "
+                "the configured entities."
+            )
+
+
+def level_seed(seed: int, index: int) -> int:
+    """Return the seed of level ``index`` in a batch generated from ``seed``."""
+    return int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+
+
+def _bfs(
+    passable: NDArray[np.bool_], start: tuple[int, int]
+) -> dict[tuple[int, int], tuple[tuple[int, int] | None, int]]:
+    """Breadth-first (parent, distance) of every cell reachable from ``start``."""
+    height, width = passable.shape
+    tree: dict[tuple[int, int], tuple[tuple[int, int] | None, int]] = {start: (None, 0)}
+    queue = deque([start])
+    while queue:
+        x, y = cell = queue.popleft()
+        distance = tree[cell][1] + 1
+        for _, dx, dy in _MOVES:
+            nx, ny = x + dx, y + dy
+            if (
+                0 <= nx < width
+                and 0 <= ny < height
+                and passable[ny, nx]
+                and (nx, ny) not in tree
+            ):
+                tree[nx, ny] = (cell, distance)
+                queue.append((nx, ny))
+    return tree
+
+
+def _path(
+    tree: dict[tuple[int, int], tuple[tuple[int, int] | None, int]],
+    target: tuple[int, int],
+) -> list[Action]:
+    actions: list[Action] = []
+    cell = target
+    while (parent := tree[cell][0]) is not None:
+        dx, dy = cell[0] - parent[0], cell[1] - parent[1]
+        actions.append(next(a for a, mx, my in _MOVES if (mx, my) == (dx, dy)))
+        cell = parent
+    actions.reverse()
+    return actions
+
+
+def _cells(plane: NDArray[np.uint8]) -> list[tuple[int, int]]:
+    return [(int(x), int(y)) for y, x in np.argwhere(plane)]
+
+
+def _nearest(
+    tree: dict[tuple[int, int], tuple[tuple[int, int] | None, int]],
+    cells: list[tuple[int, int]],
+) -> tuple[int, int] | None:
+    """Closest of ``cells`` in a ``_bfs`` tree, or None if none is reachable."""
+    reachable = [cell for cell in cells if cell in tree]
+    return min(reachable, key=lambda cell: tree[cell][1], default=None)
+
+
+def witness_plan(board: bitboard.Bitboard) -> list[Action] | None:
+    """Return a winning action sequence found greedily, or None.
+
+    See the module docstring for what the search covers. With a turn limit the
+    plan must finish before the limit is reached.
+    """
+    planes = board.planes.copy()
+    agent = board.agent
+    pos = (int(agent[_A["x"]]), int(agent[_A["y"]]))
+    keys = int(agent[_A["keys"]])
+    height, width = planes.shape[1:]
+    plan: list[Action] = []
+    while True:
+        tree = _bfs(planes[_BLOCKED].sum(axis=0) == 0, pos)
+        gems = _cells(planes[_P["gem"]])
+        target = _nearest(tree, gems)
+        if target is None and not gems:
+            target = _nearest(tree, _cells(planes[_P["exit"]]))
+            if target is not None:
+                # Standing on the exit already: any action ends the episode.
+                plan += _path(tree, target) or [Action.WAIT]
+                limit = int(agent[_A["turn_limit"]])
+                return plan if limit < 0 or len(plan) < limit else None
+        if target is not None:
+            plan += [*_path(tree, target), Action.PICK_UP]
+            planes[_P["gem"], target[1], target[0]] = 0
+            pos = target
+            continue
+
+        doors = _cells(planes[_P["locked_door"]])
+        if not doors:
+            return None
+        key = _nearest(tree, _cells(planes[_P["key"]]))
+        if key is not None:
+            plan += [*_path(tree, key), Action.PICK_UP]
+            keys += int(planes[_P["key"], key[1], key[0]])
+            planes[_P["key"], key[1], key[0]] = 0
+            pos = key
+            continue
+        if keys == 0:
+            return None
+        stand = _nearest(
+            tree,
+            [
+                (x + dx, y + dy)
+                for x, y in doors
+                for _, dx, dy in _MOVES
+                if 0 <= x + dx < width and 0 <= y + dy < height
+            ],
+        )
+        if stand is None:
+            return None
+        plan += [*_path(tree, stand), Action.USE_KEY]
+        pos = stand
+        for dx, dy in _UNLOCK_OFFSETS:
+            x, y = pos[0] + dx, pos[1] + dy
+            if keys and 0 <= x < width and 0 <= y < height:
+                while keys and planes[_P["locked_door"], y, x]:
+                    planes[_P["locked_door"], y, x] -= 1
+                    planes[_P["unlocked_door"], y, x] += 1
+                    keys -= 1
+
+
+def _layout(
+    config: GeneratorConfig, rng: np.random.Generator, seed: int
+) -> bitboard.Bitboard | None:
+    width, height = config.width, config.height
+    planes = np.zeros((len(bitboard.PLANES), height, width), dtype=np.uint8)
+    planes[_P["floor"]] = 1
+    walls = planes[_P["wall"]]
+    walls[[0, -1], :] = 1
+    walls[:, [0, -1]] = 1
+    walls[1:-1, 1:-1] = rng.random((height - 2, width - 2)) < config.wall_density
+
+    counts = [getattr(config, name) for name, _ in _PLACED]
+    free = np.flatnonzero(walls == 0)
+    if len(free) < 2 + sum(counts):
+        return None
+    cells = rng.choice(free, size=2 + sum(counts), replace=False)
+    agent_cell, exit_cell = cells[:2]
+    planes[_P["exit"]].flat[exit_cell] = 1
+    start = 2
+    for count, (_, plane) in zip(counts, _PLACED):
+        planes[plane].flat[cells[start : start + count]] = 1
+        start += count
+
+    agent = np.zeros(len(bitboard.AGENT_FIELDS), dtype=np.int32)
+    agent[_A["y"]], agent[_A["x"]] = divmod(int(agent_cell), width)
+    agent[_A["health"]] = agent[_A["max_health"]] = config.agent_health
+    agent[_A["turn_limit"]] = -1 if config.turn_limit is None else config.turn_limit
+    num_slots = max(1, config.speed + config.shield + config.phasing)
+    level = bitboard.LevelInfo(
+        MOVEMENTS["cardinal"], OBJECTIVES["collect_gems_and_exit"], seed
+    )
+    return bitboard.Bitboard(
+        planes, agent, np.zeros((num_slots, 2), dtype=np.int32), (level,)
+    )
+
+
+def generate_board(config: GeneratorConfig, seed: int) -> bitboard.Bitboard:
+    """Generate one solvable level as a Bitboard.
+
+    Raises:
+        RuntimeError: If no layout in ``config.max_attempts`` is accepted.
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(config.max_attempts):
+        board = _layout(config, rng, seed)
+        if board is not None and witness_plan(board) is not None:
+            return board
+    raise RuntimeError(
+        f"No solvable layout found in {config.max_attempts} attempts (seed {seed})."
+    )
+
+
+def generate_level(
+    config: GeneratorConfig, seed: int, flyweight: bool = False
+) -> GridState:
+    """Generate one solvable level as a GridState."""
+    return bitboard.to_gridstate(generate_board(config, seed), flyweight=flyweight)
+
+
+def _generate_encoded(task: tuple[GeneratorConfig, int]) -> bytes:
+    config, seed = task
+    return binary.encode_board(generate_board(config, seed))
+
+
+def generate_boards(
+    config: GeneratorConfig,
+    count: int,
+    seed: int = 0,
+    processes: int | None = 1,
+    chunksize: int = 16,
+    context: str | None = None,
+) -> Iterator[bitboard.Bitboard]:
+    """Generate ``count`` levels in index order.
+
+    Args:
+        config: Size and mechanic mix.
+        count: Number of levels.
+        seed: Batch seed; level ``i`` uses ``level_seed(seed, i)``.
+        processes: Worker processes (``None`` for one per CPU, 1 to generate
+            in this process).
+        chunksize: Levels per task sent to a worker.
+        context: Multiprocessing start method (default: the platform's).
+    """
+    tasks = ((config, level_seed(seed, index)) for index in range(count))
+    if processes == 1:
+        for task in tasks:
+            yield generate_board(*task)
+        return
+    with multiprocessing.get_context(context).Pool(processes) as pool:
+        for data in pool.imap(_generate_encoded, tasks, chunksize=chunksize):
+            yield binary.decode_board(data)
+
+
+def generate_levels(
+    config: GeneratorConfig,
+    count: int,
+    seed: int = 0,
+    processes: int | None = 1,
+    chunksize: int = 16,
+    context: str | None = None,
+    flyweight: bool = False,
+) -> Iterator[GridState]:
+    """Generate ``count`` GridStates in index order (see ``generate_boards``)."""
+    boards = generate_boards(config, count, seed, processes, chunksize, context)
+    for board in boards:
+        yield bitboard.to_gridstate(board, flyweight=flyweight)
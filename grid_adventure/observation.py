@@ -0,0 +1,284 @@
+"""Dense tensor observations for Grid Adventure.
+
+The tensor observation is built straight from the ``State`` component maps,
+without going through ``GridState`` or the image renderer. ``image_info`` builds
+the ``info`` part of image observations the same way.
+"""
+
+from typing import Any, TypedDict
+
+import numpy as np
+from grid_universe.state import State
+from grid_universe.types import EntityID
+from gymnasium import spaces
+from numpy.typing import NDArray
+
+# One binary channel per Grid Adventure entity class, indexed as grid[c, y, x].
+TENSOR_CHANNELS: tuple[str, ...] = (
+    "agent",
+    "floor",
+    "wall",
+    "lava",
+    "coin",
+    "gem",
+    "key",
+    "locked_door",
+    "unlocked_door",
+    "box",
+    "exit",
+    "speed",
+    "shield",
+    "phasing",
+)
+CHANNEL_INDEX: dict[str, int] = {name: i for i, name in enumerate(TENSOR_CHANNELS)}
+
+# Agent summary vector. Effect timers/uses are -1 when unlimited, 0 when inactive.
+TENSOR_VECTOR_FIELDS: tuple[str, ...] = (
+    "health",
+    "max_health",
+    "speed_turns",
+    "phasing_turns",
+    "shield_uses",
+    "keys",
+    "gems",
+    "coins",
+)
+VECTOR_INDEX: dict[str, int] = {name: i for i, name in enumerate(TENSOR_VECTOR_FIELDS)}
+
+# Appearance name -> channel. Doors are split on the Locked component.
+_APPEARANCE_CHANNELS: dict[str, int] = {
+    "human": CHANNEL_INDEX["agent"],
+    "floor": CHANNEL_INDEX["floor"],
+    "wall": CHANNEL_INDEX["wall"],
+    "lava": CHANNEL_INDEX["lava"],
+    "coin": CHANNEL_INDEX["coin"],
+    "gem": CHANNEL_INDEX["gem"],
+    "core": CHANNEL_INDEX["gem"],
+    "key": CHANNEL_INDEX["key"],
+    "box": CHANNEL_INDEX["box"],
+    "exit": CHANNEL_INDEX["exit"],
+    "boots": CHANNEL_INDEX["speed"],
+    "shield": CHANNEL_INDEX["shield"],
+    "ghost": CHANNEL_INDEX["phasing"],
+}
+
+_INT32_MAX = int(np.iinfo(np.int32).max)
+
+
+class TensorObservation(TypedDict):
+    """Tensor observation: (C, H, W) channel grid plus agent summary vector."""
+
+    grid: NDArray[np.uint8]
+    vector: NDArray[np.int32]
+
+
+def tensor_observation_space(width: int, height: int) -> spaces.Dict:
+    """Return the observation space of tensor observations for a grid size."""
+    return spaces.Dict(
+        {
+            "grid": spaces.Box(
+                low=0,
+                high=1,
+                shape=(len(TENSOR_CHANNELS), height, width),
+                dtype=np.uint8,
+            ),
+            "vector": spaces.Box(
+                low=-1,
+                high=_INT32_MAX,
+                shape=(len(TENSOR_VECTOR_FIELDS),),
+                dtype=np.int32,
+            ),
+        }
+    )
+
+
+def _entity_channel(state: State, eid: EntityID) -> int | None:
+    """Return the tensor channel of a positioned entity, or None if unmapped."""
+    if eid in state.agent:
+        return CHANNEL_INDEX["agent"]
+    appearance = state.appearance.get(eid)
+    if appearance is None:
+        return None
+    if appearance.name == "door":
+        if eid in state.locked:
+            return CHANNEL_INDEX["locked_door"]
+        return CHANNEL_INDEX["unlocked_door"]
+    return _APPEARANCE_CHANNELS.get(appearance.name)
+
+
+def _effect_limit(state: State, effect_id: EntityID) -> int:
+    """Remaining turns/uses of an effect; -1 when unlimited."""
+    if effect_id in state.time_limit:
+        return int(state.time_limit[effect_id].amount)
+    if effect_id in state.usage_limit:
+        return int(state.usage_limit[effect_id].amount)
+    return -1
+
+
+def _merge_limit(current: int, limit: int) -> int:
+    """Combine limits of stacked effects; unlimited (-1) dominates."""
+    if current == -1 or limit == -1:
+        return -1
+    return max(current, limit)
+
+
+def agent_vector(
+    state: State, agent_id: EntityID, out: NDArray[np.int32] | None = None
+) -> NDArray[np.int32]:
+    """Write the agent summary vector (see ``TENSOR_VECTOR_FIELDS``)."""
+    vector = np.zeros(len(TENSOR_VECTOR_FIELDS), dtype=np.int32) if out is None else out
+    vector.fill(0)
+
+    health = state.health.get(agent_id)
+    if health is not None:
+        vector[VECTOR_INDEX["health"]] = health.current_health
+        vector[VECTOR_INDEX["max_health"]] = health.max_health
+
+    status = state.status.get(agent_id)
+    if status is not None:
+        speed = phasing = shield = 0
+        for effect_id in status.effect_ids:
+            limit = _effect_limit(state, effect_id)
+            if effect_id in state.speed:
+                speed = _merge_limit(speed, limit)
+            if effect_id in state.phasing:
+                phasing = _merge_limit(phasing, limit)
+            if effect_id in state.immunity:
+                # Usage-limited shields are consumed one at a time, so uses add up.
+                shield = -1 if shield == -1 or limit == -1 else shield + limit
+        vector[VECTOR_INDEX["speed_turns"]] = speed
+        vector[VECTOR_INDEX["phasing_turns"]] = phasing
+        vector[VECTOR_INDEX["shield_uses"]] = shield
+
+    inventory = state.inventory.get(agent_id)
+    if inventory is not None:
+        for item_id in inventory.item_ids:
+            if item_id in state.key:
+                vector[VECTOR_INDEX["keys"]] += 1
+            elif item_id in state.requirable:
+                vector[VECTOR_INDEX["gems"]] += 1
+            elif item_id in state.rewardable:
+                vector[VECTOR_INDEX["coins"]] += 1
+    return vector
+
+
+def state_to_tensor(
+    state: State,
+    agent_id: EntityID | None = None,
+    out: TensorObservation | None = None,
+) -> TensorObservation:
+    """Build a tensor observation from a State.
+
+    Args:
+        state: The state to encode.
+        agent_id: The agent to summarize; defaults to the state's only agent.
+        out: Optional preallocated observation to write into.
+
+    Returns:
+        The tensor observation (``out`` if given).
+    """
+    if agent_id is None:
+        agent_id = next(iter(state.agent.keys()))
+    if out is None:
+        out = TensorObservation(
+            grid=np.zeros(
+                (len(TENSOR_CHANNELS), state.height, state.width), dtype=np.uint8
+            ),
+            vector=np.zeros(len(TENSOR_VECTOR_FIELDS), dtype=np.int32),
+        )
+    grid = out["grid"]
+    grid.fill(0)
+
+    channels: list[int] = []
+    ys: list[int] = []
+    xs: list[int] = []
+    for eid, pos in state.position.items():
+        channel = _entity_channel(state, eid)
+        if channel is None:
+            continue
+        channels.append(channel)
+        ys.append(pos.y)
+        xs.append(pos.x)
+    grid[channels, ys, xs] = 1
+
+    agent_vector(state, agent_id, out=out["vector"])
+    return out
+
+
+def _name(obj: Any) -> str:
+    return "" if obj is None else type(obj).__name__
+
+
+def image_info(state: State, agent_id: EntityID) -> dict[str, Any]:
+    """Build the ``info`` dictionary of an image observation.
+
+    See ``docs/agent-doc/image_observation.md`` for the structure.
+    """
+    health = state.health.get(agent_id)
+    effects: list[dict[str, Any]] = []
+    status = state.status.get(agent_id)
+    for effect_id in status.effect_ids if status is not None else ():
+        effect_type = ""
+        if effect_id in state.immunity:
+            effect_type = "IMMUNITY"
+        elif effect_id in state.phasing:
+            effect_type = "PHASING"
+        elif effect_id in state.speed:
+            effect_type = "SPEED"
+        limit_type = ""
+        if effect_id in state.time_limit:
+            limit_type = "TIME"
+        elif effect_id in state.usage_limit:
+            limit_type = "USAGE"
+        effects.append(
+            {
+                "id": int(effect_id),
+                "type": effect_type,
+                "limit_type": limit_type,
+                "limit_amount": _effect_limit(state, effect_id),
+                "multiplier": int(state.speed[effect_id].multiplier)
+                if effect_id in state.speed
+                else -1,
+            }
+        )
+
+    inventory_items: list[dict[str, Any]] = []
+    inventory = state.inventory.get(agent_id)
+    for item_id in inventory.item_ids if inventory is not None else ():
+        item_type = "item"
+        if item_id in state.key:
+            item_type = "key"
+        elif item_id in state.requirable:
+            item_type = "gem"
+        elif item_id in state.rewardable:
+            item_type = "coin"
+        appearance = state.appearance.get(item_id)
+        inventory_items.append(
+            {
+                "id": int(item_id),
+                "type": item_type,
+                "appearance_name": appearance.name if appearance is not None else "",
+            }
+        )
+
+    phase = "win" if state.win else "lose" if state.lose else "ongoing"
+    return {
+        "agent": {
+            "health": {
+                "current_health": health.current_health if health else -1,
+                "max_health": health.max_health if health else -1,
+            },
+            "effects": effects,
+            "inventory": inventory_items,
+        },
+        "status": {"score": state.score, "phase": phase, "turn": state.turn},
+        "config": {
+            "movement": _name(state.movement),
+            "objective": _name(state.objective),
+            "seed": -1 if state.seed is None else state.seed,
+            "width": state.width,
+            "height": state.height,
+            "turn_limit": -1 if state.turn_limit is None else state.turn_limit,
+        },
+        "message": state.message or "",
+    }
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
-
-import streamlit as st
+from typing import TYPE_CHECKING, Any
 
 from grid_universe.state import State
-from grid_universe.renderer.image import ImageMap
 
-from grid_adventure.env import GridAdventureEnv
 from grid_adventure.objectives import OBJECTIVES
 from grid_adventure.movements import MOVEMENTS
 from grid_adventure.rendering import IMAGE_MAP, DEFAULT_ASSET_ROOT
@@ -32,6 +28,13 @@ from grid_adventure.entities import (
 from grid_play.config.sources.base import register_level_source
 from grid_play.config.sources.level_editor import ToolSpec, make_level_editor_source
 
+# streamlit and the environment are imported on first use, so registering the
+# plugin stays cheap.
+if TYPE_CHECKING:
+    from grid_universe.renderer.image import ImageMap
+
+    from grid_adventure.env import GridAdventureEnv
+
 
 # -----------------------
 # Parameter UIs
@@ -39,6 +42,8 @@ from grid_play.config.sources.level_editor import ToolSpec, make_level_editor_so
 
 
 def agent_params() -> dict[str, Any]:
+    import streamlit as st
+
     return {
         "health": int(
             st.number_input(
@@ -49,6 +54,8 @@ def agent_params() -> dict[str, Any]:
 
 
 def direction_params(prefix: str) -> dict[str, Any]:
+    import streamlit as st
+
     direction = st.selectbox(
         "Direction", ["up", "down", "left", "right"], index=1, key=f"{prefix}_direction"
     )
@@ -167,6 +174,8 @@ def _asset_root_resolver(image_map: ImageMap) -> str:
 def _env_factory(
     initial_state_fn: Callable[..., State], image_map: ImageMap
 ) -> GridAdventureEnv:
+    from grid_adventure.env import GridAdventureEnv
+
     sample_state = initial_state_fn()
     return GridAdventureEnv(
         render_mode="rgb_array",
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from grid_universe.state import State
-from grid_universe.renderer.image import ImageMap
 
-from grid_adventure.env import GridAdventureEnv
 from grid_adventure.rendering import IMAGE_MAP
 from grid_adventure.levels import intro as adv_intro_levels
 
@@ -15,6 +14,11 @@ from grid_play.config.sources.level_selection import (
 )
 from grid_play.config.sources.base import register_level_source
 
+if TYPE_CHECKING:
+    from grid_universe.renderer.image import ImageMap
+
+    from grid_adventure.env import GridAdventureEnv
+
 BUILDERS: dict[str, Builder] = {
     "A0 Basic Movement": adv_intro_levels.build_level_basic_movement,
     "A1 Maze Turns": adv_intro_levels.build_level_maze_turns,
@@ -34,6 +38,8 @@ BUILDERS: dict[str, Builder] = {
 def _env_factory(
     initial_state_fn: Callable[..., State], _image_map: ImageMap
 ) -> GridAdventureEnv:
+    from grid_adventure.env import GridAdventureEnv
+
     sample_state: State = initial_state_fn()
     return GridAdventureEnv(
         render_mode="rgb_array",
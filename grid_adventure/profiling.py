@@ -0,0 +1,195 @@
+"""Per-phase profiling of ``GridAdventureEnv.reset`` and ``step``.
+
+A ``StepProfiler`` passed to ``GridAdventureEnv(profiler=...)`` records, for
+every ``reset`` and ``step``, the wall time and the net number of allocated
+memory blocks (``sys.getallocatedblocks``: allocations minus frees) of each
+phase:
+
+- ``from_state`` and ``specialize``: the GridState conversion of ``gridstate``
+  observations (``grid_universe`` conversion, then Grid Adventure entity
+  specialization)
+- ``tensor``: building ``tensor`` observations
+- ``render``: rendering image observations (with the base renderer this also
+  covers its ``info`` assembly)
+- ``info``: the ``info`` part of image observations of the tile renderer
+- ``rules`` (``step``) and ``initial_state`` (``reset``): the remaining time,
+  i.e. rule evaluation or level construction plus environment bookkeeping
+- ``total``: the whole call
+
+Samples are aggregated per ``"<call>/<phase>"`` key (e.g. ``"step/render"``)
+into rolling windows of the last ``window`` calls, summarized by ``stats()``
+and ``histogram()``. An optional ``callback`` receives every sample, and with
+``include_in_info=True`` the environment adds the sample to ``info["profile"]``.
+
+Without a profiler the environment skips all of this; the only cost is one
+``None`` check per call.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_WINDOW = 1024
+
+# phase -> (seconds, net allocated blocks) of one reset/step.
+ProfileSample = dict[str, tuple[float, int]]
+
+# Phase that receives the time not covered by an instrumented phase.
+_RESIDUAL_PHASE = {"reset": "initial_state", "step": "rules"}
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Summary of the rolling window of one phase (times in microseconds)."""
+
+    count: int
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+    mean_blocks: float
+
+
+class _Window:
+    """Ring buffer of the last ``size`` samples of one phase."""
+
+    def __init__(self, size: int) -> None:
+        self.seconds = np.zeros(size, np.float64)
+        self.blocks = np.zeros(size, np.int64)
+        self.count = 0
+
+    def add(self, seconds: float, blocks: int) -> None:
+        i = self.count % len(self.seconds)
+        self.seconds[i] = seconds
+        self.blocks[i] = blocks
+        self.count += 1
+
+    def filled(self) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+        n = min(self.count, len(self.seconds))
+        return self.seconds[:n], self.blocks[:n]
+
+
+class _Phase:
+    """Reusable context manager timing one phase."""
+
+    __slots__ = ("blocks", "name", "profiler", "start")
+
+    def __init__(self, profiler: "StepProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        seconds = time.perf_counter() - self.start
+        blocks = sys.getallocatedblocks() - self.blocks
+        sample = self.profiler._sample
+        previous = sample.get(self.name, (0.0, 0))
+        sample[self.name] = (previous[0] + seconds, previous[1] + blocks)
+
+
+class StepProfiler:
+    """Rolling per-phase timings of environment calls (see the module docstring).
+
+    Args:
+        window: Number of calls kept per phase.
+        callback: Called as ``callback(call, sample)`` after every call, with
+            ``call`` ``"reset"`` or ``"step"``.
+        include_in_info: Add the sample to ``info["profile"]``.
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        callback: Callable[[str, ProfileSample], None] | None = None,
+        include_in_info: bool = False,
+    ) -> None:
+        self.window = window
+        self.callback = callback
+        self.include_in_info = include_in_info
+        self._phases: dict[str, _Phase] = {}
+        self._windows: dict[str, _Window] = {}
+        self._sample: ProfileSample = {}
+        self._last: ProfileSample = {}
+        self._call = ""
+        self._start = 0.0
+        self._blocks = 0
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager adding its duration to phase ``name``."""
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(self, name)
+        return phase
+
+    def begin(self, call: str) -> None:
+        """Start profiling a ``"reset"`` or ``"step"`` call."""
+        self._call = call
+        self._sample = {}
+        self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+
+    def end(self) -> ProfileSample:
+        """Finish the current call, aggregate and return its sample."""
+        total = time.perf_counter() - self._start
+        blocks = sys.getallocatedblocks() - self._blocks
+        sample = self._sample
+        sample[_RESIDUAL_PHASE[self._call]] = (
+            total - sum(seconds for seconds, _ in sample.values()),
+            blocks - sum(count for _, count in sample.values()),
+        )
+        sample["total"] = (total, blocks)
+        for name, (seconds, count) in sample.items():
+            key = f"{self._call}/{name}"
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _Window(self.window)
+            window.add(seconds, count)
+        self._last = sample
+        if self.callback is not None:
+            self.callback(self._call, sample)
+        return sample
+
+    def last(self) -> ProfileSample:
+        """Return the sample of the most recent call."""
+        return dict(self._last)
+
+    def stats(self) -> dict[str, PhaseStats]:
+        """Summarize the rolling window of every ``"<call>/<phase>"`` key."""
+        stats = {}
+        for key, window in sorted(self._windows.items()):
+            seconds, blocks = window.filled()
+            p50, p90, p99 = np.percentile(seconds, (50, 90, 99)) * 1e6
+            stats[key] = PhaseStats(
+                window.count,
+                float(seconds.mean() * 1e6),
+                float(p50),
+                float(p90),
+                float(p99),
+                float(seconds.max() * 1e6),
+                float(blocks.mean()),
+            )
+        return stats
+
+    def histogram(
+        self, key: str, bins: int | Any = 20
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Return ``numpy.histogram`` counts and edges (microseconds) of a key.
+
+        Raises:
+            KeyError: If no call recorded the phase.
+        """
+        seconds, _ = self._windows[key].filled()
+        return np.histogram(seconds * 1e6, bins=bins)
+
+    def clear(self) -> None:
+        self._windows.clear()
+        self._last = {}
@@ -0,0 +1,424 @@
+"""Compact, deterministic recording and replay of Grid Adventure episodes.
+
+``EpisodeRecorder`` wraps a ``GridAdventureEnv`` and logs every episode as its
+level identity, seeds and action stream, packed 3 bits per ``Action``; no
+observation or state is stored. ``step`` is deterministic given the initial
+State, so ``Replay`` reconstructs the ``State``, ``GridState`` or image of any
+step by re-simulating the actions from the nearest checkpoint.
+
+A recording file starts with ``_FILE_HEADER`` (magic ``b"GAEP"`` and the
+format version) followed by records, each a ``_RECORD`` envelope (kind and
+payload size) and its payload:
+
+- ``RECORD_EPISODE`` starts an episode: ``_EPISODE`` (flags, reset seed, State
+  seed, fingerprint of the initial State, render resolution, level id length)
+  and the UTF-8 level id. Seeds are unsigned 64-bit; ``FLAG_TILES`` marks an
+  environment using the tile renderer.
+- ``RECORD_ACTIONS`` holds the next actions of the current episode: a
+  ``uint32`` count and the packed actions.
+
+Records are only ever appended, each with a single write, and actions are
+buffered and written every ``chunk_size`` steps and at the end of an episode.
+A record cut short by a crash is ignored when reading and dropped when the
+file is reopened for recording. Version 1 files, whose episodes have no render
+settings, are still read; their episodes replay with the tile renderer at its
+default resolution.
+
+Level ids are resolved to initial-state functions when replaying, either from
+a ``levels`` mapping or as a ``"module:attribute"`` reference (see
+``builder_id``) to a GridState builder or State function called without
+arguments.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import struct
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import gymnasium
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from numpy.typing import NDArray
+
+from grid_adventure import grid
+from grid_adventure.bitboard import action_index
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.hashing import state_fingerprint
+from grid_adventure.step import step as adv_step
+
+if TYPE_CHECKING:
+    from grid_adventure.rendering import TileRenderer
+
+MAGIC = b"GAEP"
+FORMAT_VERSION = 2
+
+RECORD_EPISODE = 1
+RECORD_ACTIONS = 2
+
+FLAG_HAS_RESET_SEED = 1
+FLAG_HAS_STATE_SEED = 2
+FLAG_TILES = 4
+
+ACTION_BITS = 3
+
+DEFAULT_CHUNK_SIZE = 4096
+DEFAULT_CHECKPOINT_INTERVAL = 64
+
+_FILE_HEADER = struct.Struct("<4sB")
+_RECORD = struct.Struct("<BI")
+_EPISODE = struct.Struct("<BQQQIH")
+_EPISODE_V1 = struct.Struct("<BqqQH")
+_SEED_LIMIT = 1 << 64
+_COUNT = struct.Struct("<I")
+
+_ACTIONS = tuple(Action)
+assert len(_ACTIONS) <= 1 << ACTION_BITS
+
+
+def pack_actions(actions: Any) -> bytes:
+    """Pack action indices into ``ACTION_BITS`` bits each (MSB first)."""
+    indices = np.asarray(actions, dtype=np.uint8).reshape(-1, 1)
+    bits = np.unpackbits(indices, axis=1)[:, -ACTION_BITS:]
+    return np.packbits(bits).tobytes()
+
+
+def unpack_actions(data: Any, count: int) -> NDArray[np.uint8]:
+    """Inverse of ``pack_actions`` for ``count`` actions."""
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))[: count * ACTION_BITS]
+    return np.packbits(bits.reshape(count, ACTION_BITS), axis=1)[:, 0] >> (
+        8 - ACTION_BITS
+    )
+
+
+def builder_id(fn: Callable[..., Any]) -> str:
+    """Return the ``"module:qualname"`` level id of a builder function."""
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+@dataclass(frozen=True)
+class EpisodeRecord:
+    """One recorded episode.
+
+    ``fingerprint`` is the ``state_fingerprint`` of the initial State, used to
+    check that a level id still resolves to the recorded level.
+    ``render_backend`` and ``render_resolution`` are the image settings of the
+    recorded environment (``None`` resolution: the renderer's default).
+    """
+
+    level_id: str
+    reset_seed: int | None
+    state_seed: int | None
+    fingerprint: int
+    actions: NDArray[np.uint8]
+    render_backend: str = "tiles"
+    render_resolution: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+
+class EpisodeRecorder(gymnasium.Wrapper):  # type: ignore[type-arg]
+    """Record the episodes of a ``GridAdventureEnv`` to an append-only file.
+
+    Args:
+        env: The environment to record.
+        path: Recording file; new episodes are appended if it exists.
+        level_id: Identity of the environment's level (see ``builder_id``).
+        chunk_size: Number of actions buffered before they are written.
+
+    Raises:
+        TypeError: If ``env`` does not wrap a ``GridAdventureEnv``.
+        ValueError: If ``path`` exists and is not a recording file of the
+            current version, or if a seed is outside ``[0, 2**64)``.
+    """
+
+    def __init__(
+        self,
+        env: gymnasium.Env,  # type: ignore[type-arg]
+        path: str | os.PathLike[str],
+        level_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(env)
+        if not isinstance(env.unwrapped, GridAdventureEnv):
+            raise TypeError("EpisodeRecorder needs a GridAdventureEnv.")
+        self.path = path
+        self.level_id = level_id
+        self.chunk_size = chunk_size
+        # Owned by the recorder until close(), which __exit__ calls.
+        self._file = open(path, "ab+")  # noqa: SIM115
+        self._file.seek(0)
+        header = self._file.read(_FILE_HEADER.size)
+        if not header:
+            self._file.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION))
+        elif _check_header(header) != FORMAT_VERSION:
+            self._file.close()
+            raise ValueError("Cannot append to an older recording version.")
+        else:
+            # Drop a record cut short by an earlier crash before appending.
+            self._file.truncate(_complete_length(self._file))
+        self._actions: list[int] = []
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        self._file.write(_RECORD.pack(kind, len(payload)) + payload)
+
+    def flush(self) -> None:
+        """Write the buffered actions of the current episode."""
+        if self._actions:
+            payload = _COUNT.pack(len(self._actions)) + pack_actions(self._actions)
+            self._write(RECORD_ACTIONS, payload)
+            self._actions.clear()
+        self._file.flush()
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        _check_seed(seed)
+        self.flush()
+        obs, info = self.env.reset(seed=seed, options=options)
+        unwrapped = self.env.unwrapped
+        state = unwrapped.state
+        _check_seed(state.seed)
+        flags = (
+            (FLAG_HAS_RESET_SEED if seed is not None else 0)
+            | (FLAG_HAS_STATE_SEED if state.seed is not None else 0)
+            | (FLAG_TILES if unwrapped.render_backend == "tiles" else 0)
+        )
+        level_id = self.level_id.encode()
+        header = _EPISODE.pack(
+            flags,
+            seed or 0,
+            state.seed or 0,
+            state_fingerprint(state),
+            unwrapped.render_resolution,
+            len(level_id),
+        )
+        self._write(RECORD_EPISODE, header + level_id)
+        return obs, info
+
+    def step(
+        self, action: Action | int
+    ) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        result = self.env.step(action)
+        self._actions.append(action_index(action))
+        if len(self._actions) >= self.chunk_size:
+            self.flush()
+        return result
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+        super().close()
+
+
+def _check_seed(seed: int | None) -> None:
+    if seed is not None and not 0 <= seed < _SEED_LIMIT:
+        raise ValueError(f"Seed {seed} is outside [0, 2**64).")
+
+
+def _check_header(header: bytes) -> int:
+    """Validate a file header and return its format version."""
+    if len(header) < _FILE_HEADER.size:
+        raise ValueError("Not a Grid Adventure recording (truncated header).")
+    magic, version = _FILE_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a Grid Adventure recording (bad magic).")
+    if version not in (1, FORMAT_VERSION):
+        raise ValueError(f"Unsupported recording version {version}.")
+    return version
+
+
+def _complete_length(f: BinaryIO) -> int:
+    """Return the length of the complete records of an open recording file."""
+    size = f.seek(0, os.SEEK_END)
+    end = _FILE_HEADER.size
+    while end + _RECORD.size <= size:
+        f.seek(end)
+        _, payload = _RECORD.unpack(f.read(_RECORD.size))
+        if end + _RECORD.size + payload > size:
+            break
+        end += _RECORD.size + payload
+    return end
+
+
+def read_episodes(path: str | os.PathLike[str]) -> list[EpisodeRecord]:
+    """Read every episode of a recording file.
+
+    Raises:
+        ValueError: If the file is not a recording of a supported version or
+            holds actions before its first episode.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    version = _check_header(data[: _FILE_HEADER.size])
+    episodes: list[tuple[tuple[Any, ...], str, list[NDArray[np.uint8]]]] = []
+    offset = _FILE_HEADER.size
+    while offset + _RECORD.size <= len(data):
+        kind, size = _RECORD.unpack_from(data, offset)
+        start, offset = offset + _RECORD.size, offset + _RECORD.size + size
+        if offset > len(data):
+            break  # Cut short by an interrupted write.
+        if kind == RECORD_EPISODE:
+            if version == 1:
+                flags, *seeds, fingerprint, _ = _EPISODE_V1.unpack_from(data, start)
+                header = (flags | FLAG_TILES, *seeds, fingerprint, 0)
+                level_start = start + _EPISODE_V1.size
+            else:
+                header = _EPISODE.unpack_from(data, start)[:-1]
+                level_start = start + _EPISODE.size
+            level_id = data[level_start:offset].decode()
+            episodes.append((header, level_id, []))
+        elif kind == RECORD_ACTIONS:
+            if not episodes:
+                raise ValueError("Recording has actions before its first episode.")
+            (count,) = _COUNT.unpack_from(data, start)
+            episodes[-1][2].append(
+                unpack_actions(data[start + _COUNT.size : offset], count)
+            )
+        else:
+            raise ValueError(f"Unknown recording record kind {kind}.")
+
+    records = []
+    for header, level_id, chunks in episodes:
+        flags, reset_seed, state_seed, fingerprint, resolution = header
+        records.append(
+            EpisodeRecord(
+                level_id,
+                reset_seed if flags & FLAG_HAS_RESET_SEED else None,
+                state_seed if flags & FLAG_HAS_STATE_SEED else None,
+                fingerprint,
+                np.concatenate(chunks) if chunks else np.zeros(0, np.uint8),
+                "tiles" if flags & FLAG_TILES else "base",
+                resolution or None,
+            )
+        )
+    return records
+
+
+def resolve_level(level_id: str) -> Callable[[], State]:
+    """Resolve a ``"module:attribute"`` level id to an initial-state function."""
+    module_name, sep, attribute = level_id.partition(":")
+    if not sep:
+        raise ValueError(f"Level id {level_id!r} is not a 'module:attribute' path.")
+    target: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+
+    def initial_state() -> State:
+        level = target()
+        return grid.to_state(level) if isinstance(level, GridState) else level
+
+    return initial_state
+
+
+class Replay:
+    """Random access to the steps of a recorded episode.
+
+    ``state(t)`` is the State after ``t`` actions (``0 <= t <= len(replay)``).
+    States are re-simulated from the nearest earlier checkpoint; a checkpoint is
+    kept every ``checkpoint_interval`` steps the first time it is reached.
+
+    Args:
+        record: The recorded episode.
+        levels: Level id -> initial-state function; ids not found fall back to
+            ``resolve_level``.
+        checkpoint_interval: Steps between checkpoints.
+        step_fn: The State step function.
+
+    Raises:
+        ValueError: If the level id resolves to a level other than the
+            recorded one.
+    """
+
+    def __init__(
+        self,
+        record: EpisodeRecord,
+        levels: Mapping[str, Callable[[], State]] | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        step_fn: Callable[[State, Action], State] = adv_step,
+    ) -> None:
+        self.record = record
+        self.checkpoint_interval = checkpoint_interval
+        self.step_fn = step_fn
+        initial_state_fn = (levels or {}).get(record.level_id)
+        if initial_state_fn is None:
+            initial_state_fn = resolve_level(record.level_id)
+        initial = initial_state_fn()
+        if initial.seed != record.state_seed:
+            initial = replace(initial, seed=record.state_seed)
+        if state_fingerprint(initial) != record.fingerprint:
+            raise ValueError(
+                f"Level {record.level_id!r} does not match the recorded level."
+            )
+        self._checkpoints: dict[int, State] = {0: initial}
+        self._render: Callable[[State], NDArray[np.uint8]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.record)
+
+    def state(self, t: int) -> State:
+        if not 0 <= t <= len(self):
+            raise IndexError(f"Step {t} out of range for {len(self)} actions.")
+        interval = self.checkpoint_interval
+        base = t - t % interval
+        while base not in self._checkpoints:
+            base -= interval
+        state = self._checkpoints[base]
+        actions = self.record.actions
+        for i in range(base, t):
+            state = self.step_fn(state, _ACTIONS[actions[i]])
+            if (i + 1) % interval == 0:
+                self._checkpoints.setdefault(i + 1, state)
+        return state
+
+    def gridstate(self, t: int) -> GridState:
+        return grid.from_state(self.state(t))
+
+    def image(self, t: int, renderer: TileRenderer | None = None) -> NDArray[np.uint8]:
+        """Render step ``t`` as the recorded environment rendered it.
+
+        By default the recorded render backend and resolution are used, with
+        the Grid Adventure assets; pass a ``renderer`` to draw with another
+        ``TileRenderer`` instead.
+        """
+        state = self.state(t)
+        if renderer is not None:
+            return renderer.render(state)
+        if self._render is None:
+            self._render = self._default_render()
+        return self._render(state)
+
+    def _default_render(self) -> Callable[[State], NDArray[np.uint8]]:
+        from grid_adventure.rendering import (
+            DEFAULT_ASSET_ROOT,
+            IMAGE_MAP,
+            ImageRenderer,
+            TileRenderer,
+        )
+
+        resolution = self.record.render_resolution
+        kwargs = {} if resolution is None else {"resolution": resolution}
+        if self.record.render_backend == "tiles":
+            from grid_adventure.sprites import shared_atlas
+
+            tiles = TileRenderer(
+                atlas=shared_atlas(DEFAULT_ASSET_ROOT, IMAGE_MAP), **kwargs
+            )
+            return tiles.render
+        base = ImageRenderer(**kwargs)
+        return lambda state: np.asarray(base.render(state))
+
+    def states(self) -> Iterator[State]:
+        """Yield the State of every step in order."""
+        state = self._checkpoints[0]
+        yield state
+        for action in self.record.actions:
+            state = self.step_fn(state, _ACTIONS[action])
+            yield state
@@ -1,7 +1,24 @@
+from __future__ import annotations
+
 import os
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Any
-from grid_universe.renderer.image import ImageMap, ImageRenderer as BaseImageRenderer
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from grid_universe.renderer.image import (
+    DEFAULT_RESOLUTION,
+    ImageMap,
+    ImageRenderer as BaseImageRenderer,
+)
+from grid_universe.state import State
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from grid_adventure.sprites import SpriteAtlas
 
 
 # Default asset root directory.
@@ -39,3 +56,383 @@ class ImageRenderer(BaseImageRenderer):
         **kwargs: Any,
     ):
         super().__init__(asset_root=asset_root, image_map=image_map, **kwargs)
+
+
+# Fraction of a cell used by collectible icons drawn next to another entity.
+SUBICON_PERCENT = 0.4
+
+# Appearances that never move during an episode. Together with background
+# appearances they form the static layer cached by ``TileRenderer``.
+STATIC_APPEARANCES = frozenset({"floor", "wall", "exit", "lava", "door"})
+
+# One drawable entity: (appearance, properties, variant, priority, icon, background).
+TileEntry = tuple[str, tuple[str, ...], int, int, bool, bool]
+TileStack = tuple[TileEntry, ...]
+
+
+def _variant(seed: int | None, eid: int) -> int:
+    """Deterministic texture variant of an entity within an episode."""
+    return ((seed or 0) * 2654435761 + eid * 40503) & 0x7FFFFFFF
+
+
+def _over(dst: NDArray[np.float32], src: NDArray[np.uint8]) -> None:
+    """Alpha-composite ``src`` over ``dst`` (RGB in 0..255, alpha in 0..1)."""
+    src_alpha = src[..., 3:].astype(np.float32) / 255.0
+    dst_alpha = dst[..., 3:] * (1.0 - src_alpha)
+    out_alpha = src_alpha + dst_alpha
+    rgb = src[..., :3] * src_alpha + dst[..., :3] * dst_alpha
+    dst[..., :3] = rgb / np.where(out_alpha > 0, out_alpha, 1.0)
+    dst[..., 3:] = out_alpha
+
+
+class TileRenderer:
+    """NumPy tile compositor for Grid Adventure states.
+
+    Sprites come from a ``SpriteAtlas``, so repeated renders do no file I/O or
+    resampling. The frame is ``resolution`` pixels wide with square cells of
+    ``resolution // width`` pixels. Each cell is composited independently from
+    its entity stack: entities are drawn back to front by decreasing appearance
+    priority, and icon entities sharing a cell with a non-background entity
+    (e.g. a coin under the agent) are drawn shrunk in the top-left corner.
+
+    With ``incremental=True`` the renderer keeps the last frame and its entity
+    stacks, and redraws only the cells whose stack changed. Because every cell
+    is composited independently, the result is pixel-identical to a full
+    render. Call ``reset()`` when a new episode starts; a change of grid size or
+    cell size also triggers a full render.
+
+    With ``static_background=True`` the bottom layers of each cell made of
+    static entities (background appearances and ``static_appearances``: floors,
+    walls, exits, lava, doors) are composited once into a cached background
+    layer. Renders then only composite the remaining entities on top of it. A
+    cell's cached layer is rebuilt only when its static entities change (e.g. a
+    door is unlocked). Only bottom layers are cached, so the result is still
+    pixel-identical to a full render.
+
+    Frames follow the base ``ImageRenderer`` layout, with two differences: the
+    texture variant of each entity is chosen by hashing the state seed and the
+    entity id, and shrunk icons always go in the top-left corner. With
+    single-variant assets the frames otherwise match the base renderer (see
+    ``test_tile_renderer_matches_base_renderer``).
+    """
+
+    def __init__(
+        self,
+        resolution: int = DEFAULT_RESOLUTION,
+        asset_root: str = DEFAULT_ASSET_ROOT,
+        image_map: ImageMap = IMAGE_MAP,
+        atlas: SpriteAtlas | None = None,
+        subicon_percent: float = SUBICON_PERCENT,
+        incremental: bool = False,
+        static_background: bool = False,
+        static_appearances: frozenset[str] = STATIC_APPEARANCES,
+    ) -> None:
+        self.resolution = resolution
+        self.incremental = incremental
+        self.static_background = static_background
+        self.static_appearances = static_appearances
+        self.image_map = image_map
+        if atlas is None:
+            from grid_adventure.sprites import SpriteAtlas
+
+            atlas = SpriteAtlas(asset_root, image_map)
+        self.atlas = atlas
+        self.subicon_percent = subicon_percent
+        self._properties = sorted({p for _, props in image_map for p in props})
+        self._lookup: dict[tuple[str, tuple[str, ...]], tuple[str, ...] | None] = {}
+        self._frame: NDArray[np.uint8] | None = None
+        self._frame_key: tuple[int, int, int] | None = None
+        self._stacks: dict[tuple[int, int], TileStack] = {}
+        self._background: NDArray[np.float32] | None = None
+        self._background_pixels: NDArray[np.uint8] | None = None
+        self._background_stacks: dict[tuple[int, int], TileStack] = {}
+
+    def cell_size(self, state: State) -> int:
+        return max(1, self.resolution // state.width)
+
+    def frame_shape(self, state: State) -> tuple[int, int, int]:
+        """Shape of the ``(H, W, 4)`` frame ``render`` returns for a state."""
+        size = self.cell_size(state)
+        return (state.height * size, state.width * size, 4)
+
+    def _map_properties(
+        self, appearance: str, properties: tuple[str, ...]
+    ) -> tuple[str, ...] | None:
+        """Most specific ``image_map`` properties matching an entity, if any."""
+        key = (appearance, properties)
+        if key not in self._lookup:
+            best: tuple[str, ...] | None = None
+            for name, props in self.image_map:
+                if name != appearance or not set(props) <= set(properties):
+                    continue
+                if best is None or len(props) > len(best):
+                    best = props
+            self._lookup[key] = best
+        return self._lookup[key]
+
+    def stacks(self, state: State) -> dict[tuple[int, int], TileStack]:
+        """Return the drawable entity stack of every non-empty cell."""
+        cells: dict[tuple[int, int], list[tuple[int, TileEntry]]] = {}
+        for eid, pos in state.position.items():
+            appearance = state.appearance.get(eid)
+            if appearance is None:
+                continue
+            properties = tuple(
+                p
+                for p in self._properties
+                if eid in (state.dead if p == "dead" else getattr(state, p, ()))
+            )
+            mapped = self._map_properties(appearance.name, properties)
+            if mapped is None:
+                continue
+            entry = (
+                appearance.name,
+                mapped,
+                _variant(state.seed, eid),
+                appearance.priority,
+                bool(appearance.icon),
+                bool(appearance.background),
+            )
+            cells.setdefault((pos.x, pos.y), []).append((eid, entry))
+        return {
+            cell: tuple(
+                entry
+                for _, entry in sorted(entries, key=lambda item: (-item[1][3], item[0]))
+            )
+            for cell, entries in cells.items()
+        }
+
+    def _is_static(self, entry: TileEntry) -> bool:
+        name, _, _, _, icon, background = entry
+        return not icon and (background or name in self.static_appearances)
+
+    def _split(self, stack: TileStack) -> tuple[TileStack, TileStack]:
+        """Split a stack into its static bottom layers and the rest."""
+        count = 0
+        while count < len(stack) and self._is_static(stack[count]):
+            count += 1
+        return stack[:count], stack[count:]
+
+    def _compose(
+        self,
+        tile: NDArray[np.float32],
+        entries: TileStack,
+        size: int,
+        shrink_icons: bool,
+    ) -> NDArray[np.float32]:
+        icon_size = max(1, int(size * self.subicon_percent))
+        icons = []
+        for name, properties, variant, _, icon, _ in entries:
+            if icon and shrink_icons:
+                icons.append((name, properties, variant))
+                continue
+            sprite = self.atlas.sprite(name, properties, variant, size)
+            if sprite is not None:
+                _over(tile, sprite)
+        for name, properties, variant in icons:
+            sprite = self.atlas.sprite(name, properties, variant, icon_size)
+            if sprite is not None:
+                _over(tile[:icon_size, :icon_size], sprite)
+        return tile
+
+    @staticmethod
+    def _to_pixels(tile: NDArray[np.float32]) -> NDArray[np.uint8]:
+        pixels = tile.copy()
+        pixels[..., 3] *= 255.0
+        return np.rint(pixels).astype(np.uint8)
+
+    def render_tile(self, stack: TileStack, size: int) -> NDArray[np.uint8]:
+        """Composite one cell from its entity stack."""
+        shrink_icons = any(not icon and not bg for _, _, _, _, icon, bg in stack)
+        tile = np.zeros((size, size, 4), dtype=np.float32)
+        return self._to_pixels(self._compose(tile, stack, size, shrink_icons))
+
+    def reset(self) -> None:
+        """Drop the previous frame and background; the next render is a full one."""
+        self._frame = None
+        self._frame_key = None
+        self._stacks = {}
+        self._background = None
+        self._background_pixels = None
+        self._background_stacks = {}
+
+    def _update_background(
+        self,
+        static: dict[tuple[int, int], TileStack],
+        size: int,
+        key: tuple[int, int, int],
+    ) -> None:
+        """Build the static layer, recompositing only cells whose layer changed."""
+        if self._background is None or self._frame_key != key:
+            width, height, _ = key
+            self._background = np.zeros((height * size, width * size, 4), np.float32)
+            self._background_pixels = np.zeros(self._background.shape, np.uint8)
+            self._background_stacks = {}
+        assert self._background_pixels is not None
+        previous = self._background_stacks
+        for x, y in static.keys() | previous.keys():
+            layer = static.get((x, y), ())
+            if layer == previous.get((x, y), ()):
+                continue
+            cell = np.s_[y * size : (y + 1) * size, x * size : (x + 1) * size]
+            self._background[cell] = 0.0
+            self._compose(self._background[cell], layer, size, False)
+            self._background_pixels[cell] = self._to_pixels(self._background[cell])
+        self._background_stacks = static
+
+    def render(
+        self, state: State, out: NDArray[np.uint8] | None = None
+    ) -> NDArray[np.uint8]:
+        """Render a state to an ``(H, W, 4)`` RGBA array.
+
+        With ``out`` (a writable array of ``frame_shape(state)``), the frame is
+        written into it and ``out`` is returned instead of a new array.
+        """
+        size = self.cell_size(state)
+        stacks = self.stacks(state)
+        key = (state.width, state.height, size)
+        shape = (state.height * size, state.width * size, 4)
+        if out is not None and (out.shape != shape or out.dtype != np.uint8):
+            raise ValueError(
+                f"Output buffer must be a uint8 array of shape {shape}, "
+                f"got {out.dtype} {out.shape}."
+            )
+        # Without an incremental frame to keep, render straight into ``out``.
+        direct = out is not None and not self.incremental
+
+        if not self.static_background:
+            frame = self._frame
+            if not self.incremental or frame is None or self._frame_key != key:
+                if direct:
+                    assert out is not None
+                    frame = out
+                    frame.fill(0)
+                else:
+                    frame = np.zeros(shape, np.uint8)
+                dirty: Iterable[tuple[int, int]] = stacks.keys()
+            else:
+                dirty = [
+                    cell
+                    for cell in stacks.keys() | self._stacks.keys()
+                    if stacks.get(cell) != self._stacks.get(cell)
+                ]
+            for x, y in dirty:
+                stack = stacks.get((x, y))
+                frame[y * size : (y + 1) * size, x * size : (x + 1) * size] = (
+                    self.render_tile(stack, size) if stack else 0
+                )
+        else:
+            layers = {cell: self._split(stack) for cell, stack in stacks.items()}
+            self._update_background(
+                {cell: static for cell, (static, _) in layers.items() if static},
+                size,
+                key,
+            )
+            assert self._background is not None
+            assert self._background_pixels is not None
+            frame = self._frame
+            if not self.incremental or frame is None or self._frame_key != key:
+                if direct:
+                    assert out is not None
+                    frame = out
+                    np.copyto(frame, self._background_pixels)
+                else:
+                    frame = self._background_pixels.copy()
+                dirty = [cell for cell, (_, rest) in layers.items() if rest]
+            else:
+                dirty = [
+                    cell
+                    for cell in stacks.keys() | self._stacks.keys()
+                    if stacks.get(cell) != self._stacks.get(cell)
+                ]
+            for x, y in dirty:
+                cell = np.s_[y * size : (y + 1) * size, x * size : (x + 1) * size]
+                stack = stacks.get((x, y), ())
+                _, rest = layers.get((x, y), ((), ()))
+                if not rest:
+                    frame[cell] = self._background_pixels[cell]
+                    continue
+                shrink_icons = any(not i and not bg for _, _, _, _, i, bg in stack)
+                tile = self._compose(
+                    self._background[cell].copy(), rest, size, shrink_icons
+                )
+                frame[cell] = self._to_pixels(tile)
+
+        self._frame_key = key
+        if not self.incremental:
+            return frame
+        self._frame, self._stacks = frame, stacks
+        if out is not None:
+            np.copyto(out, frame)
+            return out
+        return frame.copy()
+
+    def render_image(self, state: State) -> Image.Image:
+        from PIL import Image
+
+        return Image.fromarray(self.render(state))
+
+
+class FrameBuffers:
+    """Rotating output buffers for rendered frames.
+
+    ``next(shape)`` returns the buffer to render the next frame into and
+    ``publish()`` the array to hand out for it. Buffers are used in turn, so a
+    frame stays valid until as many further frames were rendered as there are
+    buffers: with two (double buffering) the previous frame is still intact
+    while the current one is rendered.
+
+    ``buffers`` is either a number of buffers, allocated on first use and
+    reallocated when the frame shape changes, or a sequence of caller-supplied
+    writable uint8 arrays of the frame shape. With ``readonly=True``,
+    ``publish`` returns read-only views of the buffers, so consumers of a frame
+    cannot corrupt the buffer it is rendered into.
+    """
+
+    def __init__(
+        self, buffers: int | Sequence[NDArray[np.uint8]] = 2, readonly: bool = False
+    ) -> None:
+        if isinstance(buffers, int):
+            if buffers < 1:
+                raise ValueError("FrameBuffers needs at least one buffer.")
+            self.count = buffers
+            self.owned = True
+            self._buffers: list[NDArray[np.uint8]] = []
+        else:
+            self._buffers = list(buffers)
+            if not self._buffers:
+                raise ValueError("FrameBuffers needs at least one buffer.")
+            for buffer in self._buffers:
+                if buffer.dtype != np.uint8 or not buffer.flags.writeable:
+                    raise ValueError("Frame buffers must be writable uint8 arrays.")
+            self.count = len(self._buffers)
+            self.owned = False
+        self.readonly = readonly
+        self._views = [self._view(buffer) for buffer in self._buffers]
+        self._index = -1
+
+    def _view(self, buffer: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        if not self.readonly:
+            return buffer
+        view = buffer.view()
+        view.flags.writeable = False
+        return view
+
+    def next(self, shape: tuple[int, ...]) -> NDArray[np.uint8]:
+        """Return the writable buffer for the next frame of ``shape``."""
+        self._index = (self._index + 1) % self.count
+        if self.owned and (
+            len(self._buffers) < self.count or self._buffers[0].shape != shape
+        ):
+            self._buffers = [np.empty(shape, np.uint8) for _ in range(self.count)]
+            self._views = [self._view(buffer) for buffer in self._buffers]
+        buffer = self._buffers[self._index]
+        if buffer.shape != shape:
+            raise ValueError(
+                f"Frame buffers have shape {buffer.shape}, the frame is {shape}."
+            )
+        return buffer
+
+    def publish(self) -> NDArray[np.uint8]:
+        """Return the array handed to consumers for the last ``next`` buffer."""
+        return self._views[self._index]
@@ -0,0 +1,267 @@
+"""Optimal planner for Grid Adventure levels.
+
+``solve`` finds a shortest action sequence (fewest turns) that wins a level.
+Search runs on the bitboard engine of ``grid_adventure.bitboard``, which
+follows the rules of ``grid_adventure.step.step`` (see its parity guarantee);
+all seven actions of up to ``batch_size`` nodes of equal priority are expanded
+in one ``step_batch`` call.
+
+Nodes are deduplicated in a transposition table keyed by a compact byte
+abstraction of the board (``state_key``): agent position, health, held keys,
+gems and coins, the win flag, the dynamic entity planes (collectibles, doors, boxes,
+power-ups) and the sorted held effects with their remaining timers/uses. Turn
+and score are not part of the key: the cost of a node is its turn, so the
+table keeps the cheapest path to each abstract state.
+
+With ``heuristic=True`` the search is A* with an admissible heuristic: one
+``PICK_UP`` per remaining gem cell plus the Manhattan distance of the longest
+gem-then-exit detour, divided by the speed multiplier when a speed effect is
+held or still on the board. With ``heuristic=False`` it is breadth-first.
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from numpy.typing import NDArray
+
+from grid_adventure import bitboard
+from grid_adventure.constants import SPEED_POWERUP_MULTIPLIER
+
+DEFAULT_MAX_NODES = 1_000_000
+DEFAULT_BATCH_SIZE = 256
+
+_P = bitboard.PLANE_INDEX
+_A = bitboard.AGENT_INDEX
+_ACTIONS = tuple(Action)
+_ACTION_INDICES = np.arange(len(_ACTIONS), dtype=np.int64)
+_STATIC_PLANES = {_P["floor"], _P["wall"], _P["exit"], _P["lava"]}
+_DYNAMIC_PLANES = [p for p in range(len(bitboard.PLANES)) if p not in _STATIC_PLANES]
+_KEY_FIELDS = [
+    _A[name] for name in ("x", "y", "health", "keys", "gems", "coins", "win")
+]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Outcome of a search.
+
+    ``actions`` is a shortest winning sequence and ``cost`` its length, or
+    None when the level is unsolvable or ``limit_reached``. ``score`` is the
+    final score of the plan.
+    """
+
+    actions: tuple[Action, ...] | None
+    cost: int | None
+    score: int | None
+    nodes_expanded: int
+    nodes_generated: int
+    limit_reached: bool
+    seconds: float
+
+    @property
+    def solved(self) -> bool:
+        return self.actions is not None
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes_expanded / self.seconds if self.seconds > 0 else 0.0
+
+
+def _keys(
+    planes: NDArray[np.uint8], agent: NDArray[np.int32], effects: NDArray[np.int32]
+) -> list[bytes]:
+    """Transposition keys of a batch of boards (see the module docstring)."""
+    num = planes.shape[0]
+    # Effects sort by (kind, amount) so held effects compare as a multiset.
+    held = np.sort(
+        (effects[..., 0].astype(np.int64) << 32)
+        | (effects[..., 1].astype(np.int64) & 0xFFFFFFFF),
+        axis=1,
+    )
+    rows = np.concatenate(
+        (
+            np.ascontiguousarray(agent[:, _KEY_FIELDS]).view(np.uint8),
+            planes[:, _DYNAMIC_PLANES].reshape(num, -1),
+            held.view(np.uint8),
+        ),
+        axis=1,
+    )
+    return [row.tobytes() for row in rows]
+
+
+def state_key(
+    planes: NDArray[np.uint8], agent: NDArray[np.int32], effects: NDArray[np.int32]
+) -> bytes:
+    """Return the transposition key of one unbatched board's arrays."""
+    return _keys(planes[None], agent[None], effects[None])[0]
+
+
+class _Heuristic:
+    """Admissible turn estimates for a batch of boards (see the module docstring)."""
+
+    def __init__(self, board: bitboard.Bitboard) -> None:
+        exits = np.argwhere(board.planes[_P["exit"]])
+        ys, xs = np.indices(board.planes.shape[1:])
+        # Distance from every cell to its nearest exit.
+        self._to_exit = np.full(ys.shape, np.iinfo(np.int32).max // 2, np.int64)
+        for y, x in exits:
+            self._to_exit = np.minimum(self._to_exit, np.abs(ys - y) + np.abs(xs - x))
+        self._ys, self._xs = ys, xs
+        self._solvable = len(exits) > 0
+
+    def __call__(
+        self,
+        planes: NDArray[np.uint8],
+        agent: NDArray[np.int32],
+        effects: NDArray[np.int32],
+    ) -> NDArray[np.float64]:
+        if not self._solvable:
+            return np.full(planes.shape[0], np.inf)
+        x = agent[:, _A["x"], None, None]
+        y = agent[:, _A["y"], None, None]
+        gems = planes[:, _P["gem"]] > 0
+        detour = np.abs(self._xs - x) + np.abs(self._ys - y) + self._to_exit
+        distance = np.where(
+            gems.any(axis=(1, 2)),
+            np.where(gems, detour, 0).max(axis=(1, 2)),
+            self._to_exit[agent[:, _A["y"]], agent[:, _A["x"]]],
+        )
+        speed = (effects[..., 0] == bitboard.EFFECT_SPEED).any(axis=1)
+        speed |= planes[:, _P["speed"]].any(axis=(1, 2))
+        multiplier = np.where(speed, SPEED_POWERUP_MULTIPLIER, 1)
+        return (-(-distance // multiplier) + gems.sum(axis=(1, 2))).astype(np.float64)
+
+
+def _to_board(level: State | GridState | bitboard.Bitboard) -> bitboard.Bitboard:
+    if isinstance(level, bitboard.Bitboard):
+        return level
+    if isinstance(level, GridState):
+        return bitboard.from_gridstate(level)
+    return bitboard.from_state(level)
+
+
+def solve(
+    level: State | GridState | bitboard.Bitboard,
+    heuristic: bool = True,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SearchResult:
+    """Search for a shortest winning action sequence.
+
+    Args:
+        level: The start State, GridState or unbatched Bitboard.
+        heuristic: A* with the admissible heuristic if True, breadth-first
+            search otherwise. Both return optimal plans.
+        max_nodes: Maximum number of node expansions.
+        batch_size: Maximum number of nodes of equal priority expanded in one
+            ``step_batch`` call.
+
+    Raises:
+        ValueError: If the level is outside the bitboard rule set.
+    """
+    start_time = time.perf_counter()
+    board = _to_board(level)
+    assert not board.batched, "solve needs an unbatched board."
+    estimate = _Heuristic(board) if heuristic else None
+    num_actions = len(_ACTIONS)
+    expanded = generated = 0
+
+    def h(
+        planes: NDArray[np.uint8],
+        agent: NDArray[np.int32],
+        effects: NDArray[np.int32],
+    ) -> NDArray[np.float64]:
+        if estimate is None:
+            return np.zeros(planes.shape[0])
+        return estimate(planes, agent, effects)
+
+    def result(
+        actions: tuple[Action, ...] | None, score: int | None, limit: bool
+    ) -> SearchResult:
+        return SearchResult(
+            actions,
+            None if actions is None else len(actions),
+            score,
+            expanded,
+            generated,
+            limit,
+            time.perf_counter() - start_time,
+        )
+
+    start_key = state_key(board.planes, board.agent, board.effects)
+    # key -> (cost, parent key, action index)
+    table: dict[bytes, tuple[int, bytes | None, int]] = {start_key: (0, None, -1)}
+    counter = itertools.count()
+    start_h = h(board.planes[None], board.agent[None], board.effects[None])[0]
+    heap = [
+        (start_h, 0, next(counter), start_key, board.planes, board.agent, board.effects)
+    ]
+
+    def plan(key: bytes) -> tuple[Action, ...]:
+        actions: list[Action] = []
+        parent, index = table[key][1:]
+        while parent is not None:
+            actions.append(_ACTIONS[index])
+            key = parent
+            parent, index = table[key][1:]
+        return tuple(reversed(actions))
+
+    while heap:
+        # Pop up to batch_size live nodes of the lowest priority; expanding
+        # nodes of equal priority together keeps the search optimal.
+        priority = heap[0][0]
+        nodes = []
+        while heap and heap[0][0] == priority and len(nodes) < batch_size:
+            _, negative_cost, _, key, planes, agent, effects = heapq.heappop(heap)
+            cost = -negative_cost
+            if table[key][0] < cost:
+                continue  # A cheaper path to this state was found after pushing.
+            if agent[_A["win"]]:
+                return result(plan(key), int(agent[_A["score"]]), False)
+            nodes.append((key, cost, planes, agent, effects))
+        if not nodes:
+            continue
+        if expanded + len(nodes) > max_nodes:
+            return result(None, None, True)
+        expanded += len(nodes)
+
+        children = bitboard.step_batch(
+            bitboard.Bitboard(
+                np.repeat(np.stack([n[2] for n in nodes]), num_actions, axis=0),
+                np.repeat(np.stack([n[3] for n in nodes]), num_actions, axis=0),
+                np.repeat(np.stack([n[4] for n in nodes]), num_actions, axis=0),
+                board.levels * (len(nodes) * num_actions),
+            ),
+            np.tile(_ACTION_INDICES, len(nodes)),
+        )
+        keys = _keys(children.planes, children.agent, children.effects)
+        estimates = h(children.planes, children.agent, children.effects)
+        lost = children.agent[:, _A["lose"]]
+        for i, child_key in enumerate(keys):
+            if lost[i]:
+                continue
+            key, cost = nodes[i // num_actions][:2]
+            best = table.get(child_key)
+            if best is not None and best[0] <= cost + 1:
+                continue
+            table[child_key] = (cost + 1, key, i % num_actions)
+            generated += 1
+            heapq.heappush(
+                heap,
+                (
+                    cost + 1 + float(estimates[i]),
+                    -(cost + 1),
+                    next(counter),
+                    child_key,
+                    children.planes[i],
+                    children.agent[i],
+                    children.effects[i],
+                ),
+            )
+    return result(None, None, False)
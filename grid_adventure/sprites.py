@@ -0,0 +1,153 @@
+"""Pre-scaled sprite atlas for the Grid Adventure tile renderer.
+
+Every ``IMAGE_MAP`` entry names either a single image file or a directory of
+numbered variants (``boots/boots_1.png`` ... ``boots/boots_22.png``). The atlas
+decodes each (entry, variant) once per cell size, resizes it, and keeps the
+result as a contiguous read-only ``(size, size, 4)`` ``uint8`` RGBA array in an
+LRU cache keyed by ``(appearance, properties, variant, size)``, where the
+variant is reduced modulo the number of files of the entry.
+"""
+
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from grid_universe.renderer.image import ImageMap
+from numpy.typing import NDArray
+
+SpriteKey = tuple[str, tuple[str, ...], int, int]
+
+DEFAULT_ATLAS_SIZE = 4096
+
+# Number of (asset root, image map) atlases ``shared_atlas`` keeps alive.
+SHARED_ATLAS_LIMIT = 4
+
+
+def _natural_key(name: str) -> list[int | str]:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+@dataclass(frozen=True)
+class AtlasStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class SpriteAtlas:
+    """LRU cache of decoded, pre-resized sprites.
+
+    Args:
+        asset_root: Directory the ``image_map`` paths are relative to.
+        image_map: Mapping from (appearance name, properties) to a file or a
+            directory of variants.
+        maxsize: Maximum number of sprites kept.
+    """
+
+    def __init__(
+        self,
+        asset_root: str,
+        image_map: ImageMap,
+        maxsize: int = DEFAULT_ATLAS_SIZE,
+    ) -> None:
+        self.asset_root = asset_root
+        self.image_map = image_map
+        self.maxsize = maxsize
+        self._sprites: OrderedDict[SpriteKey, NDArray[np.uint8]] = OrderedDict()
+        self._paths: dict[tuple[str, tuple[str, ...]], tuple[str, ...]] = {}
+        self._hits = self._misses = self._evictions = 0
+
+    def paths(self, appearance: str, properties: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the variant files of an ``image_map`` entry (empty if unmapped)."""
+        key = (appearance, properties)
+        paths = self._paths.get(key)
+        if paths is None:
+            entry = self.image_map.get(key)
+            if entry is None:
+                paths = ()
+            else:
+                path = os.path.join(self.asset_root, entry)
+                if os.path.isdir(path):
+                    paths = tuple(
+                        os.path.join(path, name)
+                        for name in sorted(os.listdir(path), key=_natural_key)
+                        if name.lower().endswith(".png")
+                    )
+                else:
+                    paths = (path,) if os.path.isfile(path) else ()
+            self._paths[key] = paths
+        return paths
+
+    def num_variants(self, appearance: str, properties: tuple[str, ...]) -> int:
+        return len(self.paths(appearance, properties))
+
+    def sprite(
+        self, appearance: str, properties: tuple[str, ...], variant: int, size: int
+    ) -> NDArray[np.uint8] | None:
+        """Return one sprite resized to ``size`` x ``size``, or None if unmapped.
+
+        ``variant`` may be any non-negative integer; it selects file
+        ``variant % num_variants``.
+        """
+        paths = self.paths(appearance, properties)
+        if not paths:
+            return None
+        variant %= len(paths)
+        key = (appearance, properties, variant, size)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+        self._misses += 1
+        from PIL import Image
+
+        with Image.open(paths[variant]) as image:
+            resized = image.convert("RGBA").resize(
+                (size, size), Image.Resampling.LANCZOS
+            )
+        sprite = np.ascontiguousarray(np.asarray(resized, dtype=np.uint8))
+        sprite.setflags(write=False)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.maxsize:
+            self._sprites.popitem(last=False)
+            self._evictions += 1
+        return sprite
+
+    def preload(self, size: int) -> None:
+        """Decode every ``image_map`` entry and variant at one cell size."""
+        for appearance, properties in self.image_map:
+            for variant in range(self.num_variants(appearance, properties)):
+                self.sprite(appearance, properties, variant, size)
+
+    def stats(self) -> AtlasStats:
+        return AtlasStats(
+            self._hits, self._misses, self._evictions, len(self._sprites), self.maxsize
+        )
+
+    def clear(self) -> None:
+        self._sprites.clear()
+        self._hits = self._misses = self._evictions = 0
+
+
+_SHARED_ATLASES: OrderedDict[tuple[str, int], SpriteAtlas] = OrderedDict()
+
+
+def shared_atlas(asset_root: str, image_map: ImageMap) -> SpriteAtlas:
+    """Return the process-wide atlas for an asset root and image map.
+
+    At most ``SHARED_ATLAS_LIMIT`` atlases are kept; the least recently used
+    one is dropped when another is created.
+    """
+    key = (asset_root, id(image_map))
+    atlas = _SHARED_ATLASES.get(key)
+    if atlas is None or atlas.image_map is not image_map:
+        atlas = _SHARED_ATLASES[key] = SpriteAtlas(asset_root, image_map)
+        if len(_SHARED_ATLASES) > SHARED_ATLAS_LIMIT:
+            _SHARED_ATLASES.popitem(last=False)
+    _SHARED_ATLASES.move_to_end(key)
+    return atlas
@@ -0,0 +1,493 @@
+"""Vectorized Grid Adventure environments."""
+
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, cast
+
+import numpy as np
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+from grid_universe.grid.gridstate import GridState
+from grid_universe.state import State
+from gymnasium import spaces
+from gymnasium.vector import AutoresetMode, SyncVectorEnv, VectorEnv
+from gymnasium.vector.utils import batch_space
+from numpy.typing import NDArray
+
+from grid_adventure import bitboard
+from grid_adventure.env import GridAdventureEnv
+
+
+@dataclass(frozen=True)
+class _BuilderStateFn:
+    """Picklable ``initial_state_fn`` wrapping a GridState builder."""
+
+    builder: Callable[..., GridState]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> State:
+        return grid_state_fn_to_initial_state_fn(self.builder)(*args, **kwargs)
+
+
+def _make_env(
+    initial_state_fn: Callable[..., State], env_kwargs: dict[str, Any]
+) -> GridAdventureEnv:
+    """Create one slot's environment, sizing it from the level if needed."""
+    kwargs = dict(env_kwargs)
+    if "width" not in kwargs or "height" not in kwargs:
+        sample_state = initial_state_fn()
+        kwargs.setdefault("width", sample_state.width)
+        kwargs.setdefault("height", sample_state.height)
+    return GridAdventureEnv(initial_state_fn=initial_state_fn, **kwargs)
+
+
+def _check_env_kwargs(env_kwargs: dict[str, Any]) -> None:
+    """Reject keyword arguments that cannot be shared by several slots."""
+    image_buffers = env_kwargs.get("image_buffers")
+    if image_buffers is not None and not isinstance(image_buffers, int):
+        raise ValueError(
+            "Vector environments take image_buffers as a number of buffers per "
+            "slot; caller-supplied arrays would be shared by all slots."
+        )
+
+
+class GridAdventureVectorEnv(SyncVectorEnv):
+    """Steps N Grid Adventure episodes in lockstep.
+
+    With ``step_backend="bitboard"`` the boards of all slots are advanced by
+    one ``grid_adventure.bitboard.step_batch`` call per step; observations,
+    rewards and autoreset are then handled slot by slot. With the reference
+    backend the slots are stepped one after another in this process, so it is
+    no faster than a loop over ``GridAdventureEnv`` instances. Use
+    ``GridAdventureAsyncVectorEnv`` to step slots in parallel.
+
+    Each slot runs its own level (``initial_state_fns[i]``); all slots share the
+    environment keyword arguments (``observation_type``, ``render_resolution``,
+    ...) and must produce the same observation space, i.e. levels of one size.
+
+    ``step(actions)`` returns stacked observations plus reward, terminated and
+    truncated arrays. Finished episodes are reset in the same step; the final
+    observation and info are reported in ``infos["final_obs"]`` and
+    ``infos["final_info"]``.
+
+    ``image_buffers=n`` (an environment keyword argument) gives every slot
+    its own ``n`` recycled frame buffers. A same-step reset renders one extra
+    frame, so ``n=3`` keeps ``infos["final_obs"]`` valid through the following
+    step as well; with ``copy=False`` the stacked observation batch is reused
+    too.
+    """
+
+    def __init__(
+        self,
+        initial_state_fns: Sequence[Callable[..., State]],
+        copy: bool = True,
+        autoreset_mode: AutoresetMode = AutoresetMode.SAME_STEP,
+        **env_kwargs: Any,
+    ) -> None:
+        if not initial_state_fns:
+            raise ValueError("GridAdventureVectorEnv needs at least one level.")
+        _check_env_kwargs(env_kwargs)
+        super().__init__(
+            [partial(_make_env, fn, env_kwargs) for fn in initial_state_fns],
+            copy=copy,
+            autoreset_mode=autoreset_mode,
+        )
+        self._batch_boards = env_kwargs.get("step_backend") == "bitboard"
+
+    def step(
+        self, actions: NDArray[Any]
+    ) -> tuple[
+        Any,
+        NDArray[np.float64],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        if self._batch_boards:
+            envs = cast(list[GridAdventureEnv], self.envs)
+            boards = [env._board for env in envs]
+            if all(board is not None for board in boards):
+                batch = bitboard.step_batch(
+                    bitboard.stack(cast(list[bitboard.Bitboard], boards)),
+                    np.asarray(actions),
+                )
+                # A slot that autoreset resets instead of stepping drops its board.
+                for env, board in zip(envs, bitboard.unstack(batch)):
+                    env._stepped_board = board
+        return super().step(actions)
+
+    @classmethod
+    def from_builders(
+        cls,
+        builders: Sequence[Callable[..., GridState]],
+        **kwargs: Any,
+    ) -> "GridAdventureVectorEnv":
+        """Create a vector env from GridState builders (e.g. ``levels.intro``)."""
+        return cls([_BuilderStateFn(builder) for builder in builders], **kwargs)
+
+
+# (observation key, shared memory name, batched shape, dtype string)
+_BufferSpec = tuple[str, str, tuple[int, ...], str]
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by the parent without tracking it in this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13
+        # Workers share the parent's resource tracker, which keeps a set of
+        # names: registering again is a no-op, while unregistering here would
+        # drop the parent's entry and make its unlink() fail.
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker(
+    conn: Connection,
+    slots: list[int],
+    initial_state_fns: list[Callable[..., State]],
+    env_kwargs: dict[str, Any],
+    buffer_specs: list[_BufferSpec],
+) -> None:
+    """Worker loop running the environments of ``slots``.
+
+    Array observations are written into the shared buffers; everything else
+    (non-array observation entries, infos, final observations) is sent back
+    through the pipe.
+    """
+    envs = [_make_env(fn, env_kwargs) for fn in initial_state_fns]
+    blocks = [_attach_shared_memory(name) for _, name, _, _ in buffer_specs]
+    arrays = {
+        key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        for (key, _, shape, dtype), block in zip(buffer_specs, blocks)
+    }
+
+    def write(slot: int, obs: dict[str, Any]) -> dict[str, Any]:
+        extras: dict[str, Any] = {}
+        for key, value in obs.items():
+            if key in arrays:
+                arrays[key][slot] = value
+            else:
+                extras[key] = value
+        return extras
+
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "reset":
+                seeds, options = data
+                reset_results = []
+                for env, slot, seed in zip(envs, slots, seeds):
+                    obs, info = env.reset(seed=seed, options=options)
+                    reset_results.append((write(slot, obs), info))
+                conn.send((True, reset_results))
+            elif command == "step":
+                step_results = []
+                for env, slot, action in zip(envs, slots, data):
+                    obs, reward, terminated, truncated, info = env.step(action)
+                    final = None
+                    if terminated or truncated:
+                        final = (obs, info)
+                        obs, info = env.reset()
+                    step_results.append(
+                        (
+                            write(slot, obs),
+                            float(reward),
+                            bool(terminated),
+                            bool(truncated),
+                            info,
+                            final,
+                        )
+                    )
+                conn.send((True, step_results))
+            elif command == "close":
+                conn.send((True, None))
+                break
+            else:
+                raise ValueError(f"Unknown command: {command!r}")
+    except Exception:
+        conn.send((False, traceback.format_exc()))
+        raise
+    finally:
+        for env in envs:
+            env.close()
+        arrays.clear()
+        for block in blocks:
+            block.close()
+        conn.close()
+
+
+class GridAdventureAsyncVectorEnv(VectorEnv[Any, Any, Any]):
+    """Runs Grid Adventure episodes across worker processes.
+
+    The ``num_envs = len(initial_state_fns)`` slots are split over
+    ``num_workers`` processes. Array observations (``observation_type="tensor"``
+    or the ``"image"`` frame) are written by the workers straight into
+    ``multiprocessing.shared_memory`` buffers, so frames are never pickled.
+    Non-array observation entries (e.g. the image ``info`` dict) are returned
+    as per-slot tuples.
+
+    Stepping is split into ``step_async``/``step_wait``. Finished episodes are
+    reset in the same step, as in ``GridAdventureVectorEnv``. Seeds passed to
+    ``reset(seed=s)`` are assigned per slot (``s + i``), so results do not
+    depend on the number of workers.
+
+    ``initial_state_fns`` must be picklable unless the ``"fork"`` start method
+    is used; ``from_builders`` wraps module-level builders accordingly.
+    """
+
+    def __init__(
+        self,
+        initial_state_fns: Sequence[Callable[..., State]],
+        num_workers: int | None = None,
+        copy: bool = True,
+        context: str | None = None,
+        **env_kwargs: Any,
+    ) -> None:
+        if not initial_state_fns:
+            raise ValueError("GridAdventureAsyncVectorEnv needs at least one level.")
+        _check_env_kwargs(env_kwargs)
+        if env_kwargs.get("observation_type", "image") not in ("tensor", "image"):
+            raise ValueError(
+                "GridAdventureAsyncVectorEnv needs dict observations "
+                "(observation_type='tensor' or 'image')."
+            )
+        self.num_envs = len(initial_state_fns)
+        self.copy = copy
+        self.metadata = {"autoreset_mode": AutoresetMode.SAME_STEP}
+
+        probe = _make_env(initial_state_fns[0], env_kwargs)
+        self.single_observation_space = cast(spaces.Dict, probe.observation_space)
+        self.single_action_space = probe.action_space
+        probe.close()
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+        # One shared block per array observation entry, holding all slots.
+        self._blocks: list[shared_memory.SharedMemory] = []
+        self._arrays: dict[str, NDArray[Any]] = {}
+        buffer_specs: list[_BufferSpec] = []
+        for key, subspace in self.single_observation_space.spaces.items():
+            if not isinstance(subspace, spaces.Box):
+                continue
+            shape = (self.num_envs, *subspace.shape)
+            dtype = np.dtype(subspace.dtype)
+            size = max(1, int(np.prod(shape)) * dtype.itemsize)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            self._blocks.append(block)
+            self._arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            buffer_specs.append((key, block.name, shape, dtype.str))
+
+        num_workers = min(num_workers or os.cpu_count() or 1, self.num_envs)
+        self._worker_slots = [
+            chunk.tolist()
+            for chunk in np.array_split(np.arange(self.num_envs), num_workers)
+        ]
+        ctx = multiprocessing.get_context(context)
+        self._conns: list[Connection] = []
+        self._processes: list[Any] = []
+        for slots in self._worker_slots:
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(
+                    child_conn,
+                    slots,
+                    [initial_state_fns[i] for i in slots],
+                    env_kwargs,
+                    buffer_specs,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+        self._waiting = False
+        self.closed = False
+
+    @classmethod
+    def from_builders(
+        cls,
+        builders: Sequence[Callable[..., GridState]],
+        **kwargs: Any,
+    ) -> "GridAdventureAsyncVectorEnv":
+        """Create an async vector env from GridState builders."""
+        return cls([_BuilderStateFn(builder) for builder in builders], **kwargs)
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._worker_slots)
+
+    def _send(self, command: str, payloads: list[Any]) -> None:
+        """Send one command per worker; dead workers are reported by ``_receive``."""
+        for conn, payload in zip(self._conns, payloads):
+            try:
+                conn.send((command, payload))
+            except (BrokenPipeError, OSError):
+                pass
+
+    def _receive(self, timeout: float | None = None) -> list[Any]:
+        """Collect one reply per worker, re-raising worker errors.
+
+        On timeout nothing is consumed, so a pending step can be waited for
+        again. Otherwise every pipe is drained before a worker error (or a
+        worker that died) is raised, and the pending step is cleared.
+        """
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            for conn in self._conns:
+                if not conn.poll(max(0.0, deadline - time.monotonic())):
+                    raise multiprocessing.TimeoutError(
+                        f"Worker did not reply within {timeout} seconds."
+                    )
+        self._waiting = False
+        replies = []
+        errors = []
+        for index, conn in enumerate(self._conns):
+            try:
+                ok, payload = conn.recv()
+            except (EOFError, OSError):
+                ok, payload = False, f"Worker {index} exited unexpectedly."
+            if not ok:
+                errors.append(payload)
+            replies.append(payload)
+        if errors:
+            raise RuntimeError("Grid Adventure worker failed:\n" + "\n".join(errors))
+        return replies
+
+    def _observations(self, extras: list[dict[str, Any]]) -> dict[str, Any]:
+        obs: dict[str, Any] = {}
+        for key in self.single_observation_space.spaces:
+            if key in self._arrays:
+                array = self._arrays[key]
+                obs[key] = array.copy() if self.copy else array
+            else:
+                obs[key] = tuple(slot_extras[key] for slot_extras in extras)
+        return obs
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        if self._waiting:
+            raise RuntimeError("Cannot reset while waiting for a pending step.")
+        if seed is None:
+            seeds: list[int | None] = [None] * self.num_envs
+        elif isinstance(seed, int):
+            seeds = [seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} seeds, got {len(seeds)}.")
+
+        self._send(
+            "reset",
+            [([seeds[i] for i in slots], options) for slots in self._worker_slots],
+        )
+        extras: list[dict[str, Any]] = [{}] * self.num_envs
+        infos: dict[str, Any] = {}
+        for slots, results in zip(self._worker_slots, self._receive()):
+            for slot, (slot_extras, info) in zip(slots, results):
+                extras[slot] = slot_extras
+                infos = self._add_info(infos, info, slot)
+        return self._observations(extras), infos
+
+    def step_async(self, actions: NDArray[Any]) -> None:
+        """Send actions to the workers without waiting for the results."""
+        if self._waiting:
+            raise RuntimeError("step_async called while a step is pending.")
+        actions = np.asarray(actions)
+        self._send(
+            "step", [[int(actions[i]) for i in slots] for slots in self._worker_slots]
+        )
+        self._waiting = True
+
+    def step_wait(
+        self, timeout: float | None = None
+    ) -> tuple[
+        dict[str, Any],
+        NDArray[np.float64],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Wait for the step started by ``step_async`` and return its results."""
+        if not self._waiting:
+            raise RuntimeError("step_wait called without a pending step_async.")
+        replies = self._receive(timeout)
+
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        terminations = np.zeros(self.num_envs, dtype=np.bool_)
+        truncations = np.zeros(self.num_envs, dtype=np.bool_)
+        extras: list[dict[str, Any]] = [{}] * self.num_envs
+        infos: dict[str, Any] = {}
+        for slots, results in zip(self._worker_slots, replies):
+            for slot, result in zip(slots, results):
+                slot_extras, reward, terminated, truncated, info, final = result
+                extras[slot] = slot_extras
+                rewards[slot] = reward
+                terminations[slot] = terminated
+                truncations[slot] = truncated
+                if final is not None:
+                    final_obs, final_info = final
+                    infos = self._add_info(
+                        infos, {"final_obs": final_obs, "final_info": final_info}, slot
+                    )
+                infos = self._add_info(infos, info, slot)
+        return (
+            self._observations(extras),
+            rewards,
+            terminations,
+            truncations,
+            infos,
+        )
+
+    def step(
+        self, actions: NDArray[Any]
+    ) -> tuple[
+        dict[str, Any],
+        NDArray[np.float64],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close_extras(self, **kwargs: Any) -> None:
+        if self._waiting:
+            try:
+                self._receive(timeout=5)
+            except (
+                RuntimeError,
+                EOFError,
+                BrokenPipeError,
+                multiprocessing.TimeoutError,
+            ):
+                pass
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+                if conn.poll(5):
+                    conn.recv()
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._arrays.clear()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
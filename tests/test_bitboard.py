@@ -0,0 +1,200 @@
+from collections import Counter
+from typing import Any
+
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+from grid_universe.state import State
+
+from grid_adventure import bitboard
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.observation import state_to_tensor
+from grid_adventure.step import step as adv_step
+
+LEVELS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+
+def _effect_kind(state: State, eid: int) -> str:
+    if eid in state.speed:
+        return "speed"
+    if eid in state.phasing:
+        return "phasing"
+    return "shield"
+
+
+def _effect_amount(state: State, eid: int) -> int:
+    if eid in state.time_limit:
+        return state.time_limit[eid].amount
+    if eid in state.usage_limit:
+        return state.usage_limit[eid].amount
+    return -1
+
+
+def _summary(state: State) -> dict[str, Any]:
+    """Everything the parity guarantee covers, independent of entity ids."""
+    aid = next(iter(state.agent.keys()))
+    items = state.inventory[aid].item_ids
+    layout = Counter(
+        (
+            state.appearance[eid].name,
+            eid in state.locked,
+            eid in state.blocking,
+            state.position[eid].x,
+            state.position[eid].y,
+        )
+        for eid in state.position
+        if eid != aid
+    )
+    return {
+        "position": (state.position[aid].x, state.position[aid].y),
+        "health": (state.health[aid].current_health, state.health[aid].max_health),
+        "keys": sum(1 for i in items if i in state.key),
+        "gems": sum(1 for i in items if i in state.requirable),
+        "coins": sum(1 for i in items if i in state.rewardable),
+        "effects": sorted(
+            (_effect_kind(state, e), _effect_amount(state, e))
+            for e in state.status[aid].effect_ids
+        ),
+        "layout": layout,
+        "score": state.score,
+        "turn": state.turn,
+        "win": state.win,
+        "lose": state.lose,
+    }
+
+
+def test_round_trip_preserves_level():
+    for builder in LEVELS:
+        state = to_state(builder())
+        board = bitboard.from_state(state)
+        assert _summary(bitboard.to_state(board)) == _summary(state)
+
+
+@pytest.mark.parametrize("builder", LEVELS, ids=lambda b: b.__name__)
+def test_random_rollouts_match_reference_step(builder):
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    for _ in range(3):
+        state = to_state(builder())
+        board = bitboard.from_state(state)
+        for _ in range(60):
+            action = actions[int(rng.integers(len(actions)))]
+            state = adv_step(state, action)
+            board = bitboard.step(board, action)
+            assert _summary(bitboard.to_state(board)) == _summary(state)
+            expected = state_to_tensor(state)
+            tensor = bitboard.to_tensor(board)
+            np.testing.assert_array_equal(tensor["grid"], expected["grid"])
+            np.testing.assert_array_equal(tensor["vector"], expected["vector"])
+            if state.win or state.lose:
+                break
+
+
+def test_step_batch_matches_single_steps():
+    boards = [bitboard.from_state(to_state(intro.build_level_key_door()))] * 2
+    boards.append(bitboard.from_state(to_state(intro.build_level_pushable_box())))
+    batch = bitboard.stack(boards)
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        actions = rng.integers(0, len(Action), size=len(boards))
+        batch = bitboard.step_batch(batch, actions)
+        boards = [bitboard.step(b, int(a)) for b, a in zip(boards, actions)]
+    for batched, single in zip(bitboard.unstack(batch), boards):
+        np.testing.assert_array_equal(batched.planes, single.planes)
+        np.testing.assert_array_equal(batched.agent, single.agent)
+
+
+def test_from_state_rejects_non_default_rule_components():
+    gridstate = intro.build_level_hazard_detour()
+    for column in gridstate.grid:
+        for cell in column:
+            for obj in cell:
+                if getattr(obj, "damage", None) is not None:
+                    obj.damage = type(obj.damage)(amount=obj.damage.amount + 1)
+    with pytest.raises(ValueError):
+        bitboard.from_gridstate(gridstate)
+
+
+def test_env_bitboard_backend_matches_reference_backend():
+    fn = grid_state_fn_to_initial_state_fn(intro.build_level_power_boots)
+    envs = [
+        GridAdventureEnv(
+            fn, observation_type="tensor", step_backend=backend, width=13, height=9
+        )
+        for backend in ("reference", "bitboard")
+    ]
+    for env in envs:
+        env.reset(seed=0)
+    rng = np.random.default_rng(2)
+    for _ in range(40):
+        action = int(rng.integers(len(Action)))
+        ref, fast = (env.step(action) for env in envs)
+        np.testing.assert_array_equal(ref[0]["grid"], fast[0]["grid"])
+        np.testing.assert_array_equal(ref[0]["vector"], fast[0]["vector"])
+        assert ref[1:] == fast[1:]
+        if ref[2]:
+            break
+    for env in envs:
+        env.close()
+
+
+def test_env_bitboard_backend_matches_reference_at_turn_limit():
+    fn = grid_state_fn_to_initial_state_fn(intro.build_level_basic_movement)
+    envs = [
+        GridAdventureEnv(
+            fn, observation_type="tensor", step_backend=backend, width=7, height=5
+        )
+        for backend in ("reference", "bitboard")
+    ]
+    for env in envs:
+        env.reset(seed=0)
+    for _ in range(intro.TURN_LIMIT):
+        ref, fast = (env.step(Action.WAIT) for env in envs)
+        np.testing.assert_array_equal(ref[0]["grid"], fast[0]["grid"])
+        np.testing.assert_array_equal(ref[0]["vector"], fast[0]["vector"])
+        assert ref[1:] == fast[1:]
+    # Running out of turns is a loss, not a truncation
+    assert ref[2] and not ref[3]
+    for env in envs:
+        env.close()
+
+
+def test_env_bitboard_backend_builds_state_only_when_read(monkeypatch):
+    calls = []
+    to_state = bitboard.to_state
+    monkeypatch.setattr(
+        bitboard, "to_state", lambda board: calls.append(board) or to_state(board)
+    )
+    env = GridAdventureEnv(
+        grid_state_fn_to_initial_state_fn(intro.build_level_key_door),
+        observation_type="tensor",
+        step_backend="bitboard",
+        width=11,
+        height=9,
+    )
+    env.reset(seed=0)
+    for action in (Action.UP, Action.RIGHT, Action.PICK_UP):
+        obs, *_ = env.step(action)
+    assert calls == []
+
+    # Reading the State rebuilds it once from the board
+    state = env.state
+    assert state is not None and env.agent_id in state.agent
+    assert env.state is state and len(calls) == 1
+    np.testing.assert_array_equal(state_to_tensor(state)["grid"], obs["grid"])
+    env.close()
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+
+from grid_adventure.dataset import (
+    DatasetRecorder,
+    TrajectoryDataset,
+    TrajectoryWriter,
+)
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.observation import CHANNEL_INDEX
+
+
+def _record(directory: Path, episodes: int, chunk_size: int) -> None:
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="tensor",
+        width=7,
+        height=5,
+    )
+    with TrajectoryWriter(directory, chunk_size=chunk_size) as writer:
+        recorder = DatasetRecorder(env, writer)
+        for _ in range(episodes):
+            recorder.reset()
+            terminated = False
+            while not terminated:
+                _, _, terminated, _, _ = recorder.step(Action.RIGHT)
+        recorder.close()
+
+
+def test_sampled_transitions_span_shards(tmp_path: Path):
+    _record(tmp_path, episodes=3, chunk_size=4)
+    dataset = TrajectoryDataset(tmp_path)
+    # Four moves from (1, 2) to the exit at (5, 2), plus the final observation.
+    assert (len(dataset), dataset.num_rows, dataset.num_shards) == (12, 15, 4)
+
+    batch = dataset.sample(64, np.random.default_rng(0))
+    agent = CHANNEL_INDEX["agent"]
+    assert batch["obs"]["grid"].shape == (64, 14, 5, 7)
+    np.testing.assert_array_equal(batch["action"], 3)  # Action.RIGHT
+    np.testing.assert_array_equal(
+        batch["obs"]["grid"][:, agent, 2, 1:6].argmax(1), batch["step"]
+    )
+    np.testing.assert_array_equal(
+        batch["next_obs"]["grid"][:, agent, 2, 1:6].argmax(1), batch["step"] + 1
+    )
+    np.testing.assert_array_equal(batch["terminated"], batch["step"] == 3)
+    np.testing.assert_array_equal(batch["turn"], batch["step"])
+
+
+def test_writer_continues_an_existing_dataset(tmp_path: Path):
+    _record(tmp_path, episodes=1, chunk_size=4)
+    _record(tmp_path, episodes=1, chunk_size=4)
+    dataset = TrajectoryDataset(tmp_path)
+    assert len(dataset) == 8
+    batch = dataset.sample(32, np.random.default_rng(0))
+    assert set(batch["episode"].tolist()) == {0, 1}
+
+
+def test_unfinished_episode_has_no_dangling_transition(tmp_path: Path):
+    state = to_state(intro.build_level_basic_movement())
+    obs = {"vector": np.zeros(3, np.int32)}
+    with TrajectoryWriter(tmp_path, chunk_size=8) as writer:
+        writer.add(obs, state, Action.UP, 0.0, False, False)
+        writer.add(obs, state, Action.UP, 0.0, False, False)
+    dataset = TrajectoryDataset(tmp_path)
+    assert (dataset.num_rows, len(dataset)) == (2, 1)
+
+
+def test_recorder_keeps_observations_of_recycled_image_buffers(tmp_path: Path):
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="image",
+        render_backend="tiles",
+        render_resolution=70,
+        image_buffers=1,
+        width=7,
+        height=5,
+    )
+    frames = []
+    with TrajectoryWriter(tmp_path, chunk_size=8) as writer:
+        recorder = DatasetRecorder(env, writer)
+        obs, _ = recorder.reset()
+        frames.append(obs["image"].copy())
+        terminated = False
+        while not terminated:
+            obs, _, terminated, _, _ = recorder.step(Action.RIGHT)
+            frames.append(obs["image"].copy())
+        recorder.close()
+    dataset = TrajectoryDataset(tmp_path)
+    assert dataset.num_rows == len(frames) == 5
+    stored = dataset.rows("obs_image", np.arange(dataset.num_rows))
+    np.testing.assert_array_equal(stored, np.stack(frames))
@@ -0,0 +1,62 @@
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+from grid_universe.grid.convert import to_state as base_to_state
+from grid_universe.grid.gridstate import GridState
+
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.grid import EntityPool, from_state
+from grid_adventure.levels import intro
+from grid_adventure.step import step
+
+
+def _cells(gridstate: GridState) -> list[list[list[str]]]:
+    return [
+        [sorted(type(obj).__name__ for obj in cell) for cell in column]
+        for column in gridstate.grid
+    ]
+
+
+def _by_id(gridstate: GridState) -> dict[int, object]:
+    return {
+        id(obj): obj for column in gridstate.grid for cell in column for obj in cell
+    }
+
+
+def test_unchanged_entities_are_reused_across_steps():
+    state = base_to_state(intro.build_level_basic_movement())
+    pool = EntityPool()
+    first = pool.from_state(state)
+    assert _cells(first) == _cells(from_state(state))
+    assert pool.stats().built == len(state.position)
+
+    state = step(state, Action.RIGHT)
+    second = pool.from_state(state)
+    assert _cells(second) == _cells(from_state(state))
+    stats = pool.stats()
+    assert stats.reused + stats.built == 2 * len(state.position)
+    # Floors, walls and the exit keep their instances; at most the agent is new.
+    assert len(_by_id(second).keys() - _by_id(first).keys()) <= 1
+    assert stats.built - len(state.position) <= 1
+
+    pool.clear()
+    assert len(pool) == 0 and pool.stats().reused == 0
+
+
+def test_environment_pools_gridstate_observations():
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="gridstate",
+        pool_entities=True,
+        width=7,
+        height=5,
+    )
+    first, _ = env.reset()
+    obs, *_ = env.step(Action.RIGHT)
+    assert _cells(obs) == _cells(from_state(env.state))
+    assert len(_by_id(obs)) == len(env.state.position)
+    assert env.entity_pool is not None and env.entity_pool.stats().reused > 0
+    # Only the agent may have been rebuilt.
+    assert len(_by_id(obs).keys() - _by_id(first).keys()) <= 1
+    env.close()
@@ -24,3 +24,26 @@ def test_env_returns_level_observation():
     assert truncated in (True, False)
     assert isinstance(info2, dict)
     env.close()
+
+
+def test_env_flyweight_gridstate_shares_floors():
+    from grid_adventure.entities import FloorEntity
+
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="gridstate",
+        flyweight=True,
+    )
+    obs, _ = env.reset()
+    floors = [
+        obj
+        for column in obs.grid
+        for cell in column
+        for obj in cell
+        if isinstance(obj, FloorEntity)
+    ]
+    assert len(floors) == obs.width * obs.height
+    assert len({id(obj) for obj in floors}) == 1
+    env.close()
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.rendering import FrameBuffers, TileRenderer
+from grid_adventure.step import step as adv_step
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+@pytest.mark.parametrize("static_background", [False, True])
+def test_render_into_output_buffer_matches_render(incremental, static_background):
+    full = TileRenderer(resolution=88)
+    renderer = TileRenderer(
+        resolution=88,
+        atlas=full.atlas,
+        incremental=incremental,
+        static_background=static_background,
+    )
+    state = to_state(intro.build_level_key_door())
+    out = np.full(renderer.frame_shape(state), 7, np.uint8)
+    for action in (Action.WAIT, Action.RIGHT, Action.DOWN):
+        assert renderer.render(state, out=out) is out
+        np.testing.assert_array_equal(out, full.render(state))
+        state = adv_step(state, action)
+    with pytest.raises(ValueError):
+        renderer.render(state, out=np.zeros((1, 1, 4), np.uint8))
+
+
+def test_frame_buffers_rotate_and_can_be_read_only():
+    buffers = FrameBuffers(2, readonly=True)
+    first = buffers.next((2, 3, 4))
+    first[:] = 1
+    frame = buffers.publish()
+    assert not frame.flags.writeable and np.shares_memory(frame, first)
+    second = buffers.next((2, 3, 4))
+    assert second is not first
+    assert buffers.next((2, 3, 4)) is first
+
+    supplied = [np.zeros((2, 3, 4), np.uint8)]
+    assert FrameBuffers(supplied).next((2, 3, 4)) is supplied[0]
+    with pytest.raises(ValueError):
+        FrameBuffers(supplied).next((4, 4, 4))
+
+
+@pytest.mark.parametrize("render_backend", ["base", "tiles"])
+def test_env_double_buffers_image_observations(render_backend):
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="image",
+        render_backend=render_backend,
+        render_resolution=70,
+        image_buffers=2,
+        readonly_images=True,
+        width=7,
+        height=5,
+    )
+    obs, _ = env.reset()
+    previous = obs["image"].copy()
+    assert not obs["image"].flags.writeable
+    obs2, *_ = env.step(Action.RIGHT)
+    # The previous frame is untouched while the next one is rendered.
+    np.testing.assert_array_equal(obs["image"], previous)
+    assert not np.shares_memory(obs["image"], obs2["image"])
+    obs3, *_ = env.step(Action.RIGHT)
+    assert np.shares_memory(obs["image"], obs3["image"])
+    env.close()
+
+    with pytest.raises(ValueError):
+        GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(
+                intro.build_level_basic_movement
+            ),
+            observation_type="tensor",
+            image_buffers=2,
+            width=7,
+            height=5,
+        )
@@ -7,7 +7,8 @@ from grid_universe.movements import CardinalMovement
 from grid_universe.objectives import ExitObjective
 
 from grid_adventure.entities import AgentEntity, CoinEntity, WallEntity
-from grid_adventure.grid import step
+from grid_adventure.grid import specialize_entities, step
+from grid_adventure.levels import intro
 
 
 def _find_entities_at(gridstate: GridState, pos: tuple[int, int]) -> list[object]:
@@ -77,3 +78,142 @@ def test_step_pickup_specializes_agent_and_updates_score() -> None:
     )
     # Score should reflect reward
     assert new_grid_state.score == 10
+
+
+def test_incremental_step_reuses_untouched_cells() -> None:
+    gridstate = specialize_entities(intro.build_level_maze_turns(seed=101))
+    start = _find_agent_pos(gridstate)
+    assert start is not None
+
+    full = step(gridstate, Action.RIGHT)
+    incremental = step(gridstate, Action.RIGHT, incremental=True)
+
+    # Same specialized types everywhere
+    for x in range(gridstate.width):
+        for y in range(gridstate.height):
+            assert [type(o) for o in incremental.grid[x][y]] == [
+                type(o) for o in full.grid[x][y]
+            ]
+    assert incremental.score == full.score
+    assert incremental.turn == full.turn
+
+    # Cells the agent left/entered are rebuilt, the rest reuse instances
+    end = _find_agent_pos(incremental)
+    assert end is not None and end != start
+    old_agent = next(
+        obj
+        for obj in gridstate.grid[start[0]][start[1]]
+        if isinstance(obj, AgentEntity)
+    )
+    assert all(obj is not old_agent for obj in incremental.grid[end[0]][end[1]])
+    corner = incremental.grid[0][0]
+    assert corner and all(a is b for a, b in zip(corner, gridstate.grid[0][0]))
+
+    # Only the two cells touched by the move hold new instances.
+    rebuilt = {
+        (x, y)
+        for x in range(gridstate.width)
+        for y in range(gridstate.height)
+        if [id(o) for o in incremental.grid[x][y]]
+        != [id(o) for o in gridstate.grid[x][y]]
+    }
+    assert rebuilt == {start, end}
+
+
+def test_incremental_step_reuses_registered_entity_classes() -> None:
+    from dataclasses import dataclass
+
+    from grid_universe.components.properties.appearance import Appearance
+    from grid_universe.grid.entity import BaseEntity, Entity
+
+    from grid_adventure.grid import (
+        SPECIALIZATION_RULES,
+        SPECIALIZATION_TABLE,
+        SpecializationRule,
+        register_specialization,
+    )
+
+    @dataclass(repr=False)
+    class StatueEntity(BaseEntity):
+        appearance: Appearance = Appearance(name="statue", priority=5)  # noqa: RUF009
+
+    rule = SpecializationRule(StatueEntity, appearance="statue")
+    register_specialization(rule)
+    try:
+        base = intro.build_level_basic_movement()
+        base.add((0, 0), Entity(appearance=Appearance(name="statue", priority=5)))
+        gridstate = specialize_entities(base)
+        statue = next(o for o in gridstate.grid[0][0] if isinstance(o, StatueEntity))
+        reused = specialize_entities(base, previous=gridstate)
+        assert any(o is statue for o in reused.grid[0][0])
+        stepped = step(gridstate, Action.WAIT, incremental=True)
+        assert any(o is statue for o in stepped.grid[0][0])
+    finally:
+        SPECIALIZATION_RULES.remove(rule)
+        SPECIALIZATION_TABLE.clear()
+
+
+def test_step_flyweight_shares_background_entities() -> None:
+    from grid_adventure.entities import FloorEntity
+
+    gridstate = specialize_entities(intro.build_level_maze_turns(seed=101))
+    for incremental in (False, True):
+        stepped = step(gridstate, Action.RIGHT, incremental=incremental, flyweight=True)
+        start = _find_agent_pos(gridstate)
+        end = _find_agent_pos(stepped)
+        assert start is not None and end is not None and end != start
+        # The floors of rebuilt cells are one interned instance
+        floors = [
+            obj
+            for pos in (start, end)
+            for obj in stepped.grid[pos[0]][pos[1]]
+            if isinstance(obj, FloorEntity)
+        ]
+        assert len(floors) == 2 and floors[0] is floors[1]
+
+
+def _cell_types(gridstate: GridState) -> list[list[list[str]]]:
+    return [
+        [sorted(type(obj).__name__ for obj in cell) for cell in column]
+        for column in gridstate.grid
+    ]
+
+
+_SCRIPT = [Action.RIGHT, Action.DOWN, Action.PICK_UP, Action.LEFT, Action.UP] * 6
+
+
+def test_incremental_step_chain_matches_full_step() -> None:
+    full = incremental = specialize_entities(intro.build_level_maze_turns(seed=101))
+    for action in _SCRIPT:
+        full = step(full, action)
+        incremental = step(incremental, action, incremental=True)
+        assert _cell_types(incremental) == _cell_types(full)
+        assert (incremental.score, incremental.turn) == (full.score, full.turn)
+        assert (incremental.win, incremental.lose) == (full.win, full.lose)
+        if full.win or full.lose:
+            break
+
+
+def test_incremental_step_shares_untouched_columns() -> None:
+    gridstate = specialize_entities(intro.build_level_maze_turns(seed=101))
+    previous = step(gridstate, Action.WAIT, incremental=True)
+    stepped = step(previous, Action.RIGHT, incremental=True)
+    rebuilt_columns = {
+        x
+        for x in range(stepped.width)
+        for y in range(stepped.height)
+        if [id(o) for o in stepped.grid[x][y]] != [id(o) for o in previous.grid[x][y]]
+    }
+    assert rebuilt_columns
+    for x in range(stepped.width):
+        assert (stepped.grid[x] is previous.grid[x]) == (x not in rebuilt_columns)
+
+
+def test_incremental_step_branches_from_one_gridstate() -> None:
+    gridstate = specialize_entities(intro.build_level_maze_turns(seed=101))
+    stepped = step(gridstate, Action.RIGHT, incremental=True)
+    reference = step(gridstate, Action.RIGHT)
+    for action in (Action.DOWN, Action.RIGHT, Action.DOWN):
+        branch = step(stepped, action, incremental=True)
+        assert _cell_types(branch) == _cell_types(step(reference, action))
+        assert branch.turn == stepped.turn + 1
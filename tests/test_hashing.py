@@ -0,0 +1,105 @@
+import random
+from dataclasses import replace
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+from pyrsistent import pmap
+
+from grid_adventure import bitboard, grid, hashing
+from grid_adventure.hashing import (
+    Fingerprinter,
+    gridstate_fingerprint,
+    state_fingerprint,
+)
+from grid_adventure.levels import intro, procedural
+from grid_adventure.levels.procedural import GeneratorConfig
+from grid_adventure.solver import state_key
+from grid_adventure.step import step as adv_step
+
+
+def _rollout(state, steps, seed):
+    rng = np.random.default_rng(seed)
+    actions = list(Action)
+    states = [state]
+    for _ in range(steps):
+        state = adv_step(state, actions[int(rng.integers(len(actions)))])
+        states.append(state)
+        if state.win or state.lose:
+            break
+    return states
+
+
+def _ground_truth(state):
+    board = bitboard.from_state(state)
+    agent = board.agent
+    return state_key(board.planes, agent, board.effects) + bytes(
+        agent[[bitboard.AGENT_INDEX[n] for n in ("turn", "score", "lose")]]
+    )
+
+
+def test_independent_of_entity_ids_and_cell_order():
+    state = to_state(intro.build_level_boss())
+    gridstate = grid.from_state(state)
+    for column in gridstate.grid:
+        for cell in column:
+            random.Random(0).shuffle(cell)
+    renumbered = to_state(gridstate)
+    assert state_fingerprint(renumbered) == state_fingerprint(state)
+    assert gridstate_fingerprint(gridstate) == gridstate_fingerprint(
+        grid.from_state(state)
+    )
+
+
+def test_fresh_builds_hash_equal():
+    a = to_state(intro.build_level_key_door())
+    b = to_state(intro.build_level_key_door())
+    assert state_fingerprint(a) == state_fingerprint(b)
+    assert state_fingerprint(a) != state_fingerprint(
+        to_state(intro.build_level_key_door(seed=1))
+    )
+
+
+def test_no_collisions_on_rollouts_and_generated_levels():
+    states = []
+    for builder in (intro.build_level_boss, intro.build_level_power_boots):
+        for seed in range(4):
+            states += _rollout(to_state(builder()), 40, seed)
+    config = GeneratorConfig(width=12, height=10)
+    for board in procedural.generate_boards(config, 30):
+        states.append(bitboard.to_state(board))
+    by_fingerprint: dict[int, bytes] = {}
+    for state in states:
+        truth = _ground_truth(state)
+        assert by_fingerprint.setdefault(state_fingerprint(state), truth) == truth
+    distinct = {_ground_truth(state) for state in states}
+    assert len(by_fingerprint) >= len(distinct)
+
+
+def test_incremental_matches_cold_fingerprints():
+    warm = Fingerprinter()
+    states = _rollout(to_state(intro.build_level_combined_mechanics()), 30, 1)
+    for state in states:
+        assert warm.state(state) == Fingerprinter().state(state)
+        gridstate = grid.from_state(state)
+        assert warm.gridstate(gridstate) == Fingerprinter().gridstate(gridstate)
+
+
+def test_grid_step_changes_fingerprint():
+    gridstate = intro.build_level_basic_movement()
+    before = gridstate_fingerprint(gridstate)
+    after = gridstate_fingerprint(grid.step(gridstate, Action.RIGHT))
+    assert before != after
+
+
+def test_per_step_bookkeeping_stores_are_not_fingerprinted():
+    state = adv_step(to_state(intro.build_level_basic_movement()), Action.RIGHT)
+    skipped = [
+        name
+        for name in grid.entity_stores()
+        if name != "position" and name not in hashing._STORES
+    ]
+    assert "prev_position" in skipped
+    assert "appearance" in hashing._STORES
+    cleared = replace(state, **{name: pmap() for name in skipped})
+    assert state_fingerprint(cleared) == state_fingerprint(state)
@@ -2,6 +2,7 @@ from typing import Callable
 import numpy as np
 from grid_adventure.env import GridAdventureEnv
 from grid_adventure.levels import intro
+from grid_adventure.observation import image_info
 from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
 from grid_universe.actions import Action
 from grid_universe.renderer.image import ImageMap
@@ -41,3 +42,50 @@ def test_env_image_observation_with_temp_assets(
     obs2, reward, terminated, truncated, info2 = env.step(Action.WAIT)
     assert obs2["image"].shape == obs["image"].shape
     env.close()
+
+
+INTRO_LEVELS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+SCRIPT = [
+    Action.RIGHT,
+    Action.DOWN,
+    Action.PICK_UP,
+    Action.RIGHT,
+    Action.USE_KEY,
+    Action.UP,
+    Action.LEFT,
+    Action.DOWN,
+    Action.PICK_UP,
+    Action.WAIT,
+] * 3
+
+
+def test_image_info_matches_base_env_info():
+    for builder in INTRO_LEVELS:
+        env = GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(builder),
+            observation_type="image",
+            render_resolution=32,
+        )
+        obs, _ = env.reset(seed=0)
+        assert env.state is not None and env.agent_id is not None
+        assert image_info(env.state, env.agent_id) == obs["info"]
+        for action in SCRIPT:
+            obs, _, terminated, truncated, _ = env.step(action)
+            assert image_info(env.state, env.agent_id) == obs["info"]
+            if terminated or truncated:
+                break
+        env.close()
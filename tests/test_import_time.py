@@ -0,0 +1,87 @@
+"""Import-time regression checks for the headless entry points.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime``; the
+modules it loaded and its cumulative import time are read back from that
+report. The times are recorded as test properties (``--junitxml``) rather than
+asserted, since they depend on the machine.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must only load on first use.
+HEAVY_MODULES = (
+    "PIL",
+    "streamlit",
+    "grid_play",
+    "grid_adventure.sprites",
+)
+
+HEADLESS_ENTRY_POINTS = (
+    "grid_adventure.step",
+    "grid_adventure.grid",
+    "grid_adventure.bitboard",
+    "grid_adventure.observation",
+    "grid_adventure.levels.intro",
+)
+
+
+# Modules built on the base environment. ``grid_universe.env`` may load its own
+# renderer; these must not load anything image-related on top of it.
+ENV_ENTRY_POINTS = (
+    "grid_adventure.env",
+    "grid_adventure.vector",
+    "grid_adventure.recording",
+    "grid_adventure.dataset",
+)
+
+RENDER_MODULES = (
+    "PIL",
+    "grid_universe.renderer",
+    "grid_adventure.rendering",
+    "grid_adventure.sprites",
+)
+
+
+def imported_modules(module: str) -> dict[str, int]:
+    """Return ``{module: cumulative import time in us}`` for one import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _loaded(modules: dict[str, int], package: str) -> list[str]:
+    return [m for m in modules if m == package or m.startswith(package + ".")]
+
+
+@pytest.mark.parametrize("entry_point", HEADLESS_ENTRY_POINTS)
+def test_headless_entry_points_skip_heavy_modules(entry_point, record_property):
+    modules = imported_modules(entry_point)
+    assert entry_point in modules
+    record_property("import_time_us", modules[entry_point])
+    for heavy in HEAVY_MODULES + RENDER_MODULES + ("grid_adventure.env",):
+        assert not _loaded(modules, heavy), f"{entry_point} imports {heavy}"
+
+
+@pytest.mark.parametrize("entry_point", ENV_ENTRY_POINTS)
+def test_env_entry_points_add_no_render_modules(entry_point, record_property):
+    base = imported_modules("grid_universe.env")
+    modules = imported_modules(entry_point)
+    record_property("import_time_us", modules[entry_point])
+    record_property("base_env_import_time_us", base["grid_universe.env"])
+    for heavy in HEAVY_MODULES + RENDER_MODULES:
+        added = sorted(set(_loaded(modules, heavy)) - set(base))
+        assert not added, f"{entry_point} imports {added}"
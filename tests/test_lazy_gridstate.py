@@ -0,0 +1,58 @@
+from grid_universe.grid.convert import to_state as base_to_state
+from grid_universe.grid.gridstate import GridState
+
+from grid_adventure.entities import AgentEntity, CoinEntity
+from grid_adventure.grid import LazyGridState, from_state, lazy_from_state, to_state
+from grid_adventure.levels import intro
+
+
+def _cell_types(gridstate: GridState, x: int, y: int) -> list[str]:
+    return sorted(type(obj).__name__ for obj in gridstate.grid[x][y])
+
+
+def _state():
+    return base_to_state(intro.build_level_required_multiple())
+
+
+def test_cells_match_eager_conversion():
+    state = _state()
+    eager = from_state(state)
+    view = lazy_from_state(state)
+    assert isinstance(view, GridState)
+    for x in range(state.width):
+        for y in range(state.height):
+            assert _cell_types(view, x, y) == _cell_types(eager, x, y)
+    (agent_id,) = state.agent
+    position = state.position[agent_id]
+    assert any(
+        isinstance(obj, AgentEntity)
+        for obj in view.objects_at((position.x, position.y))
+    )
+
+
+def test_untouched_view_round_trips_to_the_same_state():
+    state = _state()
+    view = LazyGridState(state)
+    assert to_state(view) is state
+    view.grid[0][0]
+    assert to_state(view) is not state
+
+
+def test_mutations_are_copied_on_write():
+    state = _state()
+    view = lazy_from_state(state)
+    (agent_id,) = state.agent
+    position = state.position[agent_id]
+    cell = (position.x, position.y)
+    agent = next(obj for obj in view.objects_at(cell) if isinstance(obj, AgentEntity))
+    view.remove(cell, agent)
+    view.add((0, 0), agent)
+    view.add(cell, CoinEntity())
+
+    # The viewed State is unchanged; the converted view has the edits.
+    assert state.position[agent_id] == position
+    new_state = to_state(view)
+    (new_agent,) = new_state.agent
+    assert (new_state.position[new_agent].x, new_state.position[new_agent].y) == (0, 0)
+    assert len(new_state.position) == len(state.position) + 1
+    assert "CoinEntity" in _cell_types(lazy_from_state(new_state), *cell)
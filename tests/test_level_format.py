@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+
+from grid_adventure import bitboard
+from grid_adventure.entities import CoinEntity, FloorEntity, WallEntity
+from grid_adventure.levels import binary, intro
+from grid_adventure.step import step as adv_step
+
+LEVELS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+
+def _assert_same_board(a: bitboard.Bitboard, b: bitboard.Bitboard) -> None:
+    np.testing.assert_array_equal(a.planes, b.planes)
+    np.testing.assert_array_equal(a.agent, b.agent)
+    np.testing.assert_array_equal(a.effects, b.effects)
+    assert a.levels == b.levels
+
+
+@pytest.mark.parametrize("builder", LEVELS, ids=lambda b: b.__name__)
+def test_save_load_round_trip(builder, tmp_path):
+    gridstate = builder()
+    path = tmp_path / "level.galv"
+    binary.save_level(gridstate, path)
+
+    loaded = binary.load_level(path)
+    assert (loaded.width, loaded.height) == (gridstate.width, gridstate.height)
+    assert loaded.movement == gridstate.movement
+    assert loaded.objective == gridstate.objective
+    assert loaded.turn_limit == gridstate.turn_limit
+    assert loaded.seed == gridstate.seed
+    expected = bitboard.from_gridstate(gridstate)
+    _assert_same_board(bitboard.from_gridstate(loaded), expected)
+    _assert_same_board(binary.load_board(path), expected)
+
+
+@pytest.mark.parametrize("flyweight", [False, True])
+def test_loaded_levels_share_floors_and_walls_only_with_flyweight(flyweight, tmp_path):
+    path = tmp_path / "level.galv"
+    binary.save_level(intro.build_level_maze_turns(), path)
+    for loaded in (
+        binary.load_level(path, flyweight=flyweight),
+        binary.decode_level(path.read_bytes(), flyweight=flyweight),
+    ):
+        for kind in (FloorEntity, WallEntity):
+            entities = [
+                obj
+                for column in loaded.grid
+                for cell in column
+                for obj in cell
+                if isinstance(obj, kind)
+            ]
+            assert len(entities) > 1
+            distinct = len({id(obj) for obj in entities})
+            assert distinct == (1 if flyweight else len(entities))
+
+
+def test_loaded_level_steps_like_built_level():
+    built = to_state(intro.build_level_key_door())
+    loaded = to_state(
+        binary.decode_level(binary.encode_level(intro.build_level_key_door()))
+    )
+    actions = (Action.RIGHT, Action.DOWN, Action.PICK_UP, Action.USE_KEY, Action.UP)
+    for action in actions:
+        built = adv_step(built, action)
+        loaded = adv_step(loaded, action)
+    _assert_same_board(bitboard.from_state(loaded), bitboard.from_state(built))
+
+
+def test_stacked_entities_use_count_encoding():
+    gridstate = intro.build_level_optional_coin()
+    gridstate.add((1, 1), CoinEntity())
+    gridstate.add((1, 1), CoinEntity())
+    data = binary.encode_level(gridstate)
+    assert data[6] & binary.FLAG_COUNTS
+    assert binary.encoded_size(data) == len(data)
+    _assert_same_board(binary.decode_board(data), bitboard.from_gridstate(gridstate))
+
+
+def test_mid_episode_board_round_trips():
+    board = bitboard.from_gridstate(intro.build_level_power_boots())
+    for action in np.random.default_rng(0).integers(0, 7, size=25):
+        board = bitboard.step(board, int(action))
+    _assert_same_board(binary.decode_board(binary.encode_board(board)), board)
+
+
+def test_decode_from_offset_in_shared_buffer():
+    data = binary.encode_level(intro.build_level_boss())
+    buffer = memoryview(b"padding" + data)
+    _assert_same_board(binary.decode_board(buffer, 7), binary.decode_board(data))
+
+
+def test_rejects_bad_magic_and_version():
+    data = binary.encode_level(intro.build_level_basic_movement())
+    with pytest.raises(ValueError, match="magic"):
+        binary.decode_board(b"NOPE" + data[4:])
+    with pytest.raises(ValueError, match="version"):
+        binary.decode_board(data[:4] + bytes([binary.FORMAT_VERSION + 1]) + data[5:])
@@ -0,0 +1,82 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from grid_adventure import bitboard
+from grid_adventure.levels import intro
+from grid_adventure.levels.pack import LevelPack, LevelPackWriter, write_pack
+from grid_adventure.vector import GridAdventureVectorEnv
+
+BUILDERS = [
+    intro.build_level_basic_movement,
+    intro.build_level_key_door,
+    intro.build_level_power_boots,
+    intro.build_level_boss,
+]
+
+
+def _assert_same_board(a: bitboard.Bitboard, b: bitboard.Bitboard) -> None:
+    np.testing.assert_array_equal(a.planes, b.planes)
+    np.testing.assert_array_equal(a.agent, b.agent)
+    assert a.levels == b.levels
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = tmp_path / "levels.galp"
+    # A generator: the pack is built without holding the levels in memory.
+    count = write_pack(path, (BUILDERS[i % len(BUILDERS)](seed=i) for i in range(10)))
+    assert count == 10
+    return path
+
+
+def test_random_access_matches_builders(pack_path):
+    with LevelPack(pack_path) as pack:
+        assert len(pack) == 10
+        for index in (7, 0, 9, 3, -1):
+            expected = BUILDERS[index % 10 % len(BUILDERS)](seed=index % 10)
+            _assert_same_board(
+                bitboard.from_gridstate(pack[index]),
+                bitboard.from_gridstate(expected),
+            )
+            _assert_same_board(pack.board(index), bitboard.from_gridstate(expected))
+        assert pack.state(2).width == 13
+        with pytest.raises(IndexError):
+            pack.board(10)
+
+
+def test_writer_appends_boards_and_gridstates(tmp_path):
+    path = tmp_path / "mixed.galp"
+    board = bitboard.step(bitboard.from_gridstate(intro.build_level_key_door()), 3)
+    with LevelPackWriter(path) as writer:
+        assert writer.add(intro.build_level_maze_turns()) == 0
+        assert writer.add_board(board) == 1
+    with LevelPack(path) as pack:
+        assert len(pack) == 2
+        _assert_same_board(pack.board(1), board)
+
+
+def test_pickle_reopens_mapping_by_path(pack_path):
+    with LevelPack(pack_path) as pack:
+        data = pickle.dumps(pack)
+        assert len(data) < 500
+        clone = pickle.loads(data)
+        _assert_same_board(clone.board(5), pack.board(5))
+        clone.close()
+
+
+def test_pack_state_fns_drive_vector_env(pack_path):
+    with LevelPack(pack_path) as pack:
+        fns = [pack.state_fn(i) for i in (1, 5)]
+        envs = GridAdventureVectorEnv(fns, observation_type="tensor")
+        obs, _ = envs.reset(seed=0)
+        assert obs["grid"].shape[0] == 2
+        envs.close()
+
+
+def test_rejects_non_pack_file(tmp_path):
+    path = tmp_path / "bad.galp"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError, match="magic"):
+        LevelPack(path)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+
+from grid_adventure import bitboard
+from grid_adventure.levels import procedural
+from grid_adventure.levels.procedural import GeneratorConfig
+from grid_adventure.step import step as adv_step
+
+CONFIGS = [
+    GeneratorConfig(),
+    GeneratorConfig(width=16, height=12, gems=3, keys=2, doors=2, speed=1, shield=1),
+    GeneratorConfig(width=7, height=5, wall_density=0.0, keys=0, doors=0, lava=0),
+]
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_generated_levels_match_config(config):
+    for index in range(5):
+        board = procedural.generate_board(config, procedural.level_seed(0, index))
+        planes = board.planes
+        assert (board.width, board.height) == (config.width, config.height)
+        assert planes[bitboard.PLANE_INDEX["gem"]].sum() == config.gems
+        assert planes[bitboard.PLANE_INDEX["locked_door"]].sum() == config.doors
+        assert planes[bitboard.PLANE_INDEX["box"]].sum() == config.boxes
+        assert planes[bitboard.PLANE_INDEX["exit"]].sum() == 1
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_witness_plan_wins_with_reference_step(config):
+    for index in range(3):
+        gridstate = procedural.generate_level(config, procedural.level_seed(1, index))
+        plan = procedural.witness_plan(bitboard.from_gridstate(gridstate))
+        assert plan is not None
+        state = to_state(gridstate)
+        for action in plan:
+            state = adv_step(state, action)
+        assert state.win and not state.lose
+
+
+def test_witness_plan_rejects_walled_off_exit():
+    config = GeneratorConfig(wall_density=0.0, keys=0, doors=0, lava=0, boxes=0)
+    board = procedural.generate_board(config, 0)
+    exit_y, exit_x = np.argwhere(board.planes[bitboard.PLANE_INDEX["exit"]])[0]
+    walls = board.planes[bitboard.PLANE_INDEX["wall"]]
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        walls[exit_y + dy, exit_x + dx] = 1
+    assert procedural.witness_plan(board) is None
+
+
+def test_turn_limit_rejects_long_plans():
+    config = GeneratorConfig(width=15, height=15, turn_limit=4)
+    with pytest.raises(RuntimeError):
+        procedural.generate_board(config, 0)
+
+
+def test_generation_is_deterministic_across_processes():
+    config = GeneratorConfig(width=9, height=7)
+    serial = list(procedural.generate_boards(config, 6, seed=5, processes=1))
+    parallel = list(procedural.generate_boards(config, 6, seed=5, processes=2))
+    assert len(parallel) == 6
+    for a, b in zip(serial, parallel):
+        np.testing.assert_array_equal(a.planes, b.planes)
+        np.testing.assert_array_equal(a.agent, b.agent)
+        assert a.levels == b.levels
+    other = next(procedural.generate_boards(config, 1, seed=6))
+    assert not np.array_equal(other.planes, serial[0].planes)
+
+
+def test_generate_levels_yields_gridstates():
+    levels = list(procedural.generate_levels(GeneratorConfig(), 3, flyweight=True))
+    assert [level.seed for level in levels] == [
+        procedural.level_seed(0, i) for i in range(3)
+    ]
+    state = adv_step(to_state(levels[0]), Action.WAIT)
+    assert state.turn == 1
+
+
+def test_config_rejects_overfull_levels():
+    with pytest.raises(ValueError):
+        GeneratorConfig(width=4, height=4, gems=5)
@@ -0,0 +1,67 @@
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.profiling import StepProfiler
+
+
+def _env(profiler: StepProfiler | None, observation_type: str) -> GridAdventureEnv:
+    return GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type=observation_type,
+        profiler=profiler,
+        width=7,
+        height=5,
+    )
+
+
+def test_step_phases_are_recorded_and_reported_in_info():
+    calls = []
+    profiler = StepProfiler(
+        callback=lambda call, sample: calls.append(call), include_in_info=True
+    )
+    env = _env(profiler, "gridstate")
+    _, info = env.reset()
+    assert set(info["profile"]) == {
+        "from_state",
+        "specialize",
+        "initial_state",
+        "total",
+    }
+    for _ in range(3):
+        *_, info = env.step(Action.WAIT)
+    sample = info["profile"]
+    assert set(sample) == {"from_state", "specialize", "rules", "total"}
+    phases = sum(seconds for name, (seconds, _) in sample.items() if name != "total")
+    assert phases == pytest.approx(sample["total"][0])
+    assert calls == ["reset", "step", "step", "step"]
+
+    stats = profiler.stats()
+    assert stats["step/total"].count == 3 and stats["reset/total"].count == 1
+    assert stats["step/rules"].max_us >= stats["step/rules"].p50_us > 0
+    counts, _ = profiler.histogram("step/specialize", bins=4)
+    assert counts.sum() == 3
+    env.close()
+
+
+def test_tensor_observation_phase_and_disabled_profiler():
+    profiler = StepProfiler(window=2)
+    env = _env(profiler, "tensor")
+    env.reset()
+    for _ in range(5):
+        env.step(Action.WAIT)
+    assert set(profiler.last()) == {"tensor", "rules", "total"}
+    assert profiler.stats()["step/tensor"].count == 5
+    profiler.clear()
+    assert profiler.stats() == {}
+    env.close()
+
+    env = _env(None, "gridstate")
+    _, info = env.reset()
+    *_, info = env.step(Action.WAIT)
+    assert "profile" not in info
+    env.close()
@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+
+from grid_adventure import recording
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.hashing import state_fingerprint
+from grid_adventure.levels import intro
+from grid_adventure.recording import (
+    EpisodeRecorder,
+    Replay,
+    builder_id,
+    pack_actions,
+    read_episodes,
+    unpack_actions,
+)
+
+
+def _recorder(path: Path, chunk_size: int = 8, **env_kwargs: Any) -> EpisodeRecorder:
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(intro.build_level_boss),
+        **{"observation_type": "gridstate", **env_kwargs},
+    )
+    return EpisodeRecorder(
+        env, path, builder_id(intro.build_level_boss), chunk_size=chunk_size
+    )
+
+
+def test_actions_pack_into_three_bits():
+    actions = np.random.default_rng(0).integers(0, len(Action), 1001)
+    data = pack_actions(actions)
+    assert len(data) == (3 * 1001 + 7) // 8
+    np.testing.assert_array_equal(unpack_actions(data, 1001), actions)
+
+
+def test_replay_reconstructs_recorded_states(tmp_path: Path):
+    path = tmp_path / "episodes.gaep"
+    rng = np.random.default_rng(0)
+    recorded = []
+    with _recorder(path) as env:
+        for seed in (None, 7):
+            env.reset(seed=seed)
+            fingerprints = [state_fingerprint(env.unwrapped.state)]
+            for _ in range(30):
+                _, _, terminated, _, _ = env.step(int(rng.integers(len(Action))))
+                fingerprints.append(state_fingerprint(env.unwrapped.state))
+                if terminated:
+                    break
+            recorded.append(fingerprints)
+
+    episodes = read_episodes(path)
+    assert [e.reset_seed for e in episodes] == [None, 7]
+    for episode, fingerprints in zip(episodes, recorded):
+        assert len(episode) == len(fingerprints) - 1
+        replay = Replay(episode, checkpoint_interval=4)
+        for t in (len(episode), 5, 0, len(episode) // 2):
+            assert state_fingerprint(replay.state(t)) == fingerprints[t]
+        assert [state_fingerprint(s) for s in replay.states()] == fingerprints
+
+
+def test_truncated_record_is_ignored_and_appends_continue(tmp_path: Path):
+    path = tmp_path / "episodes.gaep"
+    with _recorder(path) as env:
+        env.reset()
+        for _ in range(5):
+            env.step(Action.WAIT)
+    path.write_bytes(path.read_bytes()[:-1])
+    assert [len(e) for e in read_episodes(path)] == [0]
+
+    with _recorder(path) as env:
+        env.reset()
+        env.step(Action.DOWN)
+    assert [len(e) for e in read_episodes(path)] == [0, 1]
+
+
+def test_replay_rejects_a_different_level(tmp_path: Path):
+    path = tmp_path / "episodes.gaep"
+    with _recorder(path) as env:
+        env.reset()
+    (episode,) = read_episodes(path)
+    other = {episode.level_id: lambda: to_state(intro.build_level_basic_movement())}
+    with pytest.raises(ValueError):
+        Replay(episode, levels=other)
+
+
+def test_seeds_use_the_unsigned_64_bit_range(tmp_path: Path):
+    path = tmp_path / "episodes.gaep"
+    with _recorder(path) as env:
+        env.reset(seed=2**64 - 1)
+        for seed in (-1, 2**64):
+            with pytest.raises(ValueError):
+                env.reset(seed=seed)
+    assert [e.reset_seed for e in read_episodes(path)] == [2**64 - 1]
+
+
+@pytest.mark.parametrize("backend", ["base", "tiles"])
+def test_replay_images_use_the_recorded_render_backend(tmp_path: Path, backend):
+    path = tmp_path / "episodes.gaep"
+    frames = []
+    with _recorder(
+        path, observation_type="image", render_backend=backend, render_resolution=96
+    ) as env:
+        obs, _ = env.reset()
+        frames.append(obs["image"])
+        for action in (Action.RIGHT, Action.DOWN):
+            obs, *_ = env.step(action)
+            frames.append(obs["image"])
+    (episode,) = read_episodes(path)
+    assert (episode.render_backend, episode.render_resolution) == (backend, 96)
+    replay = Replay(episode)
+    for t, frame in enumerate(frames):
+        np.testing.assert_array_equal(replay.image(t), frame)
+
+
+def test_reads_version_1_recordings(tmp_path: Path):
+    level_id = builder_id(intro.build_level_boss).encode()
+    episode = recording._EPISODE_V1.pack(
+        recording.FLAG_HAS_RESET_SEED, 7, 0, 123, len(level_id)
+    )
+    path = tmp_path / "old.gaep"
+    path.write_bytes(
+        recording._FILE_HEADER.pack(recording.MAGIC, 1)
+        + recording._RECORD.pack(recording.RECORD_EPISODE, len(episode + level_id))
+        + episode
+        + level_id
+    )
+    (record,) = read_episodes(path)
+    assert (record.reset_seed, record.state_seed, record.fingerprint) == (7, None, 123)
+    assert (record.render_backend, record.render_resolution) == ("tiles", None)
+    with pytest.raises(ValueError):
+        _recorder(path)
@@ -0,0 +1,80 @@
+import pytest
+from grid_universe.grid.convert import to_state
+
+from grid_adventure import bitboard
+from grid_adventure.entities import WallEntity
+from grid_adventure.levels import intro, procedural
+from grid_adventure.levels.procedural import GeneratorConfig
+from grid_adventure.solver import solve, state_key
+from grid_adventure.step import step as adv_step
+
+LEVELS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+
+@pytest.mark.parametrize("builder", LEVELS, ids=lambda b: b.__name__)
+def test_plans_win_with_reference_step(builder):
+    state = to_state(builder())
+    result = solve(state)
+    assert result.solved and result.cost == len(result.actions)
+    for action in result.actions:
+        state = adv_step(state, action)
+    assert state.win and not state.lose
+    assert state.score == result.score
+
+
+def test_basic_movement_plan_is_shortest():
+    result = solve(intro.build_level_basic_movement())
+    assert result.cost == 4
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [intro.build_level_key_door, intro.build_level_pushable_box],
+    ids=lambda b: b.__name__,
+)
+def test_astar_matches_breadth_first_cost(builder):
+    astar = solve(builder())
+    bfs = solve(builder(), heuristic=False)
+    assert astar.cost == bfs.cost
+    assert astar.nodes_expanded <= bfs.nodes_expanded
+
+
+def test_plans_are_no_longer_than_generator_witness():
+    config = GeneratorConfig(width=9, height=7)
+    for index in range(3):
+        board = procedural.generate_board(config, procedural.level_seed(2, index))
+        result = solve(board)
+        assert result.solved
+        assert result.cost <= len(procedural.witness_plan(board))
+
+
+def test_node_limit_and_unsolvable_levels():
+    limited = solve(intro.build_level_boss(), max_nodes=5)
+    assert not limited.solved and limited.limit_reached
+
+    gridstate = intro.build_level_basic_movement()
+    for position in ((4, 2), (5, 1), (5, 3), (6, 2)):
+        gridstate.add(position, WallEntity())
+    unsolvable = solve(gridstate)
+    assert not unsolvable.solved and not unsolvable.limit_reached
+
+
+def test_state_key_ignores_turn_and_score():
+    board = bitboard.from_gridstate(intro.build_level_key_door())
+    waited = bitboard.step(bitboard.step(board, 6), 6)
+    assert state_key(board.planes, board.agent, board.effects) == state_key(
+        waited.planes, waited.agent, waited.effects
+    )
@@ -339,3 +339,129 @@ def test_specialize_roundtrip_preserves_types_and_coordinates():
     assert len(inv_list) == 2
     assert any(isinstance(item, KeyEntity) for item in inv_list)
     assert any(isinstance(item, GemEntity) for item in inv_list)
+
+
+def test_dispatch_table_memoizes_signatures():
+    from grid_adventure.grid import (
+        SPECIALIZATION_TABLE,
+        _specialize_single,
+        entity_signature,
+    )
+
+    first = _specialize_single(create_wall())
+    signature = entity_signature(create_wall())
+    assert isinstance(first, WallEntity)
+    assert SPECIALIZATION_TABLE[signature] is WallEntity
+
+    second = _specialize_single(create_wall())
+    assert isinstance(second, WallEntity) and second is not first
+
+
+def test_register_specialization_for_new_entity_class():
+    from dataclasses import dataclass
+
+    from grid_universe.grid.entity import BaseEntity
+
+    from grid_adventure.grid import (
+        SPECIALIZATION_RULES,
+        SPECIALIZATION_TABLE,
+        SpecializationRule,
+        _specialize_single,
+        register_specialization,
+    )
+
+    @dataclass(repr=False)
+    class StatueEntity(BaseEntity):
+        appearance: Appearance = Appearance(name="statue", priority=5)  # noqa: RUF009
+
+    rule = SpecializationRule(StatueEntity, appearance="statue")
+    register_specialization(rule)
+    try:
+        generic = Entity(appearance=Appearance(name="statue", priority=5))
+        assert isinstance(_specialize_single(generic), StatueEntity)
+        # Built-in rules are unaffected
+        assert isinstance(_specialize_single(create_floor()), FloorEntity)
+    finally:
+        SPECIALIZATION_RULES.remove(rule)
+        SPECIALIZATION_TABLE.clear()
+
+
+def test_from_state_slotted_variants_keep_isinstance():
+    from grid_adventure.entities import SLOTTED_ENTITY_TYPES
+    from grid_adventure.levels import intro
+
+    state = to_state(intro.build_level_boss())
+    gridstate = from_state(state, slotted=True)
+
+    seen: set[type] = set()
+    for _, _, obj in _flatten(gridstate):
+        assert type(obj) in SLOTTED_ENTITY_TYPES.values()
+        assert "__slots__" in vars(type(obj))
+        # Every component lives in a slot; nothing spills into __dict__
+        assert vars(obj) == {}
+        seen.add(type(obj))
+    assert any(issubclass(t, FloorEntity) for t in seen)
+    assert any(issubclass(t, AgentEntity) for t in seen)
+
+    # Slotted entities convert back to the same State layout
+    roundtrip = from_state(to_state(gridstate))
+    for x in range(state.width):
+        for y in range(state.height):
+            assert sorted(type(o).__name__ for o in roundtrip.grid[x][y]) == sorted(
+                type(o).__name__.removeprefix("Slotted") for o in gridstate.grid[x][y]
+            )
+
+
+def test_flyweight_background_entities_are_shared():
+    from grid_adventure.levels import intro
+
+    gridstate = intro.build_level_maze_turns(flyweight=True)
+    floors = [obj for _, _, obj in _flatten(gridstate) if isinstance(obj, FloorEntity)]
+    walls = [obj for _, _, obj in _flatten(gridstate) if isinstance(obj, WallEntity)]
+    assert len({id(obj) for obj in floors}) == 1
+    assert len({id(obj) for obj in walls}) == 1
+
+    # Each cell still becomes its own entity in the State
+    state = to_state(gridstate)
+    floor_ids = [eid for eid, app in state.appearance.items() if app.name == "floor"]
+    assert len(floor_ids) == len(floors) == gridstate.width * gridstate.height
+
+    # Specialization interns background entities, other entities stay per-cell
+    specialized = from_state(state, flyweight=True)
+    floors = [
+        obj for _, _, obj in _flatten(specialized) if isinstance(obj, FloorEntity)
+    ]
+    assert len(floors) == gridstate.width * gridstate.height
+    assert len({id(obj) for obj in floors}) == 1
+    agents = [
+        obj for _, _, obj in _flatten(specialized) if isinstance(obj, AgentEntity)
+    ]
+    assert len(agents) == 1
+
+
+def test_shared_entity_rejects_non_background_classes():
+    import pytest
+
+    from grid_adventure.entities import shared_entity
+
+    assert shared_entity(FloorEntity) is shared_entity(FloorEntity)
+    with pytest.raises(ValueError, match="AgentEntity"):
+        shared_entity(AgentEntity)
+
+
+def test_flyweight_interning_is_bounded(monkeypatch):
+    from grid_adventure import grid
+    from grid_adventure.levels import intro
+
+    monkeypatch.setattr(grid, "_FLYWEIGHTS", {})
+    monkeypatch.setattr(grid, "_FLYWEIGHT_LIMIT", 1)
+    specialized = from_state(to_state(intro.build_level_maze_turns()), flyweight=True)
+    # One background class got the only interned slot, the other stays per-cell
+    floors = [
+        obj for _, _, obj in _flatten(specialized) if isinstance(obj, FloorEntity)
+    ]
+    walls = [obj for _, _, obj in _flatten(specialized) if isinstance(obj, WallEntity)]
+    assert len(grid._FLYWEIGHTS) == 1
+    distinct = sorted(len({id(obj) for obj in group}) for group in (floors, walls))
+    assert distinct[0] == 1
+    assert distinct[1] in (len(floors), len(walls)) and distinct[1] > 1
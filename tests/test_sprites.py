@@ -0,0 +1,109 @@
+from collections.abc import Callable
+from dataclasses import replace
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+from grid_universe.renderer.image import ImageMap
+
+from grid_adventure import sprites
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.rendering import DEFAULT_ASSET_ROOT, IMAGE_MAP, TileRenderer
+from grid_adventure.sprites import SpriteAtlas, shared_atlas
+
+
+def test_atlas_decodes_each_sprite_once():
+    atlas = SpriteAtlas(DEFAULT_ASSET_ROOT, IMAGE_MAP)
+    assert atlas.num_variants("boots", ("speed",)) > 1
+    sprite = atlas.sprite("boots", ("speed",), 0, 32)
+    assert sprite is not None
+    assert sprite.shape == (32, 32, 4) and sprite.dtype == np.uint8
+    assert sprite.flags.c_contiguous and not sprite.flags.writeable
+    assert atlas.sprite("boots", ("speed",), 0, 32) is sprite
+    stats = atlas.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert atlas.sprite("unknown", (), 0, 32) is None
+
+
+def test_atlas_evicts_least_recently_used():
+    atlas = SpriteAtlas(DEFAULT_ASSET_ROOT, IMAGE_MAP, maxsize=2)
+    first = atlas.sprite("floor", (), 0, 16)
+    atlas.sprite("floor", (), 1, 16)
+    atlas.sprite("floor", (), 0, 16)
+    atlas.sprite("floor", (), 2, 16)
+    assert atlas.stats().evictions == 1
+    assert atlas.sprite("floor", (), 0, 16) is first
+    assert atlas.stats().misses == 3
+
+
+def test_shared_atlases_are_bounded(monkeypatch):
+    monkeypatch.setattr(sprites, "_SHARED_ATLASES", type(sprites._SHARED_ATLASES)())
+    monkeypatch.setattr(sprites, "SHARED_ATLAS_LIMIT", 2)
+    maps = [ImageMap(dict(IMAGE_MAP)) for _ in range(3)]
+    first = shared_atlas(DEFAULT_ASSET_ROOT, maps[0])
+    assert shared_atlas(DEFAULT_ASSET_ROOT, maps[0]) is first
+    shared_atlas(DEFAULT_ASSET_ROOT, maps[1])
+    shared_atlas(DEFAULT_ASSET_ROOT, maps[0])
+    shared_atlas(DEFAULT_ASSET_ROOT, maps[2])
+    assert len(sprites._SHARED_ATLASES) == 2
+    assert shared_atlas(DEFAULT_ASSET_ROOT, maps[0]) is first
+
+
+def test_repeated_renders_hit_the_atlas():
+    state = to_state(intro.build_level_key_door())
+    renderer = TileRenderer(resolution=110)
+    frame = renderer.render(state)
+    assert frame.shape == (90, 110, 4)
+    misses = renderer.atlas.stats().misses
+    np.testing.assert_array_equal(renderer.render(state), frame)
+    assert renderer.atlas.stats().misses == misses
+
+
+def test_atlas_misses_once_per_sprite_file(monkeypatch):
+    state = to_state(intro.build_level_key_door())
+    atlas = SpriteAtlas(DEFAULT_ASSET_ROOT, IMAGE_MAP)
+    files = set()
+    sprite = atlas.sprite
+
+    def record(
+        name: str, properties: tuple[str, ...], variant: int, size: int
+    ) -> object:
+        paths = atlas.paths(name, properties)
+        if paths:
+            files.add((paths[variant % len(paths)], size))
+        return sprite(name, properties, variant, size)
+
+    monkeypatch.setattr(atlas, "sprite", record)
+    renderer = TileRenderer(resolution=110, atlas=atlas)
+    for seed in (0, 1):
+        renderer.render(replace(state, seed=seed))
+    # Entity variants are hashed ids, but every file is decoded only once.
+    assert atlas.stats().misses == len(files)
+
+
+def test_env_tiles_backend_with_temp_assets(
+    make_temp_assets: Callable[[dict[str, str]], str],
+):
+    stems = {"human": "human", "floor": "floor", "wall": "wall", "exit": "exit"}
+    asset_root = make_temp_assets(stems)
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="image",
+        render_backend="tiles",
+        render_asset_root=asset_root,
+        render_image_map=ImageMap(
+            {(name, ()): f"{stem}.png" for name, stem in stems.items()}
+        ),
+        render_resolution=70,
+        width=7,
+        height=5,
+    )
+    obs, _ = env.reset()
+    assert obs["image"].shape == (50, 70, 4)
+    assert obs["info"]["status"]["phase"] == "ongoing"
+    obs, _, _, _, _ = env.step(Action.RIGHT)
+    assert obs["info"]["status"]["turn"] == 1
+    env.close()
@@ -0,0 +1,87 @@
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn, to_state
+
+from grid_adventure.constants import DEFAULT_AGENT_HEALTH
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.observation import (
+    CHANNEL_INDEX,
+    TENSOR_CHANNELS,
+    TENSOR_VECTOR_FIELDS,
+    VECTOR_INDEX,
+    state_to_tensor,
+)
+from grid_adventure.step import step
+
+
+def test_env_tensor_observation_matches_space():
+    env = GridAdventureEnv(
+        initial_state_fn=grid_state_fn_to_initial_state_fn(
+            intro.build_level_basic_movement
+        ),
+        observation_type="tensor",
+        width=7,
+        height=5,
+    )
+    obs, _ = env.reset()
+    assert obs["grid"].shape == (len(TENSOR_CHANNELS), 5, 7)
+    assert obs["grid"].dtype == np.uint8
+    assert env.observation_space.contains(obs)
+
+    # Agent starts at (1, 2), the exit sits at (5, 2)
+    agent = obs["grid"][CHANNEL_INDEX["agent"]]
+    assert agent.sum() == 1 and agent[2, 1] == 1
+    assert obs["grid"][CHANNEL_INDEX["exit"], 2, 5] == 1
+    assert obs["grid"][CHANNEL_INDEX["floor"]].all()
+    assert obs["vector"][VECTOR_INDEX["health"]] == 5
+
+    obs2, *_ = env.step(Action.RIGHT)
+    assert obs2["grid"][CHANNEL_INDEX["agent"], 2, 2] == 1
+    env.close()
+
+
+def _key_door_grid(
+    agent: tuple[int, int], key_on_floor: bool, door_locked: bool
+) -> np.ndarray:
+    """Expected channel grid of ``intro.build_level_key_door`` (11x9)."""
+    grid = np.zeros((len(TENSOR_CHANNELS), 9, 11), dtype=np.uint8)
+    grid[CHANNEL_INDEX["floor"]] = 1
+    grid[CHANNEL_INDEX["wall"], :, 5] = 1
+    grid[CHANNEL_INDEX["wall"], 4, 5] = 0
+    door = "locked_door" if door_locked else "unlocked_door"
+    grid[CHANNEL_INDEX[door], 4, 5] = 1
+    grid[CHANNEL_INDEX["exit"], 4, 9] = 1
+    if key_on_floor:
+        grid[CHANNEL_INDEX["key"], 3, 2] = 1
+    grid[CHANNEL_INDEX["agent"], agent[1], agent[0]] = 1
+    return grid
+
+
+def test_tensor_tracks_inventory_and_doors():
+    state = to_state(intro.build_level_key_door(seed=105))
+    obs = state_to_tensor(state)
+    np.testing.assert_array_equal(obs["grid"], _key_door_grid((1, 4), True, True))
+
+    # Action, then agent position, key still on the floor, door locked, keys held
+    script = [
+        (Action.UP, (1, 3), True, True, 0),
+        (Action.RIGHT, (2, 3), True, True, 0),
+        (Action.PICK_UP, (2, 3), False, True, 1),
+        (Action.RIGHT, (3, 3), False, True, 1),
+        (Action.DOWN, (3, 4), False, True, 1),
+        (Action.RIGHT, (4, 4), False, True, 1),
+        (Action.USE_KEY, (4, 4), False, False, 0),
+        (Action.RIGHT, (5, 4), False, False, 0),
+    ]
+    for action, agent, key_on_floor, door_locked, keys in script:
+        state = step(state, action)
+        obs = state_to_tensor(state, out=obs)
+        np.testing.assert_array_equal(
+            obs["grid"], _key_door_grid(agent, key_on_floor, door_locked)
+        )
+        expected_vector = np.zeros(len(TENSOR_VECTOR_FIELDS), dtype=np.int32)
+        expected_vector[VECTOR_INDEX["health"]] = DEFAULT_AGENT_HEALTH
+        expected_vector[VECTOR_INDEX["max_health"]] = DEFAULT_AGENT_HEALTH
+        expected_vector[VECTOR_INDEX["keys"]] = keys
+        np.testing.assert_array_equal(obs["vector"], expected_vector)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+from grid_universe.renderer.image import ImageMap
+from PIL import Image
+
+from grid_adventure.levels import intro
+from grid_adventure.rendering import IMAGE_MAP, ImageRenderer, TileRenderer
+from grid_adventure.step import step as adv_step
+
+INTRO_LEVELS = [
+    intro.build_level_basic_movement,
+    intro.build_level_maze_turns,
+    intro.build_level_optional_coin,
+    intro.build_level_required_multiple,
+    intro.build_level_key_door,
+    intro.build_level_hazard_detour,
+    intro.build_level_pushable_box,
+    intro.build_level_power_shield,
+    intro.build_level_power_ghost,
+    intro.build_level_power_boots,
+    intro.build_level_combined_mechanics,
+    intro.build_level_boss,
+]
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        intro.build_level_key_door,
+        intro.build_level_pushable_box,
+        intro.build_level_power_boots,
+    ],
+    ids=lambda b: b.__name__,
+)
+@pytest.mark.parametrize("static_background", [False, True])
+def test_incremental_render_matches_full_render(builder, static_background):
+    full = TileRenderer(resolution=88)
+    incremental = TileRenderer(
+        resolution=88,
+        atlas=full.atlas,
+        incremental=True,
+        static_background=static_background,
+    )
+    rng = np.random.default_rng(0)
+    actions = list(Action)
+    state = to_state(builder())
+    for _ in range(30):
+        np.testing.assert_array_equal(incremental.render(state), full.render(state))
+        state = adv_step(state, actions[int(rng.integers(len(actions)))])
+        if state.win or state.lose:
+            state = to_state(builder())
+
+
+def test_incremental_render_handles_resolution_and_level_changes():
+    renderer = TileRenderer(resolution=77, incremental=True)
+    small = to_state(intro.build_level_basic_movement())
+    large = to_state(intro.build_level_key_door())
+    assert renderer.render(small).shape == (55, 77, 4)
+    assert renderer.render(large).shape == (63, 77, 4)
+    renderer.resolution = 154
+    frame = renderer.render(large)
+    np.testing.assert_array_equal(
+        frame, TileRenderer(resolution=154, atlas=renderer.atlas).render(large)
+    )
+
+
+def test_static_background_is_rebuilt_when_a_door_unlocks():
+    state = to_state(intro.build_level_key_door())
+    full = TileRenderer(resolution=110)
+    cached = TileRenderer(resolution=110, atlas=full.atlas, static_background=True)
+    # Pick up the key and unlock the door (see test_step_integration).
+    for action in (
+        Action.UP,
+        Action.RIGHT,
+        Action.PICK_UP,
+        Action.RIGHT,
+        Action.DOWN,
+        Action.RIGHT,
+        Action.USE_KEY,
+        Action.RIGHT,
+        Action.USE_KEY,
+    ):
+        np.testing.assert_array_equal(cached.render(state), full.render(state))
+        state = adv_step(state, action)
+    assert len(state.locked) == 0
+    np.testing.assert_array_equal(cached.render(state), full.render(state))
+
+
+@pytest.fixture(scope="module")
+def solid_assets(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, ImageMap]:
+    """One single-colour, single-variant sprite per ``IMAGE_MAP`` entry."""
+    root = tmp_path_factory.mktemp("solid_assets")
+    image_map = {}
+    for i, key in enumerate(IMAGE_MAP):
+        color = (40 + 13 * i, 250 - 11 * i, 17 * i % 256, 255)
+        Image.new("RGBA", (32, 32), color).save(root / f"{i}.png")
+        image_map[key] = f"{i}.png"
+    return str(root), ImageMap(image_map)
+
+
+@pytest.mark.parametrize("builder", INTRO_LEVELS, ids=lambda b: b.__name__)
+def test_tile_renderer_matches_base_renderer(builder, solid_assets):
+    """Documented tolerance against the base ``ImageRenderer``.
+
+    The renderers differ in how they pick a texture variant per entity and
+    where they place shrunk icons. With single-variant, single-colour sprites
+    the variant choice has no effect, so every cell without a shrunk icon must
+    match exactly; cells with one must hold the same pixels, in any layout,
+    up to a 5% difference for icon size rounding.
+    """
+    asset_root, image_map = solid_assets
+    state = to_state(builder())
+    resolution = 20 * state.width
+    base = np.asarray(
+        ImageRenderer(resolution=resolution, asset_root=asset_root, image_map=image_map)
+        .render(state)
+        .convert("RGBA")
+    )
+    tiles = TileRenderer(
+        resolution=resolution, asset_root=asset_root, image_map=image_map
+    )
+    frame = tiles.render(state)
+    assert base.shape == frame.shape
+
+    size = tiles.cell_size(state)
+    icon_cells = {
+        cell
+        for cell, stack in tiles.stacks(state).items()
+        if any(icon for *_, icon, _ in stack)
+        and any(not icon and not bg for *_, icon, bg in stack)
+    }
+    for y in range(state.height):
+        for x in range(state.width):
+            cell = np.s_[y * size : (y + 1) * size, x * size : (x + 1) * size]
+            if (x, y) not in icon_cells:
+                np.testing.assert_array_equal(frame[cell], base[cell], str((x, y)))
+                continue
+            ours = np.sort(frame[cell].reshape(-1, 4).view(np.uint32), axis=0)
+            theirs = np.sort(base[cell].reshape(-1, 4).view(np.uint32), axis=0)
+            assert np.mean(ours != theirs) <= 0.05, (x, y)
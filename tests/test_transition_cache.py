@@ -0,0 +1,98 @@
+from dataclasses import replace
+
+import numpy as np
+from grid_universe.actions import Action
+from grid_universe.grid.convert import to_state
+from pyrsistent import pmap
+
+from grid_adventure import grid
+from grid_adventure.cache import TransitionCache, entity_count, snapshot_nbytes
+from grid_adventure.hashing import Fingerprinter
+from grid_adventure.levels import intro
+from grid_adventure.step import step as adv_step
+
+
+def test_cached_steps_match_uncached_steps():
+    cache = TransitionCache()
+    fingerprint = Fingerprinter()
+    rng = np.random.default_rng(0)
+    start = to_state(intro.build_level_boss())
+    for _ in range(5):
+        state = start
+        for _ in range(15):
+            action = list(Action)[int(rng.integers(3))]
+            cached = cache.step(state, action)
+            assert fingerprint(cached) == fingerprint(adv_step(state, action))
+            state = cached
+    stats = cache.stats()
+    assert stats.hits > 0 and stats.hits + stats.misses == 75
+    assert stats.size == stats.misses
+
+
+def test_lru_evicts_least_recently_used():
+    cache = TransitionCache(maxsize=2)
+    state = to_state(intro.build_level_basic_movement())
+    cache.step(state, Action.UP)
+    cache.step(state, Action.DOWN)
+    cache.step(state, Action.UP)  # refreshes UP
+    cache.step(state, Action.WAIT)  # evicts DOWN
+    cache.step(state, Action.UP)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, len(cache)) == (2, 3, 1, 2)
+
+
+def test_entity_limit_bounds_cached_entities():
+    state = to_state(intro.build_level_key_door())
+    limit = 3 * entity_count(state)
+    cache = TransitionCache(max_entities=limit)
+    for action in Action:
+        cache.step(state, action)
+    stats = cache.stats()
+    assert stats.entities <= limit and stats.size == 3
+    assert stats.evictions == len(Action) - 3
+
+
+def test_byte_limit_bounds_measured_bytes():
+    state = to_state(intro.build_level_key_door())
+    limit = int(2.5 * snapshot_nbytes(adv_step(state, Action.WAIT)))
+    cache = TransitionCache(max_bytes=limit)
+    for action in Action:
+        cache.step(state, action)
+    stats = cache.stats()
+    assert 0 < stats.nbytes <= limit and stats.size == 2
+    assert stats.evictions == len(Action) - 2
+    # Without a byte limit nothing is measured
+    unbounded = TransitionCache()
+    unbounded.step(state, Action.WAIT)
+    assert unbounded.stats().nbytes == 0
+
+
+def test_hits_keep_the_callers_agent_id():
+    cache = TransitionCache()
+    state = to_state(intro.build_level_basic_movement())
+    # The level holds no items, so shifting every store's ids renumbers it.
+    renumbered = replace(
+        state,
+        **{
+            name: pmap({eid + 1000: v for eid, v in getattr(state, name).items()})
+            for name in grid.entity_stores()
+        },
+    )
+    assert renumbered.agent.keys() != state.agent.keys()
+    assert Fingerprinter()(renumbered) == Fingerprinter()(state)
+    for snapshot in (state, renumbered, renumbered):
+        stepped = cache.step(snapshot, Action.RIGHT)
+        assert stepped.agent.keys() == snapshot.agent.keys()
+    assert (cache.stats().hits, cache.stats().misses) == (1, 2)
+
+
+def test_grid_step_is_memoized():
+    cache = TransitionCache()
+    gridstate = grid.from_state(to_state(intro.build_level_maze_turns()))
+    first = cache.grid_step(gridstate, Action.RIGHT)
+    again = cache.grid_step(grid.from_state(grid.to_state(gridstate)), Action.RIGHT)
+    assert again is first
+    expected = grid.step(gridstate, Action.RIGHT)
+    assert Fingerprinter()(first) == Fingerprinter()(expected)
+    cache.clear()
+    assert len(cache) == 0 and cache.stats().hits == 0
@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+from grid_universe.actions import Action
+from grid_universe.grid.convert import grid_state_fn_to_initial_state_fn
+
+from grid_adventure.env import GridAdventureEnv
+from grid_adventure.levels import intro
+from grid_adventure.observation import CHANNEL_INDEX, TENSOR_CHANNELS
+from grid_adventure.vector import GridAdventureAsyncVectorEnv, GridAdventureVectorEnv
+
+
+def test_vector_env_steps_in_lockstep_and_autoresets():
+    envs = GridAdventureVectorEnv.from_builders(
+        [intro.build_level_basic_movement] * 3, observation_type="tensor"
+    )
+    obs, _ = envs.reset(seed=0)
+    assert obs["grid"].shape == (3, len(TENSOR_CHANNELS), 5, 7)
+    assert obs["vector"].shape[0] == 3
+
+    # Two slots walk right towards the exit, one waits
+    actions = np.array(
+        [list(Action).index(a) for a in (Action.RIGHT, Action.RIGHT, Action.WAIT)]
+    )
+    finished = np.zeros(3, dtype=bool)
+    for _ in range(10):
+        obs, rewards, terminated, truncated, infos = envs.step(actions)
+        assert rewards.shape == (3,)
+        assert truncated.shape == (3,) and not truncated.any()
+        if terminated.any():
+            finished |= terminated
+            assert "final_obs" in infos
+            # Autoreset puts the agent back at its start cell
+            for i in np.flatnonzero(terminated):
+                assert obs["grid"][i, CHANNEL_INDEX["agent"], 2, 1] == 1
+            break
+    assert finished[:2].all() and not finished[2]
+    envs.close()
+
+
+def test_vector_env_accepts_different_levels_of_same_size():
+    envs = GridAdventureVectorEnv.from_builders(
+        [intro.build_level_key_door, intro.build_level_pushable_box],
+        observation_type="tensor",
+    )
+    obs, _ = envs.reset()
+    assert obs["grid"].shape == (2, len(TENSOR_CHANNELS), 9, 11)
+    assert obs["grid"][0, CHANNEL_INDEX["key"]].sum() == 1
+    assert obs["grid"][1, CHANNEL_INDEX["box"]].sum() == 1
+    envs.close()
+
+
+def test_vector_env_batches_bitboard_steps():
+    builders = [intro.build_level_key_door, intro.build_level_pushable_box] * 2
+    kwargs = {"observation_type": "tensor", "step_backend": "bitboard"}
+    vector_envs = GridAdventureVectorEnv.from_builders(builders, **kwargs)
+    envs = [
+        GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(builder), **kwargs
+        )
+        for builder in builders
+    ]
+    vector_envs.reset(seed=0)
+    for env in envs:
+        env.reset()
+
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        actions = rng.integers(0, len(Action), size=len(builders))
+        obs, rewards, terminated, _, _ = vector_envs.step(actions)
+        for i, env in enumerate(envs):
+            env_obs, reward, env_terminated, env_truncated, _ = env.step(
+                int(actions[i])
+            )
+            if env_terminated or env_truncated:
+                env_obs, _ = env.reset()
+            np.testing.assert_array_equal(obs["grid"][i], env_obs["grid"])
+            np.testing.assert_array_equal(obs["vector"][i], env_obs["vector"])
+            assert rewards[i] == reward and terminated[i] == env_terminated
+    vector_envs.close()
+
+
+def test_async_vector_env_matches_sync_vector_env():
+    builders = [intro.build_level_key_door, intro.build_level_pushable_box] * 2
+    sync_envs = GridAdventureVectorEnv.from_builders(
+        builders, observation_type="tensor"
+    )
+    async_envs = GridAdventureAsyncVectorEnv.from_builders(
+        builders, num_workers=2, observation_type="tensor"
+    )
+    assert async_envs.num_workers == 2
+    sync_obs, _ = sync_envs.reset(seed=0)
+    async_obs, _ = async_envs.reset(seed=0)
+    np.testing.assert_array_equal(sync_obs["grid"], async_obs["grid"])
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        actions = rng.integers(0, len(Action), size=len(builders))
+        async_envs.step_async(actions)
+        sync_obs, sync_rewards, sync_term, _, _ = sync_envs.step(actions)
+        async_obs, async_rewards, async_term, _, _ = async_envs.step_wait(timeout=30)
+        np.testing.assert_array_equal(sync_obs["grid"], async_obs["grid"])
+        np.testing.assert_array_equal(sync_obs["vector"], async_obs["vector"])
+        np.testing.assert_array_equal(sync_rewards, async_rewards)
+        np.testing.assert_array_equal(sync_term, async_term)
+    sync_envs.close()
+    async_envs.close()
+
+
+def test_async_vector_env_rejects_gridstate_observations():
+    with pytest.raises(ValueError):
+        GridAdventureAsyncVectorEnv.from_builders(
+            [intro.build_level_basic_movement], observation_type="gridstate"
+        )
+
+
+def test_async_vector_env_shares_image_observations():
+    builders = [intro.build_level_key_door, intro.build_level_pushable_box]
+    kwargs = {"observation_type": "image", "render_resolution": 64}
+    envs = [
+        GridAdventureEnv(
+            initial_state_fn=grid_state_fn_to_initial_state_fn(builder), **kwargs
+        )
+        for builder in builders
+    ]
+    async_envs = GridAdventureAsyncVectorEnv.from_builders(
+        builders, num_workers=2, **kwargs
+    )
+    async_obs, _ = async_envs.reset(seed=0)
+    for i, env in enumerate(envs):
+        obs, _ = env.reset(seed=i)
+        np.testing.assert_array_equal(async_obs["image"][i], obs["image"])
+    assert len(async_obs["info"]) == len(builders)
+
+    for action in (Action.UP, Action.DOWN, Action.WAIT):
+        index = list(Action).index(action)
+        async_obs, *_ = async_envs.step(np.full(len(builders), index))
+        for i, env in enumerate(envs):
+            obs, *_ = env.step(index)
+            np.testing.assert_array_equal(async_obs["image"][i], obs["image"])
+    for env in envs:
+        env.close()
+    async_envs.close()
+
+
+def test_async_vector_env_survives_a_crashed_worker():
+    envs = GridAdventureAsyncVectorEnv.from_builders(
+        [intro.build_level_basic_movement] * 2,
+        num_workers=2,
+        observation_type="tensor",
+    )
+    envs.reset(seed=0)
+    envs._processes[0].kill()
+    envs._processes[0].join()
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        envs.step(np.zeros(2, dtype=np.int64))
+    # The surviving worker's reply was drained and the step is no longer pending
+    assert not envs._waiting
+    assert not envs._conns[1].poll()
+
+    envs.close()
+    assert not any(process.is_alive() for process in envs._processes)